@@ -1,10 +1,13 @@
 from datetime import datetime, time
 from zoneinfo import ZoneInfo
-from typing import Iterable, List
+from typing import Iterable, List, Optional
 
-from autocalendar.parsing import parse_event_title
-from autocalendar.scheduling import Event, WorkDay, autoschedule
-from autocalendar.scheduling.normalize import DEFAULT_DURATION
+from autocalendar.executors import ExecutorSpec
+from autocalendar.parsing import parse_stream
+from autocalendar.parsing.disk_cache import AnyParseCache
+from autocalendar.parsing.profiling import ParseProfiler
+from autocalendar.scheduling import Event, ScheduledEvent, WorkCalendar, WorkDay, autoschedule
+from autocalendar.scheduling.normalize import DEFAULT_DURATION, DEFAULT_PRIORITY
 from autocalendar.inbox import Inbox
 
 
@@ -14,34 +17,56 @@ def build_schedule(
     now: datetime,
     tz: ZoneInfo,
     inbox: Inbox,
-    work_day: WorkDay,
+    work_day: WorkDay | WorkCalendar,
     language: str = "ru",
+    cache: AnyParseCache | None = None,
+    executor: ExecutorSpec = None,
+    max_workers: Optional[int] = None,
+    profiler: ParseProfiler | None = None,
+    max_scan: int | None = None,
+    engine: str = "python",
+    pack_budget: Optional[float] = None,
+    missed_deadlines: List[ScheduledEvent] | None = None,
 ) -> List[Event]:
-    parsed = [
-        parse_event_title(
-            raw,
-            now=now,
-            tz=tz,
-            language=language,
-        )
-        for raw in raw_inputs
-    ]
+    """
+    raw_inputs — любой итератор строк (список, файл, stdin, генератор).
+    Строки разбираются потоком: задачи без даты и срока уходят в inbox
+    сразу, в памяти копятся только события для планировщика. Задача
+    только со сроком («до пятницы») планируется начиная с сегодня.
+
+    max_scan — ограниченный режим разбора длинных строк (см. parse_event_title).
+    engine, pack_budget — движок и упаковщик планировщика (см. autoschedule).
+    missed_deadlines — сюда дописываются задачи, не успевшие к сроку.
+    """
+    parsed = parse_stream(
+        raw_inputs,
+        now=now,
+        tz=tz,
+        language=language,
+        executor=executor,
+        max_workers=max_workers,
+        cache=cache,
+        profiler=profiler,
+        max_scan=max_scan,
+    )
 
     events: list[Event] = []
 
     for p in parsed:
-        if p.d is None:
+        if p.d is None and p.deadline is None:
             inbox.add(p.title)
             continue
 
         events.append(
             Event(
                 title=p.title,
-                date=p.d,
+                date=p.d or now.date(),
                 time=p.t,
                 duration=p.duration or DEFAULT_DURATION,
-                priority=1,
+                priority=p.priority or DEFAULT_PRIORITY,
+                deadline=p.deadline,
             )
         )
 
-    return autoschedule(events, work_day)
+    return autoschedule(events, work_day, engine=engine, pack_budget=pack_budget,
+                        missed_deadlines=missed_deadlines)
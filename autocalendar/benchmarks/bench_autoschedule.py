@@ -0,0 +1,122 @@
+"""
+Бенчмарк раскладки гибких событий по свободным слотам одного дня.
+
+День — 00:00–23:59, фиксированные события нарезают его на сотни
+коротких окон. На N гибких событиях сравниваются прежний first-fit
+(проход по списку слотов с начала для каждого события) и SlotIndex;
+раскладки обязаны совпасть.
+
+    python -m autocalendar.benchmarks.bench_autoschedule
+    python -m autocalendar.benchmarks.bench_autoschedule --events 1000 100000 --linear-max 0
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from datetime import date, time as time_type
+from typing import List, Optional, Tuple
+
+from autocalendar.scheduling import Event, ScheduledEvent, TimeSlot, WorkDay
+from autocalendar.scheduling.slots import SlotIndex, build_free_slots, can_fit, consume, from_minutes
+from autocalendar.scheduling.sorter import sort_flexible_events
+
+DAY = date(2025, 12, 15)
+WORK_DAY = WorkDay(start=time_type(0, 0), end=time_type(23, 59))
+EVENTS = (10, 100, 1_000, 10_000, 100_000)
+
+# (название, время) размещённых и названия не поместившихся
+Placement = Tuple[List[Tuple[str, time_type]], List[str]]
+
+
+def make_day(n: int, *, seed: int = 0) -> Tuple[List[TimeSlot], List[Event]]:
+    """
+    Свободные слоты дня с окнами по 1–3 минуты между фиксированными
+    событиями и n гибких событий длительностью 1–60 минут.
+    """
+    rnd = random.Random(seed)
+
+    fixed = []
+    minute = rnd.randint(0, 3)
+    while minute < 24 * 60 - 1:
+        fixed.append(ScheduledEvent("fixed", DAY, time_type(minute // 60, minute % 60), 1, 1))
+        minute += 1 + rnd.randint(1, 3)
+
+    flexible = [
+        Event(f"e{i}", DAY, None, rnd.randint(1, 60), rnd.randint(1, 3))
+        for i in range(n)
+    ]
+    return build_free_slots(fixed, WORK_DAY), sort_flexible_events(flexible)
+
+
+def first_fit_linear(free_slots: List[TimeSlot], flexible: List[Event]) -> Placement:
+    # цикл autoschedule до SlotIndex — для сравнения
+    free_slots = list(free_slots)
+    placed, overflow = [], []
+
+    for event in flexible:
+        for i, slot in enumerate(free_slots):
+            if can_fit(slot, event.duration):
+                placed.append((event.title, slot.start))
+                new_slot = consume(slot, event.duration)
+                if new_slot is None:
+                    free_slots.pop(i)
+                else:
+                    free_slots[i] = new_slot
+                break
+        else:
+            overflow.append(event.title)
+
+    return placed, overflow
+
+
+def first_fit_index(free_slots: List[TimeSlot], flexible: List[Event]) -> Placement:
+    index = SlotIndex.from_slots(free_slots)
+    placed, overflow = [], []
+
+    for event in flexible:
+        start = index.place(event.duration)
+        if start is None:
+            overflow.append(event.title)
+        else:
+            placed.append((event.title, from_minutes(start)))
+
+    return placed, overflow
+
+
+def _timed(fn, *args) -> Tuple[float, Placement]:
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--events", type=int, nargs="+", default=list(EVENTS))
+    ap.add_argument("--linear-max", type=int, default=100_000,
+                    help="прежний first-fit только до стольких событий (0 — не запускать)")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args(argv)
+
+    print(f"{'events':>8}{'slots':>7}{'placed':>8}{'linear, ms':>12}{'index, ms':>11}{'speedup':>9}")
+    for n in args.events:
+        free_slots, flexible = make_day(n, seed=args.seed)
+
+        t_index, by_index = _timed(first_fit_index, free_slots, flexible)
+
+        t_linear: Optional[float] = None
+        if n <= args.linear_max:
+            t_linear, by_linear = _timed(first_fit_linear, free_slots, flexible)
+            if by_linear != by_index:
+                print(f"FAIL: placements differ at {n} events")
+                return 1
+
+        linear = f"{t_linear * 1e3:>12.1f}" if t_linear is not None else f"{'-':>12}"
+        speedup = f"{t_linear / t_index:>8.1f}x" if t_linear is not None else f"{'-':>9}"
+        print(f"{n:>8}{len(free_slots):>7}{len(by_index[0]):>8}{linear}{t_index * 1e3:>11.1f}{speedup}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
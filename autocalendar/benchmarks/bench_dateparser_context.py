@@ -0,0 +1,97 @@
+"""
+До/после для кэшированного контекста dateparser.
+
+«До» — вызов search_dates с dict-настройками на каждую строку (как раньше
+делал extract_datetime), «после» — общий _DateparserContext на весь прогон.
+Корпус — строки, которые встроенная грамматика не покрывает и которые
+действительно уходят в dateparser.
+
+    python -m autocalendar.benchmarks.bench_dateparser_context --lines 10000
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import datetime
+from typing import List
+
+from autocalendar.benchmarks import corpus
+from autocalendar.config import DEFAULT_LANGUAGE, USER_TIMEZONE
+from autocalendar.parsing.datetime_extractor import dateparser_context
+
+NOW = datetime(2025, 12, 10, 12, 0, tzinfo=USER_TIMEZONE)
+
+
+def fallback_corpus(n: int, seed: int = 0) -> List[str]:
+    return corpus.texts(corpus.generate(n, mix=corpus.FALLBACK_MIX, seed=seed))
+
+
+def run_before(lines: List[str]):
+    from dateparser.search import search_dates
+
+    out = []
+    for text in lines:
+        settings = {
+            "RELATIVE_BASE": NOW,
+            "TIMEZONE": USER_TIMEZONE.key,
+            "TO_TIMEZONE": USER_TIMEZONE.key,
+            "RETURN_AS_TIMEZONE_AWARE": True,
+            "PREFER_DATES_FROM": "future",
+            "DATE_ORDER": "DMY",
+        }
+        out.append(search_dates(text, languages=[DEFAULT_LANGUAGE], settings=settings))
+    return out
+
+
+def run_after(lines: List[str]):
+    out = []
+    for text in lines:
+        ctx = dateparser_context(DEFAULT_LANGUAGE, USER_TIMEZONE, NOW)
+        out.append(ctx.search(text))
+    return out
+
+
+def _wall_clock(results):
+    # «после» отдаёт время уже локализованным в TIMEZONE без повторной
+    # конвертации, поэтому сравниваем по локальному времени
+    return [
+        [(part, dt.replace(tzinfo=None)) for part, dt in found or []]
+        for found in results
+    ]
+
+
+def _timed(fn, lines):
+    start = time.perf_counter()
+    result = fn(lines)
+    return time.perf_counter() - start, result
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--lines", type=int, default=10_000)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args(argv)
+
+    lines = fallback_corpus(args.lines, args.seed)
+
+    # прогрев: импорт dateparser и загрузка языковых данных не входят в замер
+    run_before(lines[:10])
+    run_after(lines[:10])
+
+    before, res_before = _timed(run_before, lines)
+    after, res_after = _timed(run_after, lines)
+
+    if _wall_clock(res_before) != _wall_clock(res_after):
+        print("FAIL: cached context changes dateparser results")
+        return 1
+
+    n = len(lines)
+    print(f"lines: {n}")
+    print(f"before: {before:.2f} s ({n / before:,.0f} lines/s)")
+    print(f"after:  {after:.2f} s ({n / after:,.0f} lines/s)")
+    print(f"speedup: {before / after:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
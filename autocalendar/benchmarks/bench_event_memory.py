@@ -0,0 +1,173 @@
+"""
+Память на одно событие: прежние dataclass-ы с __dict__ против __slots__.
+
+«До» — копии прежних определений (ParsedEvent с хранимыми d/t, Event,
+ScheduledEvent, TimeSlot, InboxItem без slots), «после» — текущие типы.
+Оба варианта собираются из одних и тех же полей, заранее разобранных из
+корпуса, поэтому строки и datetime общие и в замер не входят: считается
+сам объект плюс то, что он хранит сверх общего (у старого ParsedEvent —
+отдельные date/time).
+
+Отдельно печатается, сколько удерживает parse_event_title целиком
+на строку — это число, которое растёт вместе с размером импорта.
+
+    python -m autocalendar.benchmarks.bench_event_memory --lines 50000
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from typing import Callable, List, Optional, Sequence
+
+from autocalendar.benchmarks.bench_dateparser_context import NOW
+from autocalendar.benchmarks.bench_parse_many import mixed_corpus
+from autocalendar.config import USER_TIMEZONE
+from autocalendar.inbox import InboxItem
+from autocalendar.parsing import MoneyValue, ParsedEvent, parse_event_title
+from autocalendar.scheduling import Event, ScheduledEvent, TimeSlot
+
+
+# --------------------------------------------------
+# прежние определения
+# --------------------------------------------------
+
+@dataclass
+class _LegacyParsedEvent:
+    raw: str
+    title: str
+    dt: Optional[datetime]
+    d: Optional[date]
+    t: Optional[time]
+    price: Optional[MoneyValue]
+    duration: Optional[int]
+    explicit_duration: bool
+    leftovers: str
+
+
+@dataclass(frozen=True)
+class _LegacyEvent:
+    title: str
+    date: date
+    time: time | None
+    duration: int
+    priority: int
+
+
+@dataclass(frozen=True)
+class _LegacyScheduledEvent:
+    title: str
+    date: date
+    time: time
+    duration: int
+    priority: int
+
+
+@dataclass
+class _LegacyTimeSlot:
+    start: time
+    end: time
+
+
+@dataclass(frozen=True)
+class _LegacyInboxItem:
+    title: str
+    created_at: datetime
+
+
+# --------------------------------------------------
+# замер
+# --------------------------------------------------
+
+def bytes_per_object(build: Callable[[], List[object]]) -> float:
+    """
+    Сколько байт на объект удерживает список, который вернул build().
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        objects = build()
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - base
+    finally:
+        tracemalloc.stop()
+
+    return retained / max(len(objects), 1)
+
+
+def _parsed_fields(parsed: Sequence[ParsedEvent]):
+    before = [
+        dict(raw=p.raw, title=p.title, dt=p.dt, d=p.d, t=p.t, price=p.price,
+             duration=p.duration, explicit_duration=p.explicit_duration,
+             leftovers=p.leftovers)
+        for p in parsed
+    ]
+    after = [
+        dict(raw=p.raw, title=p.title, dt=p.dt, price=p.price,
+             duration=p.duration, explicit_duration=p.explicit_duration,
+             leftovers=p.leftovers, explicit_time=p.t is not None)
+        for p in parsed
+    ]
+    return before, after
+
+
+def _event_fields(parsed: Sequence[ParsedEvent]):
+    day = NOW.date()
+    clock = time(10, 0)
+    return [
+        dict(title=p.title, date=p.d or day, time=p.t or clock,
+             duration=p.duration or 30, priority=1)
+        for p in parsed
+    ]
+
+
+def run(lines: List[str]) -> List[tuple[str, float, float]]:
+    parsed = [parse_event_title(raw, now=NOW, tz=USER_TIMEZONE) for raw in lines]
+
+    parsed_before, parsed_after = _parsed_fields(parsed)
+    events = _event_fields(parsed)
+    slots = [dict(start=time(9, 0), end=time(10, 0)) for _ in parsed]
+    inbox = [dict(title=p.title, created_at=NOW) for p in parsed]
+
+    cases = [
+        ("ParsedEvent", _LegacyParsedEvent, ParsedEvent, parsed_before, parsed_after),
+        ("Event", _LegacyEvent, Event, events, events),
+        ("ScheduledEvent", _LegacyScheduledEvent, ScheduledEvent, events, events),
+        ("TimeSlot", _LegacyTimeSlot, TimeSlot, slots, slots),
+        ("InboxItem", _LegacyInboxItem, InboxItem, inbox, inbox),
+    ]
+
+    rows = []
+    for name, old_cls, new_cls, old_fields, new_fields in cases:
+        before = bytes_per_object(lambda: [old_cls(**kw) for kw in old_fields])
+        after = bytes_per_object(lambda: [new_cls(**kw) for kw in new_fields])
+        rows.append((name, before, after))
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--lines", type=int, default=50_000)
+    ap.add_argument("--fallback-share", type=float, default=0.05)
+    args = ap.parse_args(argv)
+
+    lines = mixed_corpus(args.lines, args.fallback_share)
+    parse_event_title(lines[0], now=NOW, tz=USER_TIMEZONE)  # прогрев
+
+    print(f"lines: {len(lines)}")
+    print(f"{'type':<16}{'before, B':>12}{'after, B':>12}{'saved':>8}")
+    for name, before, after in run(lines):
+        print(f"{name:<16}{before:>12.0f}{after:>12.0f}{1 - after / before:>8.0%}")
+
+    end_to_end = bytes_per_object(
+        lambda: [parse_event_title(raw, now=NOW, tz=USER_TIMEZONE) for raw in lines]
+    )
+    print(f"\nparse_event_title retained per line: {end_to_end:.0f} B")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
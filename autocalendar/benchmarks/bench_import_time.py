@@ -0,0 +1,84 @@
+"""
+Бюджет времени импорта для CLI.
+
+Запускает `python -X importtime -c "import <module>"` в отдельном процессе
+несколько раз, берёт лучший результат и падает (exit code 1), если
+кумулятивное время импорта модуля превышает бюджет или если при импорте
+подтянулся dateparser.
+
+    python -m autocalendar.benchmarks.bench_import_time
+    python -m autocalendar.benchmarks.bench_import_time --budget-ms 80
+"""
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from typing import Dict
+
+MODULE = "autocalendar.app.service"
+BUDGET_MS = 100.0
+RUNS = 5
+
+# Модули, которых не должно быть в дереве импорта CLI
+FORBIDDEN = ("dateparser",)
+
+
+def parse_importtime(stderr: str) -> Dict[str, int]:
+    """
+    Разбирает вывод -X importtime в {module: cumulative_us}.
+    """
+    result: Dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            cumulative = int(parts[1])
+        except ValueError:
+            continue  # заголовок таблицы
+        result[parts[2].strip()] = cumulative
+    return result
+
+
+def measure(module: str = MODULE) -> Dict[str, int]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(proc.stderr)
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--module", default=MODULE)
+    ap.add_argument("--budget-ms", type=float, default=BUDGET_MS)
+    ap.add_argument("--runs", type=int, default=RUNS)
+    args = ap.parse_args(argv)
+
+    runs = [measure(args.module) for _ in range(args.runs)]
+    best = min(runs, key=lambda r: r.get(args.module, 0))
+    total_ms = best.get(args.module, 0) / 1000
+
+    print(f"{args.module}: {total_ms:.1f} ms (budget {args.budget_ms:.1f} ms, best of {args.runs})")
+
+    failed = False
+
+    for name in FORBIDDEN:
+        if name in best:
+            print(f"FAIL: {name} is imported eagerly ({best[name] / 1000:.1f} ms)")
+            failed = True
+
+    if total_ms > args.budget_ms:
+        print("FAIL: import time over budget")
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,122 @@
+"""
+Стресс-бенчмарк parse_event_title на длинных строках (1 КБ – 1 МБ).
+
+Для каждого случая строка растёт от 1 КБ до 1 МБ; печатается время
+разбора и стоимость символа. Бенчмарк падает (exit code 1), если на
+самой длинной строке символ стоит дороже, чем --tolerance × самая дешёвая
+стоимость символа этого же случая: при линейном разборе стоимость символа
+не растёт с длиной, при квадратичном — растёт пропорционально ей.
+
+Случаи *_bounded разбираются в ограниченном режиме (max_scan =
+config.PARSE_MAX_SCAN_CHARS); в том числе текст с датой, которую
+разбирает dateparser — по всему мегабайту он работает секундами.
+
+    python -m autocalendar.benchmarks.bench_long_input
+    python -m autocalendar.benchmarks.bench_long_input --sizes 1000 16000 --case digits
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from autocalendar.benchmarks import corpus
+from autocalendar.benchmarks.bench_dateparser_context import NOW
+from autocalendar.config import PARSE_MAX_SCAN_CHARS, USER_TIMEZONE
+from autocalendar.parsing import parse_event_title
+
+SIZES = (1_000, 4_000, 16_000, 64_000, 256_000, 1_000_000)
+TOLERANCE = 3.0
+REPEAT = 3
+
+
+class Case(NamedTuple):
+    make: Callable[[int], str]
+    max_scan: Optional[int]
+
+
+def _repeat(chunk: str) -> Callable[[int], str]:
+    return lambda n: (chunk * (n // len(chunk) + 1))[:n]
+
+
+def _cases(seed: int) -> Dict[str, Case]:
+    # текст «письма» из строк корпуса: все виды сущностей вперемешку
+    body = " ".join(corpus.texts(corpus.generate(2_000, mix=corpus.NATIVE_MIX, seed=seed)))
+    letter = _repeat(body + " ")
+    prose = _repeat("Обсудить план работ на квартал ")
+
+    return {
+        "letter": Case(letter, None),
+        "digits": Case(lambda n: "Задача " + "7" * (n - 7), None),
+        "relative": Case(_repeat("завтра "), None),
+        "money": Case(_repeat("1200р "), None),
+        "prose": Case(prose, None),
+        "letter_bounded": Case(letter, PARSE_MAX_SCAN_CHARS),
+        # 13/12 встроенная грамматика не разбирает — дата уходит в dateparser
+        "dateparser_bounded": Case(lambda n: "Встреча 13/12 " + prose(n - 14), PARSE_MAX_SCAN_CHARS),
+    }
+
+
+def measure(text: str, *, max_scan: Optional[int], repeat: int) -> float:
+    """
+    Лучшее из repeat время разбора text, в секундах.
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse_event_title(text, now=NOW, tz=USER_TIMEZONE, max_scan=max_scan)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def is_linear(ns_per_char: List[float], tolerance: float) -> bool:
+    """
+    Стоимость символа на самой длинной строке не выше tolerance × минимум.
+    На коротких строках постоянные накладные расходы завышают стоимость
+    символа, поэтому сравниваем с минимумом, а не с первой точкой.
+    """
+    return ns_per_char[-1] <= tolerance * min(ns_per_char)
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    ap.add_argument("--case", nargs="*", help="только эти случаи (по умолчанию все)")
+    ap.add_argument("--repeat", type=int, default=REPEAT)
+    ap.add_argument("--tolerance", type=float, default=TOLERANCE)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args(argv)
+
+    cases = _cases(args.seed)
+    names = args.case or list(cases)
+    unknown = set(names) - cases.keys()
+    if unknown:
+        ap.error(f"unknown cases: {', '.join(sorted(unknown))}")
+
+    sizes = sorted(args.sizes)
+
+    # прогрев: импорт dateparser и языковые данные не входят в замер
+    parse_event_title("Встреча 13/12", now=NOW, tz=USER_TIMEZONE)
+
+    print(f"{'case':<20}{'chars':>10}{'ms':>12}{'ns/char':>10}")
+    failed = []
+    for name in names:
+        case = cases[name]
+        per_char = []
+        for n in sizes:
+            seconds = measure(case.make(n), max_scan=case.max_scan, repeat=args.repeat)
+            per_char.append(seconds * 1e9 / n)
+            print(f"{name:<20}{n:>10,}{seconds * 1e3:>12.2f}{per_char[-1]:>10.1f}")
+
+        if not is_linear(per_char, args.tolerance):
+            failed.append(name)
+
+    for name in failed:
+        print(f"FAIL: {name} grows faster than linear "
+              f"(x{args.tolerance:g} per-char cost exceeded at {sizes[-1]:,} chars)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,102 @@
+"""
+Бенчмарк упаковщика: autoschedule(pack_budget=...) против жадного first-fit
+по минутам, ушедшим на следующие дни.
+
+Корпус — горизонт в рабочие дни со встречами по получасовой сетке,
+которые режут день на окна, и гибкими задачами по 15–180 минут
+с нагрузкой около load от свободного времени дня. Переполнение —
+минуты гибких задач, которые встали не в свой день; «минуто-дни» —
+те же минуты, умноженные на число дней опоздания.
+
+    python -m autocalendar.benchmarks.bench_packing
+    python -m autocalendar.benchmarks.bench_packing --days 30 --load 1.2 --budget 0.001 0.02
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from datetime import date, time as time_type, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from autocalendar.scheduling import Event, ScheduledEvent, WorkDay, autoschedule
+
+START = date(2025, 1, 6)
+WORK_DAY = WorkDay(start=time_type(9, 0), end=time_type(18, 0))
+DAYS = 120
+LOADS = (0.6, 0.75, 0.9)
+BUDGETS = (0.001, 0.005)
+
+
+def make_corpus(days: int, load: float, *, seed: int = 0) -> List[Event]:
+    rnd = random.Random(seed)
+    events = []
+    for offset in range(days):
+        day = START + timedelta(days=offset)
+
+        busy = 0
+        for i in range(rnd.randint(2, 6)):
+            start = rnd.randrange(9 * 60, 17 * 60, 30)
+            duration = rnd.choice((30, 30, 60, 90))
+            busy += duration
+            events.append(Event(f"m{offset}.{i}", day, time_type(start // 60, start % 60), duration, 1))
+
+        # встречи могут пересекаться — busy лишь оценка сверху
+        budget = load * (WORK_DAY.duration_minutes() - busy)
+        i = 0
+        while budget > 0:
+            duration = rnd.randrange(15, 195, 15)
+            events.append(Event(f"t{offset}.{i}", day, None, duration, rnd.randint(1, 3)))
+            budget -= duration
+            i += 1
+    return events
+
+
+def overflow(events: List[Event], schedule: List[ScheduledEvent]) -> Tuple[int, int, int]:
+    """
+    (минуты не в свой день, минуто-дни опоздания, последний день расписания - START).
+    """
+    own: Dict[str, date] = {e.title: e.date for e in events if e.time is None}
+    minutes = minute_days = 0
+    for item in schedule:
+        if item.title in own and item.date != own[item.title]:
+            minutes += item.duration
+            minute_days += item.duration * (item.date - own[item.title]).days
+    return minutes, minute_days, (max(item.date for item in schedule) - START).days
+
+
+def _timed(events: List[Event], budget: Optional[float]):
+    start = time.perf_counter()
+    result = autoschedule(events, WORK_DAY, pack_budget=budget)
+    return time.perf_counter() - start, result
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--days", type=int, default=DAYS)
+    ap.add_argument("--load", type=float, nargs="+", default=list(LOADS))
+    ap.add_argument("--budget", type=float, nargs="+", default=list(BUDGETS),
+                    help="секунд на день для упаковщика")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args(argv)
+
+    print(f"{'load':>5}{'budget, ms':>12}{'overflow, min':>15}{'saved':>8}"
+          f"{'min-days':>10}{'last day':>10}{'time, ms':>10}")
+    for load in args.load:
+        events = make_corpus(args.days, load, seed=args.seed)
+        seconds, schedule = _timed(events, None)
+        greedy, minute_days, last = overflow(events, schedule)
+        print(f"{load:>5.2f}{'greedy':>12}{greedy:>15}{'':>8}{minute_days:>10}{last:>10}{seconds * 1e3:>10.1f}")
+
+        for budget in args.budget:
+            seconds, schedule = _timed(events, budget)
+            minutes, minute_days, last = overflow(events, schedule)
+            saved = f"{1 - minutes / greedy:.0%}" if greedy else "-"
+            print(f"{load:>5.2f}{budget * 1e3:>12.1f}{minutes:>15}{saved:>8}"
+                  f"{minute_days:>10}{last:>10}{seconds * 1e3:>10.1f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
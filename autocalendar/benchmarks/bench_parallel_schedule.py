@@ -0,0 +1,77 @@
+"""
+Бенчмарк параллельного планирования по неделям: autoschedule(executor=...)
+против последовательного на горизонте в 12 месяцев и 100 000 событий.
+
+На день — около 270 событий: девять десятых — короткие фиксированные
+по всем суткам (импортированный календарь), остальное — гибкие задачи.
+Рабочий день заполнен почти целиком, так что часть недель получает
+перенос и перепланируется при сшивке. Результаты обязаны совпасть.
+
+    python -m autocalendar.benchmarks.bench_parallel_schedule
+    python -m autocalendar.benchmarks.bench_parallel_schedule --events 20000 --executor process --workers 4
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import time
+from datetime import date, time as time_type, timedelta
+from typing import List, Optional
+
+from autocalendar.scheduling import Event, WorkDay, autoschedule
+
+START = date(2025, 1, 1)
+WORK_DAY = WorkDay(start=time_type(9, 0), end=time_type(18, 0))
+EVENTS = 100_000
+DAYS = 365
+FIXED_SHARE = 0.9
+
+
+def make_horizon(n: int, days: int, *, seed: int = 0) -> List[Event]:
+    rnd = random.Random(seed)
+    events = []
+    for i in range(n):
+        day = START + timedelta(days=rnd.randrange(days))
+        if rnd.random() < FIXED_SHARE:
+            start = rnd.randrange(24 * 60)
+            events.append(Event(f"f{i}", day, time_type(start // 60, start % 60), rnd.randint(1, 5), 1))
+        else:
+            events.append(Event(f"e{i}", day, None, rnd.randint(3, 10), rnd.randint(1, 3)))
+    return events
+
+
+def _timed(events: List[Event], executor: Optional[str], workers: Optional[int]):
+    start = time.perf_counter()
+    result = autoschedule(events, WORK_DAY, executor=executor, max_workers=workers)
+    return time.perf_counter() - start, result
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--events", type=int, default=EVENTS)
+    ap.add_argument("--days", type=int, default=DAYS)
+    ap.add_argument("--executor", nargs="+", default=["thread", "process"],
+                    choices=["thread", "process"])
+    ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args(argv)
+
+    events = make_horizon(args.events, args.days, seed=args.seed)
+    print(f"{args.events:,} events over {args.days} days, {os.cpu_count()} CPU")
+
+    t_seq, expected = _timed(events, None, None)
+    print(f"{'sequential':<12}{t_seq * 1e3:>10.1f} ms")
+
+    for executor in args.executor:
+        seconds, result = _timed(events, executor, args.workers)
+        if result != expected:
+            print(f"FAIL: {executor} differs from the sequential schedule")
+            return 1
+        print(f"{executor:<12}{seconds * 1e3:>10.1f} ms{t_seq / seconds:>8.2f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,66 @@
+"""
+Масштабирование parse_many по числу воркеров.
+
+Гоняет один и тот же корпус последовательно и через пулы потоков/процессов
+на 1/2/4/8 воркерах и печатает строки в секунду и ускорение относительно
+последовательного прогона. Доля строк, уходящих в dateparser (CPU-bound),
+задаётся --fallback-share.
+
+    python -m autocalendar.benchmarks.bench_parse_many --lines 20000
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import time
+from typing import List
+
+from autocalendar.benchmarks import corpus
+from autocalendar.benchmarks.bench_dateparser_context import NOW
+from autocalendar.config import USER_TIMEZONE
+from autocalendar.parsing import parse_many
+
+
+def mixed_corpus(n: int, fallback_share: float, seed: int = 0) -> List[str]:
+    rnd = random.Random(seed)
+    n_fallback = int(n * fallback_share)
+    lines = corpus.texts(corpus.generate(n_fallback, mix=corpus.FALLBACK_MIX, seed=seed))
+    lines += corpus.texts(corpus.generate(n - n_fallback, mix=corpus.NATIVE_MIX, seed=seed))
+    rnd.shuffle(lines)
+    return lines
+
+
+def _rate(lines: List[str], **kwargs) -> float:
+    start = time.perf_counter()
+    parse_many(lines, now=NOW, tz=USER_TIMEZONE, **kwargs)
+    return len(lines) / (time.perf_counter() - start)
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--lines", type=int, default=20_000)
+    ap.add_argument("--fallback-share", type=float, default=0.2)
+    ap.add_argument("--chunk-size", type=int, default=256)
+    ap.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = ap.parse_args(argv)
+
+    lines = mixed_corpus(args.lines, args.fallback_share)
+
+    _rate(lines[:50])  # прогрев dateparser в родительском процессе
+    serial = _rate(lines)
+
+    print(f"lines: {len(lines)}, fallback share: {args.fallback_share:.0%}, cpus: {os.cpu_count()}")
+    print(f"{'executor':<10}{'workers':>8}{'lines/s':>12}{'speedup':>10}")
+    print(f"{'serial':<10}{1:>8}{serial:>12,.0f}{1.0:>10.2f}")
+
+    for executor in ("thread", "process"):
+        for workers in args.workers:
+            rate = _rate(lines, executor=executor, max_workers=workers, chunk_size=args.chunk_size)
+            print(f"{executor:<10}{workers:>8}{rate:>12,.0f}{rate / serial:>10.2f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,185 @@
+"""
+Бенчмарк parse_event_title по классам входных строк.
+
+Корпус — corpus.generate (или полный перебор сочетаний с --exhaustive).
+Каждая строка замеряется отдельно; печатаются строки в секунду и
+задержки p50/p99 по классам (corpus.CLASSES) и в целом, а также сколько
+работы лексера на корпусе отсёк префильтр. С --out результат сохраняется
+в JSON, с --baseline — сравнивается с прошлым.
+
+    python -m autocalendar.benchmarks.bench_parser --lines 20000 --out run.json
+    python -m autocalendar.benchmarks.bench_parser --mix fallback=0 money=0.5 --baseline run.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import time
+from datetime import datetime, timezone
+from typing import Dict, List
+
+from autocalendar.benchmarks import corpus
+from autocalendar.benchmarks.bench_dateparser_context import NOW
+from autocalendar.config import USER_TIMEZONE
+from autocalendar.parsing import parse_event_title
+from autocalendar.parsing.lexer import ALTERNATIVES, features
+from autocalendar.parsing.normalize import normalize_text
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """
+    Перцентиль методом ближайшего ранга; sorted_values уже отсортирован.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(int(q / 100 * len(sorted_values) + 0.5), 1)
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def _summary(latencies_ns: List[int]) -> Dict[str, float]:
+    values = sorted(latencies_ns)
+    total = sum(values)
+    return {
+        "lines": len(values),
+        "lines_per_sec": len(values) / (total / 1e9) if total else 0.0,
+        "p50_us": percentile(values, 50) / 1e3,
+        "p99_us": percentile(values, 99) / 1e3,
+    }
+
+
+def run(lines: List[corpus.CorpusLine], *, repeat: int = 1) -> Dict[str, object]:
+    """
+    Замеряет каждую строку repeat раз; для строки берётся лучший замер.
+    """
+    by_class: Dict[str, List[int]] = {kind: [] for kind in corpus.CLASSES}
+    clock = time.perf_counter_ns
+
+    for line in lines:
+        best = None
+        for _ in range(repeat):
+            start = clock()
+            parse_event_title(line.text, now=NOW, tz=USER_TIMEZONE)
+            elapsed = clock() - start
+            best = elapsed if best is None else min(best, elapsed)
+        by_class[line.kind].append(best)
+
+    everything = [ns for values in by_class.values() for ns in values]
+    return {
+        "overall": _summary(everything),
+        "classes": {
+            kind: _summary(values)
+            for kind, values in by_class.items()
+            if values
+        },
+    }
+
+
+def prefilter_summary(lines: List[corpus.CorpusLine]) -> Dict[str, float]:
+    """
+    Сколько работы лексера отсекает префильтр (lexer.features): доля строк,
+    которые лексер не читает вовсе, и доля альтернатив, которые не пробуются.
+    """
+    skipped_lines = 0
+    skipped = 0
+    for line in lines:
+        mask = features(normalize_text(line.text))
+        skipped_lines += not mask
+        skipped += sum(mask & need != need for _, need, _ in ALTERNATIVES)
+
+    total = max(len(lines), 1)
+    return {
+        "lines_skipped": skipped_lines / total,
+        "alternatives_skipped": skipped / (total * len(ALTERNATIVES)),
+    }
+
+
+def _parse_mix(items: List[str]) -> Dict[str, float]:
+    mix = {}
+    for item in items:
+        kind, sep, value = item.partition("=")
+        if not sep:
+            raise argparse.ArgumentTypeError(f"expected kind=probability, got {item!r}")
+        mix[kind] = float(value)
+    return mix
+
+
+def _print(result: Dict[str, object], baseline: Dict[str, object] | None) -> None:
+    header = f"{'class':<10}{'lines':>8}{'lines/s':>12}{'p50, us':>10}{'p99, us':>10}"
+    if baseline is not None:
+        header += f"{'vs base':>10}"
+    print(header)
+
+    base_classes = baseline["classes"] if baseline is not None else {}
+    rows = list(result["classes"].items()) + [("overall", result["overall"])]
+    for name, s in rows:
+        line = (
+            f"{name:<10}{s['lines']:>8}{s['lines_per_sec']:>12,.0f}"
+            f"{s['p50_us']:>10.1f}{s['p99_us']:>10.1f}"
+        )
+        base = baseline["overall"] if name == "overall" and baseline else base_classes.get(name)
+        if base:
+            line += f"{s['lines_per_sec'] / base['lines_per_sec']:>9.2f}x"
+        print(line)
+
+    pre = result["prefilter"]
+    print(
+        f"\nprefilter: lexer skipped on {pre['lines_skipped']:.1%} of lines, "
+        f"{pre['alternatives_skipped']:.1%} of lexer alternatives not tried"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--lines", type=int, default=20_000)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--mix", nargs="*", default=[], metavar="KIND=P",
+                    help=f"вероятности сущностей, по умолчанию {corpus.DEFAULT_MIX}")
+    ap.add_argument("--exhaustive", action="store_true",
+                    help="все сочетания сущностей вместо случайной выборки")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--out", help="сохранить результат в JSON")
+    ap.add_argument("--baseline", help="JSON прошлого прогона для сравнения")
+    args = ap.parse_args(argv)
+
+    mix = corpus.validate_mix(_parse_mix(args.mix))
+    if args.exhaustive:
+        lines = corpus.combinations(seed=args.seed)
+    else:
+        lines = corpus.generate(args.lines, mix=mix, seed=args.seed)
+
+    # прогрев: импорт dateparser и языковые данные не входят в замер
+    for line in lines[:50]:
+        parse_event_title(line.text, now=NOW, tz=USER_TIMEZONE)
+
+    result = {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {
+            "lines": len(lines),
+            "seed": args.seed,
+            "mix": None if args.exhaustive else mix,
+            "exhaustive": args.exhaustive,
+            "repeat": args.repeat,
+        },
+        **run(lines, repeat=args.repeat),
+        "prefilter": prefilter_summary(lines),
+    }
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    _print(result, baseline)
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"\nsaved: {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,67 @@
+"""
+reanchor против повторного разбора после смены now (например, после полуночи).
+
+Корпус разбирается относительно NOW, затем каждая строка переводится на
+следующий день: через reanchor и через parse_event_title с новым now.
+Результаты сверяются.
+
+    python -m autocalendar.benchmarks.bench_reanchor --lines 20000
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import timedelta
+
+from autocalendar.benchmarks import corpus
+from autocalendar.benchmarks.bench_dateparser_context import NOW
+from autocalendar.config import USER_TIMEZONE
+from autocalendar.parsing import parse_event_title, reanchor
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--lines", type=int, default=20_000)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args(argv)
+
+    lines = corpus.texts(corpus.generate(args.lines, seed=args.seed))
+    parsed = [parse_event_title(raw, now=NOW, tz=USER_TIMEZONE) for raw in lines]
+    tomorrow = NOW + timedelta(days=1)
+
+    start = time.perf_counter()
+    reparsed = [parse_event_title(raw, now=tomorrow, tz=USER_TIMEZONE) for raw in lines]
+    t_parse = time.perf_counter() - start
+
+    start = time.perf_counter()
+    moved = [reanchor(p, tomorrow) for p in parsed]
+    t_reanchor = time.perf_counter() - start
+
+    if moved != reparsed:
+        print("FAIL: reanchor differs from a fresh parse")
+        return 1
+
+    # строки с правилом даты — чистый пересчёт, без текста
+    ruled = [p for p in parsed if p.date_rule is not None]
+    start = time.perf_counter()
+    for p in ruled:
+        reanchor(p, tomorrow)
+    t_ruled = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for p in ruled:
+        parse_event_title(p.raw, now=tomorrow, tz=USER_TIMEZONE)
+    t_ruled_parse = time.perf_counter() - start
+
+    n = len(lines)
+    print(f"lines: {n} (with date_rule: {len(ruled)}, re-parsed: {sum(p.dt is not None for p in parsed) - len(ruled)})")
+    print(f"re-parse:          {t_parse / n * 1e6:8.1f} us/line")
+    print(f"reanchor:          {t_reanchor / n * 1e6:8.1f} us/line ({t_parse / t_reanchor:.1f}x)")
+    k = max(len(ruled), 1)
+    print(f"same lines, parse: {t_ruled_parse / k * 1e6:8.1f} us/line")
+    print(f"same lines, rule:  {t_ruled / k * 1e6:8.1f} us/line ({t_ruled_parse / t_ruled:.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
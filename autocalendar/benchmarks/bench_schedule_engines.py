@@ -0,0 +1,91 @@
+"""
+Бенчмарк движков autoschedule: "python" против "numpy" на горизонте в год.
+
+Каждый день горизонта — per_day фиксированных событий по всем суткам
+и пара коротких гибких; плотность фиксированных событий растёт от
+пары до сотен в день. Результаты движков обязаны совпасть; по таблице
+видно, с какой плотности numpy окупает свои накладные расходы.
+
+    python -m autocalendar.benchmarks.bench_schedule_engines
+    python -m autocalendar.benchmarks.bench_schedule_engines --days 90 --per-day 8 512
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import random
+import time
+from datetime import date, time as time_type, timedelta
+from typing import List
+
+from autocalendar.scheduling import Event, WorkDay, autoschedule
+
+START = date(2025, 1, 1)
+WORK_DAY = WorkDay(start=time_type(9, 0), end=time_type(18, 0))
+PER_DAY = (2, 8, 32, 128, 512)
+DAYS = 365
+FLEXIBLE_PER_DAY = 2
+REPEAT = 3
+
+
+def make_horizon(per_day: int, days: int, *, seed: int = 0) -> List[Event]:
+    """
+    per_day фиксированных событий по 5–25 минут в случайное время суток
+    и FLEXIBLE_PER_DAY гибких по 5–25 минут на каждый из days дней.
+    """
+    rnd = random.Random(seed)
+    events = []
+    for offset in range(days):
+        day = START + timedelta(days=offset)
+        for i in range(per_day):
+            start = rnd.randrange(0, 24 * 60, 5)
+            events.append(Event(f"f{offset}.{i}", day, time_type(start // 60, start % 60),
+                                rnd.randrange(5, 30, 5), 1))
+        for i in range(FLEXIBLE_PER_DAY):
+            events.append(Event(f"e{offset}.{i}", day, None, rnd.randrange(5, 30, 5), rnd.randint(1, 3)))
+    return events
+
+
+def measure(events: List[Event], engine: str, repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        autoschedule(events, WORK_DAY, engine=engine)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--per-day", type=int, nargs="+", default=list(PER_DAY),
+                    help="фиксированных событий в день")
+    ap.add_argument("--days", type=int, default=DAYS)
+    ap.add_argument("--repeat", type=int, default=REPEAT)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args(argv)
+
+    if importlib.util.find_spec("numpy") is None:
+        print("numpy is not installed: pip install numpy")
+        return 1
+
+    # прогрев: импорт numpy не входит в замер
+    autoschedule(make_horizon(1, 1), WORK_DAY, engine="numpy")
+
+    print(f"{'per day':>8}{'events':>9}{'python, ms':>12}{'numpy, ms':>11}{'speedup':>9}")
+    for per_day in args.per_day:
+        events = make_horizon(per_day, args.days, seed=args.seed)
+        if autoschedule(events, WORK_DAY, engine="numpy") != autoschedule(events, WORK_DAY):
+            print(f"FAIL: engines disagree at {per_day} fixed events per day")
+            return 1
+
+        t_python = measure(events, "python", args.repeat)
+        t_numpy = measure(events, "numpy", args.repeat)
+        print(f"{per_day:>8}{len(events):>9}{t_python * 1e3:>12.1f}{t_numpy * 1e3:>11.1f}"
+              f"{t_python / t_numpy:>8.2f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
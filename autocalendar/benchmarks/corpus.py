@@ -0,0 +1,244 @@
+"""
+Синтетический корпус русских строк-задач для бенчмарков парсера.
+
+Строка = заголовок + случайный набор сущностей в случайном порядке:
+дата (относительная / DD.MM / d/m для dateparser), время или диапазон,
+длительность, деньги. Какие сущности попадают в строку, задаёт mix —
+вероятности по группам; одинаковый seed даёт одинаковый корпус.
+
+У каждой строки есть класс — самая «тяжёлая» сущность в ней (см. CLASSES),
+по нему бенчмарки считают задержки отдельно.
+"""
+from __future__ import annotations
+
+import itertools
+import random
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional
+
+# Классы в порядке приоритета: строка «Врач завтра 10:00 30 мин» — relative
+CLASSES = ("fallback", "relative", "ddmm", "range", "time", "duration", "money", "plain")
+
+# Взаимоисключающие группы: в строке не больше одной даты и одного времени
+DATE_KINDS = ("relative", "ddmm", "fallback")
+TIME_KINDS = ("time", "range")
+
+DEFAULT_MIX: Dict[str, float] = {
+    "relative": 0.35,
+    "ddmm": 0.10,
+    "fallback": 0.05,
+    "time": 0.30,
+    "range": 0.10,
+    "duration": 0.30,
+    "money": 0.10,
+}
+
+# Без строк, уходящих в dateparser
+NATIVE_MIX: Dict[str, float] = {**DEFAULT_MIX, "fallback": 0.0}
+
+# Только dateparser: «Встреча 13/12», у трети строк со временем
+FALLBACK_MIX: Dict[str, float] = {
+    "relative": 0.0,
+    "ddmm": 0.0,
+    "fallback": 1.0,
+    "time": 0.3,
+    "range": 0.0,
+    "duration": 0.0,
+    "money": 0.0,
+}
+
+TITLES = (
+    "Встреча",
+    "Отчёт",
+    "Созвон с командой",
+    "Сдать проект",
+    "Врач",
+    "Спортзал",
+    "Купить хлеб и молоко",
+    "Позвонить маме",
+    "Кино",
+    "Стрижка",
+    "Ревью кода",
+    "Оплатить интернет",
+    "Написать письмо заказчику",
+    "Забрать посылку",
+    "Планёрка",
+    "Прогулка с собакой",
+)
+
+_RELATIVE_WORDS = (
+    "сегодня",
+    "завтра",
+    "послезавтра",
+    "в понедельник",
+    "во вторник",
+    "в среду",
+    "в пятницу",
+    "в следующую субботу",
+    "на следующей неделе",
+)
+
+_MONTHS_GENITIVE = (
+    "января", "февраля", "марта", "апреля", "мая", "июня",
+    "июля", "августа", "сентября", "октября", "ноября", "декабря",
+)
+
+_CURRENCIES = ("р", "₽", " руб", "€", " eur", " usd")
+
+
+@dataclass(frozen=True)
+class CorpusLine:
+    text: str
+    kind: str
+
+
+# --------------------------------------------------
+# генераторы сущностей
+# --------------------------------------------------
+
+def _relative(rnd: random.Random) -> str:
+    roll = rnd.random()
+    if roll < 0.6:
+        return rnd.choice(_RELATIVE_WORDS)
+    if roll < 0.8:
+        n = rnd.randint(2, 4)
+        return f"через {n} дня" if rnd.random() < 0.5 else f"через {n} недели"
+    return f"{rnd.randint(1, 28)} {rnd.choice(_MONTHS_GENITIVE)}"
+
+
+def _ddmm(rnd: random.Random) -> str:
+    return f"{rnd.randint(1, 28):02d}.{rnd.randint(1, 12):02d}"
+
+
+def _fallback(rnd: random.Random) -> str:
+    return f"{rnd.randint(1, 28)}/{rnd.randint(1, 12)}"
+
+
+def _time(rnd: random.Random) -> str:
+    return f"{rnd.randint(8, 20)}:{rnd.choice(['00', '15', '30', '45'])}"
+
+
+def _range(rnd: random.Random) -> str:
+    start = rnd.randint(8, 18)
+    end = start + rnd.randint(1, 3)
+    sep = rnd.choice(["-", " - ", "–"])
+    return f"{start}:00{sep}{end}:{rnd.choice(['00', '30'])}"
+
+
+def _duration(rnd: random.Random) -> str:
+    if rnd.random() < 0.6:
+        return f"{rnd.choice([10, 15, 20, 30, 45, 90])} мин"
+    return rnd.choice(["1 час", "2 часа", "1.5 часа", "3 ч"])
+
+
+def _money(rnd: random.Random) -> str:
+    return f"{rnd.choice([15, 20, 300, 500, 1200, 2500])}{rnd.choice(_CURRENCIES)}"
+
+
+_MAKERS = {
+    "relative": _relative,
+    "ddmm": _ddmm,
+    "fallback": _fallback,
+    "time": _time,
+    "range": _range,
+    "duration": _duration,
+    "money": _money,
+}
+
+
+# --------------------------------------------------
+# корпус
+# --------------------------------------------------
+
+def classify(kinds) -> str:
+    """
+    Класс строки по набору сущностей в ней.
+    """
+    for kind in CLASSES:
+        if kind in kinds:
+            return kind
+    return "plain"
+
+
+def _pick(rnd: random.Random, mix: Mapping[str, float], group) -> Optional[str]:
+    roll = rnd.random()
+    for kind in group:
+        roll -= mix.get(kind, 0.0)
+        if roll < 0:
+            return kind
+    return None
+
+
+def validate_mix(mix: Mapping[str, float]) -> Dict[str, float]:
+    """
+    Дополняет mix значениями по умолчанию и проверяет вероятности.
+    """
+    unknown = set(mix) - set(DEFAULT_MIX)
+    if unknown:
+        raise ValueError(f"Unknown corpus kinds: {sorted(unknown)}")
+
+    full = {**DEFAULT_MIX, **mix}
+    if any(not 0.0 <= p <= 1.0 for p in full.values()):
+        raise ValueError("mix probabilities must be within [0, 1]")
+    for group in (DATE_KINDS, TIME_KINDS):
+        if sum(full[k] for k in group) > 1.0 + 1e-9:
+            raise ValueError(f"mix probabilities of {group} must sum to at most 1")
+    return full
+
+
+def generate(
+    n: int,
+    *,
+    mix: Mapping[str, float] | None = None,
+    seed: int = 0,
+) -> List[CorpusLine]:
+    """
+    n случайных строк. mix — вероятности сущностей (недостающие берутся
+    из DEFAULT_MIX); внутри групп DATE_KINDS и TIME_KINDS вероятности
+    складываются, остаток — строки без даты / без времени.
+    """
+    full = validate_mix(mix or {})
+    rnd = random.Random(seed)
+
+    out = []
+    for _ in range(n):
+        kinds = [
+            _pick(rnd, full, DATE_KINDS),
+            _pick(rnd, full, TIME_KINDS),
+            "duration" if rnd.random() < full["duration"] else None,
+            "money" if rnd.random() < full["money"] else None,
+        ]
+        kinds = [k for k in kinds if k is not None]
+        out.append(_line(rnd, kinds))
+    return out
+
+
+def combinations(*, seed: int = 0) -> List[CorpusLine]:
+    """
+    Все сочетания групп сущностей (нет / каждый вид), по одной строке на
+    сочетание и заголовок: полный перебор для покрытия, а не для пропорций.
+    """
+    rnd = random.Random(seed)
+
+    out = []
+    for date_kind, time_kind, duration, money in itertools.product(
+        (None, *DATE_KINDS),
+        (None, *TIME_KINDS),
+        (None, "duration"),
+        (None, "money"),
+    ):
+        kinds = [k for k in (date_kind, time_kind, duration, money) if k is not None]
+        for title in TITLES:
+            out.append(_line(rnd, kinds, title=title))
+    return out
+
+
+def texts(corpus: List[CorpusLine]) -> List[str]:
+    return [line.text for line in corpus]
+
+
+def _line(rnd: random.Random, kinds: List[str], title: str | None = None) -> CorpusLine:
+    parts = [_MAKERS[kind](rnd) for kind in kinds]
+    rnd.shuffle(parts)
+    text = " ".join([title or rnd.choice(TITLES), *parts])
+    return CorpusLine(text=text, kind=classify(kinds))
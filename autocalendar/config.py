@@ -1,4 +1,16 @@
 from zoneinfo import ZoneInfo
 
 USER_TIMEZONE = ZoneInfo("Europe/Moscow")
-DEFAULT_LANGUAGE = "ru"
\ No newline at end of file
+DEFAULT_LANGUAGE = "ru"
+
+# Максимальное число строк в LRU-кэше парсера (ParseCache)
+PARSE_CACHE_SIZE = 4096
+
+# Дисковый кэш парсера (DiskParseCache): максимум записей и срок жизни
+# записи без обращений
+DISK_CACHE_SIZE = 200_000
+DISK_CACHE_MAX_AGE_DAYS = 30
+
+# Окно разбора длинных строк (ограниченный режим parse_event_title):
+# сущности ищутся только в первых стольких символах
+PARSE_MAX_SCAN_CHARS = 4096
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from concurrent.futures import Executor
+from typing import Optional, Union
+
+# Как распараллелить работу (parse_many, autoschedule):
+#   None       — последовательно
+#   "thread"   — ThreadPoolExecutor(max_workers)
+#   "process"  — ProcessPoolExecutor(max_workers)
+#   Executor   — готовый пул, вызывающий закрывает его сам
+ExecutorSpec = Union[None, str, Executor]
+
+
+def make_pool(executor: str, max_workers: Optional[int]) -> Executor:
+    # пулы импортируем по требованию: concurrent.futures.process тянет
+    # multiprocessing, а это заметная доля времени импорта парсера
+    if executor == "thread":
+        from concurrent.futures import ThreadPoolExecutor
+        return ThreadPoolExecutor(max_workers=max_workers)
+    if executor == "process":
+        from concurrent.futures import ProcessPoolExecutor
+        return ProcessPoolExecutor(max_workers=max_workers)
+    raise ValueError(f"Unknown executor: {executor!r}")
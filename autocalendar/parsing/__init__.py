@@ -1,2 +1,6 @@
-from .parser import parse_event_title
+from .parser import parse_event_title, reanchor
+from .batch import parse_many, parse_stream
+from .cache import ParseCache, CacheStats
+from .disk_cache import DiskParseCache
 from .types import ParsedEvent, MoneyValue
+from .profiling import ParseProfiler, ProfileStats, StageStats
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import Executor
+from dataclasses import replace
+from datetime import datetime
+from functools import partial
+from itertools import islice
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple
+from zoneinfo import ZoneInfo
+
+from autocalendar.executors import ExecutorSpec, make_pool
+from autocalendar.parsing.disk_cache import AnyParseCache
+from autocalendar.parsing.normalize import normalize_text
+from autocalendar.parsing.parser import parse_event_title
+from autocalendar.parsing.profiling import ParseProfiler
+from autocalendar.parsing.types import ParsedEvent
+
+DEFAULT_CHUNK_SIZE = 256
+
+
+def parse_many(
+    lines: Iterable[str],
+    *,
+    now: datetime,
+    tz: ZoneInfo,
+    language: str = "ru",
+    executor: ExecutorSpec = None,
+    max_workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    cache: AnyParseCache | None = None,
+    profiler: ParseProfiler | None = None,
+    max_scan: int | None = None,
+) -> List[ParsedEvent]:
+    """
+    Пакетный parse_event_title с сохранением порядка строк.
+
+    executor:
+        None       — последовательно в текущем потоке
+        "thread"   — ThreadPoolExecutor(max_workers)
+        "process"  — ProcessPoolExecutor(max_workers), для CPU-bound пути через dateparser
+        Executor   — готовый пул вызывающего (он же его и закрывает)
+
+    Кэш проверяется в вызывающем процессе до раздачи работы, поэтому
+    работает с любым executor; одинаковые строки внутри пачки парсятся один раз.
+
+    profiler тоже работает с любым executor: каждый кусок профилируется
+    отдельно, итоги сливаются в profiler вызывающего.
+
+    max_scan — ограниченный режим разбора, см. parse_event_title.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    lines = list(lines)
+
+    if cache is None:
+        return _run(lines, now=now, tz=tz, language=language, executor=executor,
+                    max_workers=max_workers, chunk_size=chunk_size, profiler=profiler,
+                    max_scan=max_scan)
+
+    results: List[Optional[ParsedEvent]] = [None] * len(lines)
+    keys: List[Hashable] = []
+    first_seen: Dict[Hashable, int] = {}
+    pending: List[int] = []
+
+    for i, raw in enumerate(lines):
+        key = cache.key(normalize_text(raw), now=now, tz=tz, language=language, max_scan=max_scan)
+        keys.append(key)
+
+        if key in first_seen:
+            continue
+
+        cached = cache.get(key)
+        if cached is not None:
+            results[i] = replace(cached, raw=raw)
+        else:
+            first_seen[key] = i
+            pending.append(i)
+
+    parsed = _run([lines[i] for i in pending], now=now, tz=tz, language=language, executor=executor,
+                  max_workers=max_workers, chunk_size=chunk_size, profiler=profiler,
+                  max_scan=max_scan)
+
+    for i, p in zip(pending, parsed):
+        cache.put(keys[i], replace(p))
+        results[i] = p
+
+    # повторы внутри пачки: копия первого вхождения со своей raw
+    for i, raw in enumerate(lines):
+        if results[i] is None:
+            results[i] = replace(results[first_seen[keys[i]]], raw=raw)
+
+    return results
+
+
+def parse_stream(
+    lines: Iterable[str],
+    *,
+    now: datetime,
+    tz: ZoneInfo,
+    language: str = "ru",
+    executor: ExecutorSpec = None,
+    max_workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    cache: AnyParseCache | None = None,
+    profiler: ParseProfiler | None = None,
+    max_scan: int | None = None,
+) -> Iterator[ParsedEvent]:
+    """
+    Ленивый parse_many: строки читаются из lines (файл, stdin, генератор)
+    по мере надобности, ParsedEvent отдаются в том же порядке.
+
+    Без executor — строго по одной строке: результат готов сразу после
+    чтения строки. С executor строки читаются окнами по
+    chunk_size * max_workers и разбираются через parse_many на одном пуле;
+    в памяти одновременно не больше одного окна.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    if executor is None:
+        for raw in lines:
+            yield parse_event_title(raw, now=now, tz=tz, language=language,
+                                    cache=cache, profiler=profiler, max_scan=max_scan)
+        return
+
+    workers = max_workers or os.cpu_count() or 1
+    window = chunk_size * workers
+
+    if isinstance(executor, Executor):
+        pool = executor
+    else:
+        pool = make_pool(executor, max_workers)
+
+    try:
+        it = iter(lines)
+        while True:
+            batch = list(islice(it, window))
+            if not batch:
+                return
+            yield from parse_many(batch, now=now, tz=tz, language=language,
+                                  executor=pool, chunk_size=chunk_size, cache=cache,
+                                  profiler=profiler, max_scan=max_scan)
+    finally:
+        if pool is not executor:
+            pool.shutdown()
+
+
+def _parse_chunk(
+    chunk: Sequence[str],
+    *,
+    now: datetime,
+    tz: ZoneInfo,
+    language: str,
+    profile: bool = False,
+    max_scan: int | None = None,
+) -> Tuple[List[ParsedEvent], Optional[ParseProfiler]]:
+    # профайлер свой на кусок: общий счётчик между потоками/процессами не нужен
+    profiler = ParseProfiler() if profile else None
+    parsed = [
+        parse_event_title(raw, now=now, tz=tz, language=language, profiler=profiler,
+                          max_scan=max_scan)
+        for raw in chunk
+    ]
+    return parsed, profiler
+
+
+def _run(
+    lines: List[str],
+    *,
+    now: datetime,
+    tz: ZoneInfo,
+    language: str,
+    executor: ExecutorSpec,
+    max_workers: Optional[int],
+    chunk_size: int,
+    profiler: ParseProfiler | None = None,
+    max_scan: int | None = None,
+) -> List[ParsedEvent]:
+    work = partial(_parse_chunk, now=now, tz=tz, language=language,
+                   profile=profiler is not None, max_scan=max_scan)
+
+    if executor is None or not lines:
+        return _flatten([work(lines)], profiler)
+
+    chunks = [lines[i:i + chunk_size] for i in range(0, len(lines), chunk_size)]
+
+    if isinstance(executor, Executor):
+        return _flatten(executor.map(work, chunks), profiler)
+
+    with make_pool(executor, max_workers) as pool:
+        return _flatten(pool.map(work, chunks), profiler)
+
+
+def _flatten(
+    chunks: Iterable[Tuple[List[ParsedEvent], Optional[ParseProfiler]]],
+    profiler: ParseProfiler | None = None,
+) -> List[ParsedEvent]:
+    out: List[ParsedEvent] = []
+    for parsed, chunk_profiler in chunks:
+        out.extend(parsed)
+        if profiler is not None:
+            profiler.merge(chunk_profiler)
+    return out
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Hashable, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from autocalendar.config import PARSE_CACHE_SIZE
+from autocalendar.parsing.datetime_extractor import depends_on_time_of_day
+from autocalendar.parsing.types import ParsedEvent
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+class ParseCache:
+    """
+    Ограниченный LRU-кэш результатов parse_event_title.
+
+    Ключ — нормализованный текст, язык, таймзона и та часть now,
+    от которой результат действительно зависит: дата, либо минута
+    для строк со временем без даты (они переезжают на завтра, если
+    время уже прошло).
+    """
+
+    def __init__(self, maxsize: int = PARSE_CACHE_SIZE):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+
+        self.maxsize = maxsize
+        self._items: OrderedDict[Hashable, ParsedEvent] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def key(
+        text: str,
+        *,
+        now: datetime,
+        tz: ZoneInfo,
+        language: str,
+        max_scan: int | None = None,
+    ) -> Tuple[Hashable, ...]:
+        anchor: date | datetime
+        if depends_on_time_of_day(text, max_scan=max_scan):
+            anchor = now.replace(second=0, microsecond=0)
+        else:
+            anchor = now.date()
+        if max_scan is None:
+            return text, language, tz.key, anchor
+        # в ограниченном режиме результат зависит и от окна
+        return text, language, tz.key, anchor, max_scan
+
+    def get(self, key: Hashable) -> Optional[ParsedEvent]:
+        parsed = self._items.get(key)
+        if parsed is None:
+            self._misses += 1
+            return None
+
+        self._items.move_to_end(key)
+        self._hits += 1
+        return parsed
+
+    def put(self, key: Hashable, parsed: ParsedEvent) -> None:
+        self._items[key] = parsed
+        self._items.move_to_end(key)
+
+        if len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+            self._evictions += 1
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            size=len(self._items),
+            maxsize=self.maxsize,
+        )
+
+    def clear(self) -> None:
+        self._items.clear()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
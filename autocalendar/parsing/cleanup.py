@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import re
+from typing import Iterable, Sequence, Tuple
+
+from .lexer import RELATIVE, Span, overlaps, remove_regions
 
 _SPACE_RE = re.compile(r"\s+")
 
@@ -15,3 +18,23 @@ def cleanup_title(text: str) -> str:
     s = _RELATIVE_WORDS_RE.sub("", text)
     s = _SPACE_RE.sub(" ", s).strip(" -")
     return s.strip()
+
+
+def build_title(
+    text: str,
+    spans: Sequence[Span],
+    consumed: Iterable[Tuple[int, int]],
+) -> str:
+    """
+    То же, что cleanup_title поверх вырезанных сущностей, но по спанам лексера:
+    заголовок собирается из text за один проход.
+    """
+    consumed = list(consumed)
+    # спаны лексера друг с другом не пересекаются — сверяем только с consumed,
+    # а не с растущим списком (иначе квадратично на длинных текстах)
+    regions = consumed + [
+        (s.start, s.end)
+        for s in spans
+        if s.kind == RELATIVE and s.match.group("rel") and not overlaps(s, consumed)
+    ]
+    return remove_regions(text, regions).strip(" -").strip()
@@ -1,21 +1,130 @@
 from __future__ import annotations
 
 import re
-from datetime import datetime, timedelta
-from typing import Optional, Tuple
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple
 from zoneinfo import ZoneInfo
 
-from dateparser.search import search_dates
+from .lexer import (
+    DATE,
+    DATE_HINT,
+    DEADLINE,
+    DURATION_HOURS,
+    DURATION_MINUTES,
+    MONEY,
+    PRIORITY,
+    RELATIVE,
+    TIME,
+    TIME_RANGE,
+    Span,
+    first,
+    remove_regions,
+    scan_window,
+    tokenize,
+)
+from .relative_dates import DateRule, intern_rule, match_rule, resolve_rule
 
 
-_TIME_RE = re.compile(r"\b([01]?\d|2[0-3]):([0-5]\d)\b")
 _TIME_PATTERN = re.compile(r"\b\d{1,2}:\d{2}\b")
-_DATE_DDMM_RE = re.compile(r"\b(?P<d>[0-3]?\d)\.(?P<m>[01]?\d)\b")
 
-_DATE_HINT_RE = re.compile(
-    r"\b(сегодня|завтра|послезавтра|\d{1,2}[./]\d{1,2})\b",
-    re.IGNORECASE,
-)
+# «завтра в 10:00»: предлог перед временем уходит вместе с ним
+_TIME_PREPOSITION_RE = re.compile(r"(?<!\S)во?\s+$", re.IGNORECASE)
+
+# Спаны, при которых время без даты уже не «сегодня/завтра по часам»
+_DATE_HINT_KINDS = (DATE, DATE_HINT, RELATIVE)
+
+# Эти сущности dateparser-у не показываем: «1.5 часа» или «15€» он
+# охотно принимает за дату, а срок «до пятницы» — не дата события
+_NOT_A_DATE_KINDS = (DURATION_HOURS, DURATION_MINUTES, MONEY, DEADLINE, PRIORITY)
+
+Region = Tuple[int, int]
+
+_CLOCK_RULE = intern_rule(("clock",))
+
+
+class ResolvedDatetime(NamedTuple):
+    dt: Optional[datetime]
+    explicit_time: bool
+    consumed: List[Region]   # регионы text, которые ушли в дату/время
+    branch: str              # какая ветка сработала (см. profiling.DATETIME_BRANCHES)
+    rule: Optional[DateRule]  # как дата получена из now; None — только перепарсить
+                              # (при dt None — DD.MM, которой нет при этом now)
+
+# Сколько раз относительная дата разрешилась встроенной грамматикой,
+# а сколько раз пришлось идти в dateparser.
+_RESOLVER_STATS = {"native": 0, "dateparser": 0}
+
+
+def resolver_stats() -> dict[str, int]:
+    return dict(_RESOLVER_STATS)
+
+
+def reset_resolver_stats() -> None:
+    for key in _RESOLVER_STATS:
+        _RESOLVER_STATS[key] = 0
+
+
+def depends_on_time_of_day(text: str, *, max_scan: int | None = None) -> bool:
+    """
+    Зависит ли результат extract_datetime от времени суток в now, а не только от даты.
+
+    Так бывает только для времени без даты («10:00», «10:00-11:30»):
+    если время уже прошло, событие уезжает на завтра.
+    """
+    spans = tokenize(text, max_scan=max_scan)
+    has_time = first(spans, TIME_RANGE, TIME) is not None
+    return has_time and first(spans, *_DATE_HINT_KINDS) is None
+
+
+class _DateparserContext:
+    """
+    Преднастроенный контекст dateparser для одного (language, tz, base).
+
+    dateparser на каждый вызов с dict-настройками заново собирает и
+    валидирует Settings; здесь объект Settings собирается один раз.
+
+    TO_TIMEZONE не задаётся: он совпадает с TIMEZONE, а на каждый вызов
+    dateparser прогоняет его через все regex таймзон-аббревиатур.
+    Результат и так локализован в TIMEZONE, tzinfo проставляет вызывающий.
+    """
+
+    __slots__ = ("languages", "settings", "search_dates")
+
+    def __init__(self, language: str, tz_key: str, base: datetime):
+        # dateparser тяжёлый на импорт (языковые таблицы, regex) — грузим его
+        # только когда до него действительно дошли
+        from dateparser.conf import settings as default_settings
+        from dateparser.search import search_dates
+
+        mod_settings = {
+            "RELATIVE_BASE": base,
+            "TIMEZONE": tz_key,
+            "RETURN_AS_TIMEZONE_AWARE": True,
+            "PREFER_DATES_FROM": "future",
+            "DATE_ORDER": "DMY",
+        }
+
+        self.languages = [language]
+        self.settings = default_settings.replace(mod_settings=mod_settings, **mod_settings)
+        self.search_dates = search_dates
+
+    def search(self, text: str) -> Optional[List[Tuple[str, Any]]]:
+        return self.search_dates(text, languages=self.languages, settings=self.settings)
+
+
+@lru_cache(maxsize=32)
+def _dateparser_context(language: str, tz_key: str, base: datetime) -> _DateparserContext:
+    return _DateparserContext(language, tz_key, base)
+
+
+def dateparser_context(language: str, tz: ZoneInfo, now: datetime) -> _DateparserContext:
+    """
+    Контекст dateparser, общий для всех строк с одним якорем.
+    Якорь округляется до минуты, поэтому в рамках одного build_schedule
+    (один now) контекст строится один раз.
+    """
+    return _dateparser_context(language, tz.key, now.replace(second=0, microsecond=0))
 
 
 def extract_datetime(
@@ -31,113 +140,95 @@ def extract_datetime(
         cleaned_text: str
         explicit_time: bool
     """
+    if not isinstance(text, str):
+        raise TypeError(f"extract_datetime expected str, got {type(text)}")
 
-    # --------------------------------------------------
-    # 0. TIME RANGE WITHOUT DATE (e.g. "10:00-11:30")
-    # --------------------------------------------------
-    range_match = re.search(r"\b(\d{1,2}:\d{2})\s*[-–]\s*(\d{1,2}:\d{2})\b", text)
-    has_date_hint = _DATE_HINT_RE.search(text)
-
-    if range_match and not has_date_hint:
-        hh = int(range_match.group(1).split(":")[0])
-        mm = int(range_match.group(1).split(":")[1])
-
-        base_date = now.date()
-        if (hh, mm) <= (now.hour, now.minute):
-            base_date += timedelta(days=1)
+    dt, explicit_time, consumed, _, _ = datetime_from_spans(
+        text,
+        tokenize(text),
+        now=now,
+        tz=tz,
+        language=language,
+    )
+    if dt is None:
+        return None, text, False
 
-        dt = datetime(
-            base_date.year,
-            base_date.month,
-            base_date.day,
-            hh,
-            mm,
-            tzinfo=tz,
-        )
+    return dt, remove_regions(text, consumed), explicit_time
 
-        cleaned = text.replace(range_match.group(0), "", 1)
-        cleaned = re.sub(r"\s{2,}", " ", cleaned).strip()
 
-        return dt, cleaned, True
+def datetime_from_spans(
+    text: str,
+    spans: Sequence[Span],
+    *,
+    now: datetime,
+    tz: ZoneInfo,
+    language: str = "ru",
+    max_scan: int | None = None,
+) -> ResolvedDatetime:
+    """
+    То же, что extract_datetime, но по готовым спанам лексера.
+    Кроме результата возвращает ветку разбора и правило даты (для reanchor).
 
-    if not isinstance(text, str):
-        raise TypeError(f"extract_datetime expected str, got {type(text)}")
+    max_scan — то же окно, что у tokenize: dateparser видит только его.
+    """
+    has_date_hint = first(spans, *_DATE_HINT_KINDS) is not None
 
     # --------------------------------------------------
+    # 0. TIME RANGE WITHOUT DATE (e.g. "10:00-11:30")
     # 1. TIME WITHOUT DATE (e.g. "10:00")
     # --------------------------------------------------
-    m_time = _TIME_RE.search(text)
-    has_date_hint = _DATE_HINT_RE.search(text)
-
-    if m_time and not has_date_hint:
-        hh = int(m_time.group(1))
-        mm = int(m_time.group(2))
-
-        base_date = now.date()
-        if (hh, mm) <= (now.hour, now.minute):
-            base_date += timedelta(days=1)
-
-        dt = datetime(
-            base_date.year,
-            base_date.month,
-            base_date.day,
-            hh,
-            mm,
-            tzinfo=tz,
-        )
+    if not has_date_hint:
+        span, clock = _first_clock(spans, prefer_range=True)
+        if clock is None:
+            return ResolvedDatetime(None, False, [], "none", None)
 
-        cleaned = _TIME_RE.sub("", text, count=1)
-        cleaned = re.sub(r"\s{2,}", " ", cleaned).strip()
-
-        return dt, cleaned, True
+        dt = clock_datetime(clock, now, tz)
+        branch = "range" if span.kind == TIME_RANGE else "time"
+        return ResolvedDatetime(dt, True, [(span.start, span.end)], branch, _CLOCK_RULE)
 
     # --------------------------------------------------
     # 2. EXPLICIT DD.MM (optional time)
     # --------------------------------------------------
-    m_date = _DATE_DDMM_RE.search(text)
-    if m_date:
-        day = int(m_date.group("d"))
-        month = int(m_date.group("m"))
-        year = now.year
-        if (month, day) < (now.month, now.day):
-            year += 1
-
-        cleaned = text[:m_date.start()] + text[m_date.end():]
-
-        m_time = _TIME_RE.search(cleaned)
-        if m_time:
-            hh = int(m_time.group(1))
-            mm = int(m_time.group(2))
-            explicit_time = True
-            cleaned = _TIME_RE.sub("", cleaned, count=1)
-        else:
-            hh = 0
-            mm = 0
-            explicit_time = False
-
-        dt = datetime(year, month, day, hh, mm, tzinfo=tz)
-        cleaned = re.sub(r"\s{2,}", " ", cleaned).strip()
+    date_span = first(spans, DATE)
+    if date_span is not None:
+        date_rule = intern_rule(("day_month", int(date_span.match.group("d")), int(date_span.match.group("m"))))
+        day = resolve_rule(date_rule, now.date())
+        if day is not None:
+            return ResolvedDatetime(*_with_time_of_day(day, date_span, spans, tz), "ddmm", date_rule)
 
-        return dt, cleaned, explicit_time
-
-    if not _DATE_HINT_RE.search(text):
-        return None, text, False
+    # --------------------------------------------------
+    # 3. RELATIVE DATES via native grammar (optional time)
+    # --------------------------------------------------
+    rel_span = first(spans, RELATIVE)
+    rule = match_rule(rel_span.match) if rel_span is not None else None
+    if rule is not None:
+        day = resolve_rule(rule, now.date())
+        if day is not None:
+            _RESOLVER_STATS["native"] += 1
+            # если перед этим была дата DD.MM, которой нет в этом году (29.02),
+            # при другом now она может победить — такой результат только перепарсить
+            if date_span is not None:
+                rule = None
+            return ResolvedDatetime(*_with_time_of_day(day, rel_span, spans, tz, text), "relative", rule)
+
+    # DD.MM, которой нет в календаре (31.11, 29.02 не в високосный год):
+    # dateparser-у её не отдаём — он подберёт другую дату, в прошлом.
+    # Даты нет, фрагмент остаётся в заголовке; правило остаётся для reanchor:
+    # при другом now дата может найтись
+    if date_span is not None:
+        return ResolvedDatetime(None, False, [], "ddmm", date_rule)
 
     # --------------------------------------------------
-    # 3. RELATIVE DATES via dateparser (NO TIME TRUST)
+    # 4. EVERYTHING ELSE via dateparser (NO TIME TRUST)
     # --------------------------------------------------
-    settings = {
-        "RELATIVE_BASE": now,
-        "TIMEZONE": tz.key,
-        "TO_TIMEZONE": tz.key,
-        "RETURN_AS_TIMEZONE_AWARE": True,
-        "PREFER_DATES_FROM": "future",
-        "DATE_ORDER": "DMY",
-    }
-
-    found = search_dates(text, languages=[language], settings=settings)
+    _RESOLVER_STATS["dateparser"] += 1
+
+    # search_dates на длинном тексте — самая дорогая часть разбора
+    masked = _mask(text, spans, _NOT_A_DATE_KINDS)[:scan_window(text, max_scan)]
+
+    found = dateparser_context(language, tz, now).search(masked)
     if not found:
-        return None, text, False
+        return ResolvedDatetime(None, False, [], "dateparser", None)
 
     explicit_time = False
     dt: Optional[datetime] = None
@@ -146,7 +237,7 @@ def extract_datetime(
     for text_part, candidate_dt in found:
         if _TIME_PATTERN.search(text_part):
             explicit_time = True
-            dt = candidate_dt
+            dt = candidate_dt.replace(tzinfo=tz)
             matched_text = text_part
             break
 
@@ -161,8 +252,111 @@ def extract_datetime(
             tzinfo=tz,
         )
 
-    cleaned = text.replace(matched_text, "", 1)
-    cleaned = _TIME_RE.sub("", cleaned)
-    cleaned = re.sub(r"\s{2,}", " ", cleaned).strip()
+    consumed: List[Region] = []
+    start = masked.find(matched_text)
+    if start >= 0:
+        consumed.append((start, start + len(matched_text)))
+
+    # время dateparser-у не доверяем: всё, что похоже на время, убираем
+    consumed.extend((s.start, s.end) for s in spans if s.kind in (TIME, TIME_RANGE))
+
+    # как dateparser пришёл к дате, неизвестно — правила нет
+    return ResolvedDatetime(dt, explicit_time, consumed, "dateparser", None)
+
+
+def _mask(text: str, spans: Sequence[Span], kinds: Tuple[str, ...]) -> str:
+    """
+    Заменяет спаны нужных видов пробелами той же длины — позиции в text
+    не съезжают. Один проход: на длинных текстах с множеством спанов
+    посимвольные срезы были бы квадратичными.
+    """
+    parts = []
+    cursor = 0
+    for span in spans:
+        if span.kind in kinds:
+            parts.append(text[cursor:span.start])
+            parts.append(" " * (span.end - span.start))
+            cursor = span.end
+    if not parts:
+        return text
+    parts.append(text[cursor:])
+    return "".join(parts)
+
+
+def clock_datetime(clock: Tuple[int, int], now: datetime, tz: ZoneInfo) -> datetime:
+    """
+    Время без даты: сегодня, а если оно уже наступило — завтра.
+    """
+    hh, mm = clock
+    base_date = now.date()
+    if (hh, mm) <= (now.hour, now.minute):
+        base_date += timedelta(days=1)
+
+    return datetime(base_date.year, base_date.month, base_date.day, hh, mm, tzinfo=tz)
+
+
+def _clock(span: Span) -> Optional[Tuple[int, int]]:
+    if span.kind == TIME:
+        return int(span.match.group("hh")), int(span.match.group("mm"))
 
-    return dt, cleaned, explicit_time
+    hh, mm = map(int, span.match.group("range_start").split(":"))
+    if hh > 23 or mm > 59:
+        return None
+    return hh, mm
+
+
+def _first_clock(
+    spans: Sequence[Span],
+    *,
+    prefer_range: bool = False,
+) -> Tuple[Optional[Span], Optional[Tuple[int, int]]]:
+    """
+    Первое время суток: из диапазона (его начало) или одиночного времени.
+    prefer_range — диапазон выигрывает, даже если одиночное время раньше.
+    """
+    if prefer_range:
+        candidates = (first(spans, TIME_RANGE), first(spans, TIME))
+    else:
+        candidates = (first(spans, TIME_RANGE, TIME), first(spans, TIME))
+
+    for span in candidates:
+        if span is None:
+            continue
+        clock = _clock(span)
+        if clock is not None:
+            return span, clock
+
+    return None, None
+
+
+def _with_time_of_day(
+    day: date,
+    date_span: Span,
+    spans: Sequence[Span],
+    tz: ZoneInfo,
+    text: Optional[str] = None,
+) -> Tuple[datetime, bool, List[Region]]:
+    """
+    text — исходная строка, если вместе со временем нужно убрать
+    и предлог «в/во» перед ним.
+    """
+    consumed = [(date_span.start, date_span.end)]
+
+    # диапазон убираем целиком, длительность по нему считает duration_extractor
+    span, clock = _first_clock(spans)
+    if clock is not None:
+        hh, mm = clock
+        explicit_time = True
+        start = span.start
+        if text is not None:
+            m = _TIME_PREPOSITION_RE.search(text, max(0, start - 4), start)
+            if m is not None:
+                start = m.start()
+        consumed.append((start, span.end))
+    else:
+        hh = 0
+        mm = 0
+        explicit_time = False
+
+    dt = datetime(day.year, day.month, day.day, hh, mm, tzinfo=tz)
+    return dt, explicit_time, consumed
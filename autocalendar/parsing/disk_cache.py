@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Callable, Dict, Hashable, Optional, Set, Union
+from zoneinfo import ZoneInfo
+
+from autocalendar.config import DISK_CACHE_MAX_AGE_DAYS, DISK_CACHE_SIZE
+from autocalendar.parsing.cache import CacheStats, ParseCache
+from autocalendar.parsing.relative_dates import intern_rule
+from autocalendar.parsing.types import MoneyValue, ParsedEvent
+
+# Меняется при изменении формата записи или правил парсинга:
+# записи со старой версией просто перестают находиться и вытесняются
+FORMAT_VERSION = 4
+
+# Сколько записей/обращений копится в памяти до записи в SQLite
+_FLUSH_EVERY = 512
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS parse_cache (
+    key     BLOB PRIMARY KEY,
+    value   TEXT NOT NULL,
+    used_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS parse_cache_used_at ON parse_cache(used_at);
+"""
+
+
+def default_cache_path() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "autocalendar" / "parse_cache.sqlite3"
+
+
+class DiskParseCache:
+    """
+    Кэш parse_event_title в локальном SQLite, переживающий перезапуски:
+    повторный импорт тех же строк не парсит их заново.
+
+    Ключ тот же, что у ParseCache (текст, язык, таймзона, дата или минута
+    якоря), в базе лежит его хэш. Якорь входит в ключ, поэтому при смене
+    даты старые записи не находятся, а уходят по возрасту или по LRU.
+
+    Интерфейс совпадает с ParseCache — подходит для parse_event_title,
+    parse_many/parse_stream и build_schedule. Записи и отметки об
+    использовании пишутся пачками; close() (или выход из with) сбрасывает
+    остаток на диск.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike | None = None,
+        *,
+        maxsize: int = DISK_CACHE_SIZE,
+        max_age_days: float = DISK_CACHE_MAX_AGE_DAYS,
+        clock: Callable[[], float] = time.time,
+    ):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        if max_age_days <= 0:
+            raise ValueError("max_age_days must be positive")
+
+        self.path = Path(path) if path is not None else default_cache_path()
+        self.maxsize = maxsize
+        self.max_age = max_age_days * 86400
+        self._clock = clock
+
+        # sqlite3 грузим только когда дисковый кэш действительно нужен:
+        # импорт autocalendar.parsing держим в бюджете bench_import_time
+        import sqlite3
+
+        if str(self.path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path))
+        self._db.executescript(_SCHEMA)
+
+        self._pending: Dict[bytes, str] = {}
+        self._touched: Set[bytes] = set()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        # то, что устарело с прошлого запуска, выкидываем сразу
+        self.flush()
+
+    key = staticmethod(ParseCache.key)
+
+    def get(self, key: Hashable) -> Optional[ParsedEvent]:
+        digest = _digest(key)
+
+        value = self._pending.get(digest)
+        if value is None:
+            row = self._db.execute(
+                "SELECT value FROM parse_cache WHERE key = ?", (digest,)
+            ).fetchone()
+            value = row[0] if row is not None else None
+
+        if value is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        self._touched.add(digest)
+        self._maybe_flush()
+        # key — кортеж ParseCache.key: (text, language, tz.key, anchor)
+        return _loads(value, tz_key=key[2])
+
+    def put(self, key: Hashable, parsed: ParsedEvent) -> None:
+        self._pending[_digest(key)] = _dumps(parsed)
+        self._maybe_flush()
+
+    def flush(self) -> None:
+        """
+        Пишет накопленное на диск и применяет ограничения по размеру и возрасту.
+        """
+        now = self._clock()
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO parse_cache (key, value, used_at) VALUES (?, ?, ?)",
+                ((k, v, now) for k, v in self._pending.items()),
+            )
+            self._db.executemany(
+                "UPDATE parse_cache SET used_at = ? WHERE key = ?",
+                ((now, k) for k in self._touched - self._pending.keys()),
+            )
+            self._pending.clear()
+            self._touched.clear()
+
+            expired = self._db.execute(
+                "DELETE FROM parse_cache WHERE used_at < ?", (now - self.max_age,)
+            ).rowcount
+
+            overflow = self._size() - self.maxsize
+            if overflow > 0:
+                self._db.execute(
+                    "DELETE FROM parse_cache WHERE key IN "
+                    "(SELECT key FROM parse_cache ORDER BY used_at LIMIT ?)",
+                    (overflow,),
+                )
+            self._evictions += expired + max(overflow, 0)
+
+    def stats(self) -> CacheStats:
+        self.flush()
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            size=self._size(),
+            maxsize=self.maxsize,
+        )
+
+    def clear(self) -> None:
+        self._pending.clear()
+        self._touched.clear()
+        with self._db:
+            self._db.execute("DELETE FROM parse_cache")
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def close(self) -> None:
+        self.flush()
+        self._db.close()
+
+    def __enter__(self) -> DiskParseCache:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        self.flush()
+        return self._size()
+
+    def _size(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM parse_cache").fetchone()[0]
+
+    def _maybe_flush(self) -> None:
+        if len(self._pending) + len(self._touched) >= _FLUSH_EVERY:
+            self.flush()
+
+
+# Любой из кэшей парсера
+AnyParseCache = Union[ParseCache, DiskParseCache]
+
+
+def _digest(key: Hashable) -> bytes:
+    return hashlib.blake2b(repr((FORMAT_VERSION, key)).encode(), digest_size=16).digest()
+
+
+def _dumps(parsed: ParsedEvent) -> str:
+    # raw не храним: при попадании его всё равно подставляет вызывающий;
+    # dt — время по часам таймзоны из ключа
+    return json.dumps(
+        [
+            parsed.title,
+            parsed.dt.replace(tzinfo=None).isoformat() if parsed.dt else None,
+            [str(parsed.price.amount), parsed.price.currency] if parsed.price else None,
+            parsed.duration,
+            parsed.explicit_duration,
+            None if parsed.leftovers == parsed.title else parsed.leftovers,
+            parsed.explicit_time,
+            parsed.date_rule,
+            parsed.priority,
+            parsed.deadline.isoformat() if parsed.deadline else None,
+            parsed.deadline_rule,
+        ],
+        ensure_ascii=False,
+    )
+
+
+def _loads(value: str, *, tz_key: str) -> ParsedEvent:
+    (title, dt, price, duration, explicit_duration, leftovers, explicit_time, rule,
+     priority, deadline, deadline_rule) = json.loads(value)
+    return ParsedEvent(
+        raw="",
+        title=title,
+        dt=datetime.fromisoformat(dt).replace(tzinfo=ZoneInfo(tz_key)) if dt else None,
+        price=MoneyValue(Decimal(price[0]), price[1]) if price else None,
+        duration=duration,
+        explicit_duration=explicit_duration,
+        leftovers=title if leftovers is None else leftovers,
+        explicit_time=explicit_time,
+        date_rule=intern_rule(tuple(rule)) if rule else None,
+        priority=priority,
+        deadline=date.fromisoformat(deadline) if deadline else None,
+        deadline_rule=intern_rule(tuple(deadline_rule)) if deadline_rule else None,
+    )
@@ -1,19 +1,13 @@
-import re
-from typing import Optional, Tuple
+from typing import Iterable, Optional, Sequence, Tuple
 
-
-_TIME_RANGE_RE = re.compile(
-    r'(?P<start>\d{1,2}:\d{2})\s*[-–]\s*(?P<end>\d{1,2}:\d{2})'
-)
-
-_HOURS_RE = re.compile(
-    r'(?P<value>\d+(?:[.,]\d+)?)\s*(?:ч|час|часа|часов)\b',
-    re.IGNORECASE
-)
-
-_MINUTES_RE = re.compile(
-    r'(?P<value>\d+)\s*(?:м|мин|минута|минуты|минут)\b',
-    re.IGNORECASE
+from .lexer import (
+    DURATION_HOURS,
+    DURATION_MINUTES,
+    TIME_RANGE,
+    Span,
+    first,
+    overlaps,
+    tokenize,
 )
 
 
@@ -42,35 +36,78 @@ def extract_duration(
     if not isinstance(text, str):
         raise TypeError(f"extract_duration expected str, got {type(text)}")
 
-    # 1. time range: 10:00-11:30
+    # 1. time range: 10:00-11:30 (ищем в исходной строке — из text его уже могли вырезать)
     if explicit_time and dt:
         source = raw_text if raw_text is not None else text
-        m = _TIME_RANGE_RE.search(source)
-        if m:
-            start = _to_minutes(m.group("start"))
-            end = _to_minutes(m.group("end"))
+        span = first(tokenize(source), TIME_RANGE)
+        if span is not None:
+            duration = _range_minutes(span)
+            if duration is not None:
+                cleaned = text.replace(span.match.group(0), "", 1).strip()
+                return duration, True, cleaned
 
-            if start is not None and end is not None:
-                if end <= start:
-                    end += 24 * 60
+    # 2. hours / 3. minutes
+    duration, explicit, span = duration_from_spans(tokenize(text))
+    if span is None:
+        # 4. nothing found
+        return None, False, text
+
+    cleaned = (text[:span.start] + text[span.end:]).strip()
+    return duration, explicit, cleaned
 
-                duration = end - start
-                cleaned = (text[:m.start()] + text[m.end():]).strip()
-                return duration, True, cleaned
+
+def duration_from_spans(
+    spans: Sequence[Span],
+    *,
+    dt=None,
+    explicit_time: bool = False,
+    consumed: Iterable[Tuple[int, int]] = (),
+) -> Tuple[Optional[int], bool, Optional[Span]]:
+    """
+    То же, что extract_duration, но по готовым спанам лексера.
+    Спаны, пересекающиеся с consumed (уже ушли в дату/время), не используются —
+    кроме диапазона времени, по которому и считается длительность.
+
+    Returns:
+        duration_minutes | None
+        explicit_duration
+        span, из которого взята длительность
+    """
+    consumed = list(consumed)
+
+    # 1. time range: 10:00-11:30
+    if explicit_time and dt:
+        span = first(spans, TIME_RANGE)
+        if span is not None:
+            duration = _range_minutes(span)
+            if duration is not None:
+                return duration, True, span
+
+    free = [s for s in spans if not overlaps(s, consumed)]
 
     # 2. hours
-    m = _HOURS_RE.search(text)
-    if m:
-        value = float(m.group("value").replace(",", "."))
-        cleaned = (text[:m.start()] + text[m.end():]).strip()
-        return int(round(value * 60)), True, cleaned
+    span = first(free, DURATION_HOURS)
+    if span is not None:
+        value = float(span.match.group("hours").replace(",", "."))
+        return int(round(value * 60)), True, span
 
     # 3. minutes
-    m = _MINUTES_RE.search(text)
-    if m:
-        value = int(m.group("value"))
-        cleaned = (text[:m.start()] + text[m.end():]).strip()
-        return value, True, cleaned
+    span = first(free, DURATION_MINUTES)
+    if span is not None:
+        return int(span.match.group("minutes")), True, span
 
     # 4. nothing found
-    return None, False, text
+    return None, False, None
+
+
+def _range_minutes(span: Span) -> Optional[int]:
+    start = _to_minutes(span.match.group("range_start"))
+    end = _to_minutes(span.match.group("range_end"))
+
+    if start is None or end is None:
+        return None
+
+    if end <= start:
+        end += 24 * 60
+
+    return end - start
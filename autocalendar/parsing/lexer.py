@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import re
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .relative_dates import DEADLINE_PATTERN, RELATIVE_DATE_PATTERN, RELATIVE_WORDS
+
+# Виды спанов
+TIME_RANGE = "time_range"        # 10:00-11:30
+TIME = "time"                    # 10:00
+DATE = "date"                    # 13.12
+DATE_HINT = "date_hint"          # 13/12, 45.12 — похоже на дату, разбирает только dateparser
+RELATIVE = "relative"            # завтра, в пятницу, через 2 дня, 15 декабря
+DURATION_HOURS = "duration_hours"
+DURATION_MINUTES = "duration_minutes"
+MONEY = "money"
+DEADLINE = "deadline"            # до пятницы, до 15 декабря
+PRIORITY = "priority"            # !, !!, !!! отдельным словом
+
+# Признаки строки для префильтра (см. features): без цифры не бывает ни
+# времени, ни даты, ни длительности, ни денег; без «:» — времени и
+# диапазона; без слова из грамматики относительных дат — относительной даты;
+# без «до » — срока; без «!» — приоритета.
+#
+# Валюту отдельно не проверяем: поиск «число + валюта» стоит дороже,
+# чем альтернатива денег, которую он позволил бы пропустить.
+HAS_DIGIT = 1
+HAS_COLON = 2
+HAS_RELATIVE_WORD = 4
+HAS_DEADLINE_WORD = 8
+HAS_BANG = 16
+ALL_FEATURES = HAS_DIGIT | HAS_COLON | HAS_RELATIVE_WORD | HAS_DEADLINE_WORD | HAS_BANG
+
+_DIGIT_RE = re.compile(r"\d")
+
+
+def _prefix_pattern(words: Iterable[str]) -> str:
+    # альтернативы, сгруппированные по первой букве: re не строит по ним
+    # дерево сам и пробует каждое слово на каждой позиции
+    groups: Dict[str, List[str]] = {}
+    for word in words:
+        groups.setdefault(word[0], []).append(re.escape(word[1:]))
+    return "|".join(
+        re.escape(head) + (tails[0] if len(tails) == 1 else "(?:" + "|".join(tails) + ")")
+        for head, tails in groups.items()
+    )
+
+
+_RELATIVE_WORD_RE = re.compile(_prefix_pattern(RELATIVE_WORDS))
+
+# Альтернативы лексера: вид спана, нужные ему признаки строки, шаблон.
+# Порядок — приоритет при пересечении:
+# «10:00-11:30» — диапазон, а не время; «1.5 часа» — длительность, а не 1 мая;
+# «13.12 $» — дата, а не деньги (как и раньше, когда дату искали первой);
+# «до 15 декабря» — срок, а не дата события.
+#
+# (?<!\d) перед \d+: число начинаем только с первой цифры. Иначе на длинной
+# серии цифр \d+ перезапускается с каждой позиции и лексер становится
+# квадратичным по длине строки.
+ALTERNATIVES: Tuple[Tuple[str, int, str], ...] = (
+    (DEADLINE, HAS_DEADLINE_WORD,
+     r"(?P<deadline>" + DEADLINE_PATTERN + r")"),
+    (TIME_RANGE, HAS_DIGIT | HAS_COLON,
+     r"(?P<time_range>\b(?P<range_start>\d{1,2}:\d{2})\s*[-–]\s*(?P<range_end>\d{1,2}:\d{2})\b)"),
+    (TIME, HAS_DIGIT | HAS_COLON,
+     r"(?P<time>\b(?P<hh>[01]?\d|2[0-3]):(?P<mm>[0-5]\d)\b)"),
+    (DURATION_HOURS, HAS_DIGIT,
+     r"(?P<duration_hours>(?<!\d)(?P<hours>\d+(?:[.,]\d+)?)\s*(?:ч|час|часа|часов)\b)"),
+    (DURATION_MINUTES, HAS_DIGIT,
+     r"(?P<duration_minutes>(?<!\d)(?P<minutes>\d+)\s*(?:м|мин|минута|минуты|минут)\b)"),
+    (DATE, HAS_DIGIT,
+     r"(?P<date>\b(?P<d>[0-3]?\d)\.(?P<m>[01]?\d)\b)"),
+    (DATE_HINT, HAS_DIGIT,
+     r"(?P<date_hint>\b\d{1,2}[./]\d{1,2}\b)"),
+    (MONEY, HAS_DIGIT,
+     r"(?P<money>(?<!\d)(?P<amount>\d+(?:[.,]\d+)?)\s*(?P<cur>€|\$|₽|р|руб\.?|rur|rub|eur|usd))"),
+    (RELATIVE, HAS_RELATIVE_WORD,
+     r"(?P<relative>" + RELATIVE_DATE_PATTERN + r")"),
+    (PRIORITY, HAS_BANG,
+     r"(?P<priority>(?<!\S)(?P<bangs>!{1,3})(?!\S))"),
+)
+
+# Скомпилированные лексеры по наборам признаков и флагам; собираются по требованию
+_TOKEN_RES: Dict[Tuple[int, int], Optional[re.Pattern]] = {}
+
+
+def features(text: str) -> int:
+    """
+    Префильтр: битовая маска признаков строки (HAS_*), дешёвая по сравнению
+    с лексером. Альтернативы, которым не хватает признаков, в строке
+    заведомо не совпадут — лексер их не пробует, а строку без признаков
+    не читает вовсе. Признаки берутся с запасом: лишний бит стоит только
+    времени, пропущенный — сущности.
+    """
+    lower = text.lower()
+    mask = HAS_RELATIVE_WORD if _RELATIVE_WORD_RE.search(lower) else 0
+    if "до " in lower:
+        mask |= HAS_DEADLINE_WORD
+    if "!" in text:
+        mask |= HAS_BANG
+    if _DIGIT_RE.search(text) is not None:
+        mask |= HAS_DIGIT
+        if ":" in text:
+            mask |= HAS_COLON
+    return mask
+
+
+def token_re(mask: int, flags: int = 0) -> Optional[re.Pattern]:
+    """
+    Лексер только из альтернатив, которым хватает признаков mask;
+    None — ни одна альтернатива совпасть не может.
+
+    Шаблоны в нижнем регистре: без re.IGNORECASE лексер ждёт text.lower().
+    """
+    try:
+        return _TOKEN_RES[mask, flags]
+    except KeyError:
+        pass
+
+    alternatives = [pattern for _, need, pattern in ALTERNATIVES if mask & need == need]
+    compiled = None
+    if alternatives:
+        # Опережающая проверка первого символа: любая сущность начинается с
+        # цифры, с первой буквы слова из RELATIVE_DATE_PATTERN, с «до» срока
+        # или с «!». Без неё все альтернативы пробуются на каждой позиции
+        # строки — в разы медленнее.
+        first = r"\d"
+        if mask & HAS_RELATIVE_WORD:
+            first += "взнпсч"
+        if mask & HAS_DEADLINE_WORD:
+            first += "д"
+        if mask & HAS_BANG:
+            first += "!"
+        compiled = re.compile(rf"(?=[{first}])(?:" + "|".join(alternatives) + ")", flags)
+    _TOKEN_RES[mask, flags] = compiled
+    return compiled
+
+
+_SPACE_RE = re.compile(r"\s{2,}")
+
+# Слоты сущностей для ограниченного режима (max_scan): как только в каждом
+# слоте есть спан, дальше строку не читаем. Слот заполняют только те спаны,
+# которые потом не перебьёт сущность дальше по строке: относительную дату
+# и 13/12 перебивает DD.MM, а диапазон даёт длительность не всегда.
+_DATE_SLOT = 1
+_CLOCK_SLOT = 2
+_DURATION_SLOT = 4
+_MONEY_SLOT = 8
+_ALL_SLOTS = _DATE_SLOT | _CLOCK_SLOT | _DURATION_SLOT | _MONEY_SLOT
+
+_SLOTS = {
+    TIME_RANGE: _CLOCK_SLOT,
+    TIME: _CLOCK_SLOT,
+    DATE: _DATE_SLOT,
+    DATE_HINT: 0,
+    RELATIVE: 0,
+    DURATION_HOURS: _DURATION_SLOT,
+    DURATION_MINUTES: _DURATION_SLOT,
+    MONEY: _MONEY_SLOT,
+    DEADLINE: 0,
+    PRIORITY: 0,
+}
+
+
+class Span(NamedTuple):
+    kind: str
+    start: int
+    end: int
+    match: re.Match
+
+
+def tokenize(
+    text: str,
+    *,
+    max_scan: int | None = None,
+    mask: int | None = None,
+) -> List[Span]:
+    """
+    Один проход по строке: все распознанные сущности в порядке появления.
+    Спаны не пересекаются.
+
+    mask — признаки строки, если вызывающий уже посчитал features(text).
+
+    max_scan — ограниченный режим для длинных текстов (тело письма):
+    читаются только первые max_scan символов (см. scan_window), и чтение
+    прекращается, как только найдены дата DD.MM, время, длительность и
+    деньги. Сущности дальше окна и после заполнения всех слотов не видны.
+    """
+    # регистр снимаем заранее: re.IGNORECASE на кириллице заметно медленнее.
+    # Позиции спанов — в text, поэтому так только пока lower() не меняет длину
+    lower = text.lower()
+    if len(lower) == len(text):
+        source, flags = lower, 0
+    else:
+        source, flags = text, re.IGNORECASE
+
+    pattern = token_re(features(text) if mask is None else mask, flags)
+    if pattern is None:
+        return []
+
+    if max_scan is None:
+        return [
+            Span(m.lastgroup, m.start(), m.end(), m)
+            for m in pattern.finditer(source)
+        ]
+
+    spans = []
+    filled = 0
+    for m in pattern.finditer(source, 0, scan_window(text, max_scan)):
+        kind = m.lastgroup
+        spans.append(Span(kind, m.start(), m.end(), m))
+        filled |= _SLOTS[kind]
+        if filled == _ALL_SLOTS:
+            break
+    return spans
+
+
+def scan_window(text: str, max_scan: int | None) -> int:
+    """
+    Конец окна разбора: max_scan символов, без последнего недочитанного
+    слова — иначе «30 минут» на границе окна превратится в «30 м».
+    """
+    if max_scan is None:
+        return len(text)
+    if max_scan <= 0:
+        raise ValueError("max_scan must be positive")
+    if len(text) <= max_scan:
+        return len(text)
+
+    end = text.rfind(" ", 0, max_scan + 1)
+    return end if end > 0 else max_scan
+
+
+def first(spans: Iterable[Span], *kinds: str) -> Span | None:
+    for span in spans:
+        if span.kind in kinds:
+            return span
+    return None
+
+
+def overlaps(span: Span, regions: Iterable[Tuple[int, int]]) -> bool:
+    return any(span.start < end and start < span.end for start, end in regions)
+
+
+def remove_regions(text: str, regions: Iterable[Tuple[int, int]]) -> str:
+    """
+    Вырезает регионы из text за один проход и схлопывает пробелы.
+    """
+    parts = []
+    cursor = 0
+    for start, end in sorted(regions):
+        if start > cursor:
+            parts.append(text[cursor:start])
+        cursor = max(cursor, end)
+    parts.append(text[cursor:])
+
+    return _SPACE_RE.sub(" ", "".join(parts)).strip()
@@ -1,27 +1,39 @@
 from __future__ import annotations
 
-import re
 from decimal import Decimal
-from typing import Optional, Tuple
+from typing import Iterable, Optional, Sequence, Tuple
 
+from .lexer import MONEY, Span, first, overlaps, tokenize
 from .types import MoneyValue
 
-_MONEY_RE = re.compile(
-    r"(?P<amount>\d+(?:[.,]\d+)?)\s*(?P<cur>€|\$|₽|р|руб\.?|rur|rub|eur|usd)",
-    re.IGNORECASE,
-)
 
 def extract_money(text: str) -> Tuple[Optional[MoneyValue], str]:
     """
     Возвращает (money, cleaned_text).
     Сейчас — простой regex (без “10к”, “10 000”, “от 10€”).
     """
-    m = _MONEY_RE.search(text)
-    if not m:
+    money, span = money_from_spans(tokenize(text))
+    if span is None:
         return None, text
 
-    amount = Decimal(m.group("amount").replace(",", "."))
-    cur_raw = m.group("cur").lower()
+    cleaned = (text[:span.start] + text[span.end:]).strip()
+    return money, cleaned
+
+
+def money_from_spans(
+    spans: Sequence[Span],
+    consumed: Iterable[Tuple[int, int]] = (),
+) -> Tuple[Optional[MoneyValue], Optional[Span]]:
+    """
+    То же, что extract_money, но по готовым спанам лексера.
+    """
+    consumed = list(consumed)
+    span = first((s for s in spans if not overlaps(s, consumed)), MONEY)
+    if span is None:
+        return None, None
+
+    amount = Decimal(span.match.group("amount").replace(",", "."))
+    cur_raw = span.match.group("cur").lower()
 
     currency = (
         "EUR" if cur_raw in {"€", "eur"} else
@@ -29,5 +41,4 @@ def extract_money(text: str) -> Tuple[Optional[MoneyValue], str]:
         "RUB"
     )
 
-    cleaned = (text[:m.start()] + text[m.end():]).strip()
-    return MoneyValue(amount=amount, currency=currency), cleaned
+    return MoneyValue(amount=amount, currency=currency), span
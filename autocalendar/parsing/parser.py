@@ -1,40 +1,213 @@
+from dataclasses import replace
+from datetime import datetime
+
 from autocalendar.parsing.normalize import normalize_text
-from autocalendar.parsing.datetime_extractor import extract_datetime
-from autocalendar.parsing.duration_extractor import extract_duration
-from autocalendar.parsing.money_extractor import extract_money
-from autocalendar.parsing.cleanup import cleanup_title
+from autocalendar.parsing.lexer import features, remove_regions, tokenize
+from autocalendar.parsing.datetime_extractor import clock_datetime, datetime_from_spans
+from autocalendar.parsing.duration_extractor import duration_from_spans
+from autocalendar.parsing.money_extractor import money_from_spans
+from autocalendar.parsing.urgency_extractor import deadline_from_spans, priority_from_spans
+from autocalendar.parsing.cleanup import build_title
+from autocalendar.parsing.disk_cache import AnyParseCache
+from autocalendar.parsing.profiling import ParseProfiler
+from autocalendar.parsing.relative_dates import resolve_rule
 from autocalendar.parsing.types import ParsedEvent
 
 
-def parse_event_title(raw: str, *, now, tz, language="ru") -> ParsedEvent:
-    text = normalize_text(raw)
+def parse_event_title(
+    raw: str,
+    *,
+    now,
+    tz,
+    language="ru",
+    cache: AnyParseCache | None = None,
+    profiler: ParseProfiler | None = None,
+    max_scan: int | None = None,
+) -> ParsedEvent:
+    """
+    profiler — необязательный ParseProfiler: время и число вызовов по
+    стадиям и веткам разбора даты. Без него замеров нет вовсе.
+
+    max_scan — ограниченный режим для длинных текстов: сущности ищутся
+    только в первых max_scan символах, и поиск останавливается, как только
+    найдены дата DD.MM, время, длительность и деньги (см. lexer.tokenize):
+    из одинаковых сущностей выигрывает первая. Заголовок — по-прежнему
+    весь текст без найденных сущностей.
+    Без max_scan строка разбирается целиком.
+    """
+    if max_scan is not None and max_scan <= 0:
+        raise ValueError("max_scan must be positive")
+
+    if profiler is None:
+        text = normalize_text(raw)
+    else:
+        started = profiler.clock()
+        text = normalize_text(raw)
+        profiler.record("normalize", started)
+
+    if cache is None:
+        return _parse_normalized(raw, text, now=now, tz=tz, language=language,
+                                 profiler=profiler, max_scan=max_scan)
+
+    key = cache.key(text, now=now, tz=tz, language=language, max_scan=max_scan)
+    cached = cache.get(key)
+    if cached is not None:
+        # в кэше лежит своя копия: наружу отдаём новую, с исходной строкой
+        return replace(cached, raw=raw)
+
+    parsed = _parse_normalized(raw, text, now=now, tz=tz, language=language,
+                               profiler=profiler, max_scan=max_scan)
+    cache.put(key, replace(parsed))
+    return parsed
+
+
+def reanchor(parsed: ParsedEvent, now: datetime, *, language: str = "ru") -> ParsedEvent:
+    """
+    ParsedEvent для нового now без разбора текста: dt пересчитывается
+    по date_rule, срок — по deadline_rule, время суток и всё остальное
+    остаются как были.
+
+    Результат совпадает с parse_event_title(parsed.raw, now=now, tz=...).
+    Если правила нет (дату нашёл dateparser) или по нему даты не существует
+    (29.02 в невисокосный год) при старом или новом now, строка
+    разбирается заново.
+    """
+    if parsed.deadline_rule is not None:
+        deadline = resolve_rule(parsed.deadline_rule, now.date())
+        # срока не было при старом now или нет при новом — «до 29.02»
+        if deadline is None or parsed.deadline is None:
+            return parse_event_title(parsed.raw, now=now, tz=(parsed.dt or now).tzinfo, language=language)
+        parsed = replace(parsed, deadline=deadline)
+
+    dt = parsed.dt
+    if dt is None:
+        if parsed.date_rule is None:
+            return parsed
+        # DD.MM, которой не было при старом now, при новом может найтись
+        return parse_event_title(parsed.raw, now=now, tz=now.tzinfo, language=language)
+
+    rule = parsed.date_rule
+    tz = dt.tzinfo
+
+    if rule is not None:
+        if rule[0] == "clock":
+            return replace(parsed, dt=clock_datetime((dt.hour, dt.minute), now, tz))
+
+        day = resolve_rule(rule, now.date())
+        if day is not None:
+            new_dt = datetime(day.year, day.month, day.day, dt.hour, dt.minute, tzinfo=tz)
+            return replace(parsed, dt=new_dt)
+
+    return parse_event_title(parsed.raw, now=now, tz=tz, language=language)
 
-    dt, text, explicit_time = extract_datetime(
+
+def _parse_normalized(
+    raw: str,
+    text: str,
+    *,
+    now,
+    tz,
+    language,
+    profiler: ParseProfiler | None = None,
+    max_scan: int | None = None,
+) -> ParsedEvent:
+    # замеры по стадиям: t — начало текущей стадии; без профайлера не трогаем часы
+    if profiler is not None:
+        t = profiler.clock()
+
+    # префильтр: по признакам строки (цифры, «:», валюта, слова-даты) лексер
+    # пробует только те альтернативы, которые могут совпасть
+    mask = features(text)
+
+    if profiler is not None:
+        t = profiler.record("prefilter", t)
+
+    # один проход лексера; экстракторы дальше работают только со спанами;
+    # строку без признаков (обычный заголовок) лексер не читает вовсе
+    if mask:
+        spans = tokenize(text, max_scan=max_scan, mask=mask)
+        if profiler is not None:
+            t = profiler.record("tokenize", t)
+    else:
+        spans = []
+
+    if not spans:
+        # обычная строка без дат, длительностей и денег — разбирать нечего;
+        # text уже нормализован, двойных пробелов в нём нет
+        if profiler is not None:
+            profiler.record_branch("none", t)
+        return ParsedEvent(
+            raw=raw,
+            title=text.strip(" -").strip(),
+            dt=None,
+            price=None,
+            duration=None,
+            explicit_duration=False,
+            leftovers=text,
+        )
+
+    dt, explicit_time, consumed, branch, rule = datetime_from_spans(
         text,
+        spans,
         now=now,
         tz=tz,
         language=language,
+        max_scan=max_scan,
     )
 
-    duration, explicit_duration, text = extract_duration(
-        text,
-        raw_text=raw,
+    if profiler is not None:
+        t = profiler.record_branch(branch, t)
+
+    duration, explicit_duration, duration_span = duration_from_spans(
+        spans,
         dt=dt,
         explicit_time=explicit_time,
+        consumed=consumed,
     )
+    if duration_span is not None:
+        consumed.append((duration_span.start, duration_span.end))
+
+    if profiler is not None:
+        t = profiler.record("duration", t)
+
+    price, money_span = money_from_spans(spans, consumed)
+    if money_span is not None:
+        consumed.append((money_span.start, money_span.end))
+
+    if profiler is not None:
+        t = profiler.record("money", t)
+
+    priority, priority_span = priority_from_spans(spans, consumed)
+    if priority_span is not None:
+        consumed.append((priority_span.start, priority_span.end))
+
+    deadline, deadline_rule, deadline_span = deadline_from_spans(spans, today=now.date(), consumed=consumed)
+    if deadline_span is not None:
+        consumed.append((deadline_span.start, deadline_span.end))
+
+    if profiler is not None:
+        t = profiler.record("urgency", t)
 
-    price, text = extract_money(text)
+    leftovers = remove_regions(text, consumed)
+    title = build_title(text, spans, consumed)
+    if leftovers == title:
+        # обычно совпадают: храним одну строку вместо двух одинаковых
+        leftovers = title
 
-    title = cleanup_title(text)
+    if profiler is not None:
+        profiler.record("cleanup", t)
 
     return ParsedEvent(
         raw=raw,
         title=title,
         dt=dt,
-        d=dt.date() if dt else None,
-        t=dt.time() if (dt and explicit_time) else None,  # 🔑 КЛЮЧ
         price=price,
         duration=duration,
         explicit_duration=explicit_duration,
-        leftovers=text,
+        leftovers=leftovers,
+        explicit_time=explicit_time,  # 🔑 КЛЮЧ: t задано только при явном времени
+        date_rule=rule,
+        priority=priority,
+        deadline=deadline,
+        deadline_rule=deadline_rule,
     )
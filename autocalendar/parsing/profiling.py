@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from time import perf_counter_ns
+from typing import Dict
+
+# Стадии parse_event_title в порядке выполнения
+STAGES = ("normalize", "prefilter", "tokenize", "datetime", "duration", "money", "urgency", "cleanup")
+
+# Ветки datetime_from_spans:
+#   range      — диапазон без даты («10:00-11:30»)
+#   time       — время без даты («10:00»)
+#   ddmm       — явная дата DD.MM
+#   relative   — встроенная грамматика относительных дат
+#   dateparser — фолбэк в dateparser (даже если он ничего не нашёл)
+#   none       — ни даты, ни времени
+DATETIME_BRANCHES = ("range", "time", "ddmm", "relative", "dateparser", "none")
+
+
+@dataclass(frozen=True)
+class StageStats:
+    calls: int
+    seconds: float
+
+
+@dataclass(frozen=True)
+class ProfileStats:
+    stages: Dict[str, StageStats]
+    # время стадии datetime в разбивке по веткам
+    branches: Dict[str, StageStats]
+
+    def report(self) -> str:
+        lines = [f"{'stage':<22}{'calls':>10}{'total, ms':>12}{'per call, us':>14}"]
+        rows = list(self.stages.items())
+        rows += [(f"  datetime:{name}", s) for name, s in self.branches.items()]
+        for name, s in rows:
+            per_call = s.seconds / s.calls * 1e6 if s.calls else 0.0
+            lines.append(f"{name:<22}{s.calls:>10}{s.seconds * 1e3:>12.1f}{per_call:>14.1f}")
+        return "\n".join(lines)
+
+
+class ParseProfiler:
+    """
+    Счётчики вызовов и суммарное время по стадиям parse_event_title.
+
+    Передаётся в parse_event_title(profiler=...). Без профайлера парсер
+    не делает ни замеров, ни лишних вызовов.
+    """
+
+    __slots__ = ("_calls", "_ns", "_branch_calls", "_branch_ns")
+
+    def __init__(self):
+        self._calls = dict.fromkeys(STAGES, 0)
+        self._ns = dict.fromkeys(STAGES, 0)
+        self._branch_calls = dict.fromkeys(DATETIME_BRANCHES, 0)
+        self._branch_ns = dict.fromkeys(DATETIME_BRANCHES, 0)
+
+    @staticmethod
+    def clock() -> int:
+        return perf_counter_ns()
+
+    def record(self, stage: str, started: int) -> int:
+        """
+        Засчитывает стадию, начатую в started (clock()).
+        Возвращает текущее время — начало следующей стадии.
+        """
+        now = perf_counter_ns()
+        self._calls[stage] += 1
+        self._ns[stage] += now - started
+        return now
+
+    def record_branch(self, branch: str, started: int) -> int:
+        now = self.record("datetime", started)
+        self._branch_calls[branch] += 1
+        self._branch_ns[branch] += now - started
+        return now
+
+    def merge(self, other: ParseProfiler) -> None:
+        """
+        Добавляет счётчики другого профайлера (например, из воркера parse_many).
+        """
+        for mine, theirs in (
+            (self._calls, other._calls),
+            (self._ns, other._ns),
+            (self._branch_calls, other._branch_calls),
+            (self._branch_ns, other._branch_ns),
+        ):
+            for key, value in theirs.items():
+                mine[key] += value
+
+    def stats(self) -> ProfileStats:
+        return ProfileStats(
+            stages={s: StageStats(self._calls[s], self._ns[s] / 1e9) for s in STAGES},
+            branches={
+                b: StageStats(self._branch_calls[b], self._branch_ns[b] / 1e9)
+                for b in DATETIME_BRANCHES
+            },
+        )
+
+    def reset(self) -> None:
+        for counters in (self._calls, self._ns, self._branch_calls, self._branch_ns):
+            for key in counters:
+                counters[key] = 0
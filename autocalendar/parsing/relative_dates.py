@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import re
+from datetime import date, timedelta
+from typing import Dict, Optional, Tuple
+
+# Встроенная грамматика для русских относительных дат.
+# Покрывает то, что реально встречается во входных строках;
+# всё остальное уходит в dateparser (см. datetime_extractor).
+
+_RELATIVE_DAYS = {
+    "сегодня": 0,
+    "завтра": 1,
+    "послезавтра": 2,
+}
+
+_WEEKDAYS = {
+    "понедельник": 0,
+    "вторник": 1,
+    "среда": 2,
+    "среду": 2,
+    "четверг": 3,
+    "пятница": 4,
+    "пятницу": 4,
+    "суббота": 5,
+    "субботу": 5,
+    "воскресенье": 6,
+}
+
+# «до пятницы»: день недели в родительном падеже
+_WEEKDAYS_GENITIVE = {
+    "понедельника": 0,
+    "вторника": 1,
+    "среды": 2,
+    "четверга": 3,
+    "пятницы": 4,
+    "субботы": 5,
+    "воскресенья": 6,
+}
+
+_MONTHS = {
+    "января": 1,
+    "февраля": 2,
+    "марта": 3,
+    "апреля": 4,
+    "мая": 5,
+    "июня": 6,
+    "июля": 7,
+    "августа": 8,
+    "сентября": 9,
+    "октября": 10,
+    "ноября": 11,
+    "декабря": 12,
+}
+
+# День недели — только после «в/во» или «следующий»: без них это обычное
+# слово («рабочая среда», «про четверг»), а не дата
+RELATIVE_DATE_PATTERN = (
+    r"\b(?:"
+    r"(?P<rel>послезавтра|сегодня|завтра)"
+    r"|(?:во?\s+|(?=следующ))(?:(?P<next>следующ(?:ий|ую|ее))\s+)?"
+    r"(?P<wd>понедельник|вторник|среду|среда|четверг|пятницу|пятница|субботу|суббота|воскресенье)"
+    r"|через\s+(?:(?P<n>\d{1,3})\s+)?(?P<unit>дней|дня|день|недель|недели|неделю)"
+    r"|(?P<day>[0-3]?\d)\s+(?P<month>" + "|".join(_MONTHS) + r")"
+    r"|(?P<next_week>на\s+следующей\s+неделе)"
+    r")\b"
+)
+
+_RELATIVE_DATE_RE = re.compile(RELATIVE_DATE_PATTERN, re.IGNORECASE)
+
+# Срок: «до пятницы», «до завтра», «до 15 декабря», «до 13.12», «до конца недели».
+# Имена групп — с префиксом dl_: лексер собирает все шаблоны в один.
+# «до 3.5 часов» — длительность, а не срок 3 мая
+DEADLINE_PATTERN = (
+    r"\bдо\s+(?:"
+    r"(?P<dl_rel>послезавтра|завтра)"
+    r"|(?P<dl_wd>" + "|".join(_WEEKDAYS_GENITIVE) + r")"
+    r"|(?P<dl_day>[0-3]?\d)(?:\.(?P<dl_m>[01]?\d)\b(?!\s*(?:ч|час|часа|часов|м|мин|минута|минуты|минут)\b)"
+    r"|\s+(?P<dl_month>" + "|".join(_MONTHS) + r"))"
+    r"|(?P<dl_week_end>конца\s+недели)"
+    r")\b"
+)
+
+# Слова, без которых RELATIVE_DATE_PATTERN не совпадёт (в нижнем регистре):
+# префильтр лексера ищет их, чтобы не пробовать грамматику на каждой строке.
+# «послезавтра» покрывается «завтра», «на следующей неделе» — «неделе».
+RELATIVE_WORDS = ("сегодня", "завтра", *_WEEKDAYS, "через", "неделе", *_MONTHS)
+
+
+def resolve_relative_date(
+    text: str,
+    *,
+    today: date,
+) -> Optional[Tuple[date, int, int]]:
+    """
+    Ищет первое относительное выражение даты и разрешает его относительно today.
+
+    Returns:
+        (date, start, end) — дата и границы найденного фрагмента в text,
+        либо None, если грамматика выражение не покрывает.
+    """
+    m = _RELATIVE_DATE_RE.search(text)
+    if m is None:
+        return None
+
+    resolved = resolve_match(m, today)
+    if resolved is None:
+        return None
+
+    return resolved, m.start(), m.end()
+
+
+# Правило даты — то, что осталось от выражения после разбора, без привязки
+# к today: по нему дату можно пересчитать для любого дня (см. reanchor).
+#   ("days", n)           — today + n дней («завтра», «через 2 недели»)
+#   ("weekday", wd)       — ближайший такой день недели после today
+#   ("next_week", wd)     — день wd на следующей календарной неделе
+#   ("day_month", d, m)   — ближайшее d.m, не раньше today
+#   ("clock",)            — дата не указана: сегодня, а если время уже прошло — завтра
+DateRule = Tuple
+
+# Правил немного, а ParsedEvent-ов миллионы: храним по одному экземпляру
+_INTERNED_RULES: Dict[DateRule, DateRule] = {}
+
+
+def intern_rule(rule: DateRule) -> DateRule:
+    return _INTERNED_RULES.setdefault(rule, rule)
+
+
+def resolve_match(m: re.Match, today: date) -> Optional[date]:
+    """
+    Разрешает уже найденное совпадение RELATIVE_DATE_PATTERN (в т.ч. из лексера).
+    """
+    rule = match_rule(m)
+    return resolve_rule(rule, today) if rule is not None else None
+
+
+def match_rule(m: re.Match) -> Optional[DateRule]:
+    """
+    Правило даты для совпадения RELATIVE_DATE_PATTERN.
+    """
+    if m.group("rel"):
+        return intern_rule(("days", _RELATIVE_DAYS[m.group("rel").lower()]))
+
+    if m.group("wd"):
+        weekday = _WEEKDAYS[m.group("wd").lower()]
+        if m.group("next"):
+            # «в следующий понедельник» — день на следующей календарной неделе
+            return intern_rule(("next_week", weekday))
+        return intern_rule(("weekday", weekday))
+
+    if m.group("unit"):
+        n = int(m.group("n")) if m.group("n") else 1
+        unit = m.group("unit").lower()
+        return intern_rule(("days", n * 7 if unit.startswith("недел") else n))
+
+    if m.group("month"):
+        return intern_rule(("day_month", int(m.group("day")), _MONTHS[m.group("month").lower()]))
+
+    if m.group("next_week"):
+        return intern_rule(("next_week", 0))
+
+    return None
+
+
+def deadline_rule(m: re.Match) -> Optional[DateRule]:
+    """
+    Правило даты срока для совпадения DEADLINE_PATTERN: срок — последний
+    день, в который задачу ещё можно сделать.
+    """
+    if m.group("dl_rel"):
+        return intern_rule(("days", _RELATIVE_DAYS[m.group("dl_rel").lower()]))
+
+    if m.group("dl_wd"):
+        return intern_rule(("weekday", _WEEKDAYS_GENITIVE[m.group("dl_wd").lower()]))
+
+    if m.group("dl_day"):
+        month = int(m.group("dl_m")) if m.group("dl_m") else _MONTHS[m.group("dl_month").lower()]
+        return intern_rule(("day_month", int(m.group("dl_day")), month))
+
+    if m.group("dl_week_end"):
+        # воскресенье этой недели: понедельник следующей минус день
+        return intern_rule(("next_week", -1))
+
+    return None
+
+
+def resolve_rule(rule: DateRule, today: date) -> Optional[date]:
+    """
+    Дата по правилу относительно today; None, если такой даты нет
+    (31 ноября, 29 февраля не в високосный год).
+    """
+    kind = rule[0]
+
+    if kind == "days":
+        return today + timedelta(days=rule[1])
+
+    if kind == "weekday":
+        days_ahead = (rule[1] - today.weekday()) % 7 or 7
+        return today + timedelta(days=days_ahead)
+
+    if kind == "next_week":
+        next_monday = today + timedelta(days=7 - today.weekday())
+        return next_monday + timedelta(days=rule[1])
+
+    if kind == "day_month":
+        day, month = rule[1], rule[2]
+        year = today.year
+        if (month, day) < (today.month, today.day):
+            year += 1
+        try:
+            return date(year, month, day)
+        except ValueError:
+            return None
+
+    raise ValueError(f"Unknown date rule: {rule!r}")
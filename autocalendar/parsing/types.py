@@ -3,23 +3,53 @@ from __future__ import annotations
 from decimal import Decimal
 from dataclasses import dataclass
 from datetime import datetime, date, time
-from typing import Optional
+from typing import Optional, Tuple
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoneyValue:
     amount: Decimal
     currency: str  # "EUR", "USD", "RUB"
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedEvent:
+    """
+    Результат парсинга одной строки.
+
+    d и t не хранятся, а выводятся из dt: на импортах в миллионы строк
+    лишние объекты date/time на каждое событие заметны в RSS.
+    t задано, только если время указано явно (explicit_time).
+
+    date_rule — как дата dt получена из now, без привязки к нему
+    (см. relative_dates.DateRule): по нему reanchor пересчитывает dt
+    для нового now без разбора текста. None — dt от dateparser или даты нет.
+    Правило при dt None — в строке DD.MM, которой нет при этом now (29.02).
+
+    priority — по отметке «!», «!!», «!!!»; deadline — последний день
+    для задачи («до пятницы»), deadline_rule — его правило для reanchor.
+    None — не указаны. Правило при deadline None — срок «до 29.02»,
+    которого нет при этом now.
+    """
     raw: str
     title: str
     dt: Optional[datetime]
-    d: Optional[date]
-    t: Optional[time]
     price: Optional["MoneyValue"]
     duration: Optional[int]
     explicit_duration: bool
     leftovers: str
+    explicit_time: bool = False
+    date_rule: Optional[Tuple] = None
+    priority: Optional[int] = None
+    deadline: Optional[date] = None
+    deadline_rule: Optional[Tuple] = None
+
+    @property
+    def d(self) -> Optional[date]:
+        return self.dt.date() if self.dt is not None else None
+
+    @property
+    def t(self) -> Optional[time]:
+        if self.dt is None or not self.explicit_time:
+            return None
+        return self.dt.time()
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Iterable, Optional, Sequence, Tuple
+
+from .lexer import DEADLINE, PRIORITY, Span, first, overlaps, remove_regions, tokenize
+from .relative_dates import DateRule, deadline_rule, resolve_rule
+
+# «!» — 2, «!!» — 3, «!!!» — 4; без отметки приоритет не задан
+# (планировщик считает его DEFAULT_PRIORITY = 1)
+_BANG_PRIORITY = 1
+
+
+def extract_urgency(
+    text: str,
+    *,
+    today: date,
+) -> Tuple[Optional[int], Optional[date], str]:
+    """
+    Возвращает (priority, deadline, cleaned_text).
+    """
+    spans = tokenize(text)
+    priority, priority_span = priority_from_spans(spans)
+    deadline, _, deadline_span = deadline_from_spans(spans, today=today)
+
+    regions = [(s.start, s.end) for s in (priority_span, deadline_span) if s is not None]
+    return priority, deadline, remove_regions(text, regions)
+
+
+def priority_from_spans(
+    spans: Sequence[Span],
+    consumed: Iterable[Tuple[int, int]] = (),
+) -> Tuple[Optional[int], Optional[Span]]:
+    """
+    Приоритет по первой отметке «!», «!!» или «!!!» отдельным словом.
+    """
+    consumed = list(consumed)
+    span = first((s for s in spans if not overlaps(s, consumed)), PRIORITY)
+    if span is None:
+        return None, None
+    return _BANG_PRIORITY + len(span.match.group("bangs")), span
+
+
+def deadline_from_spans(
+    spans: Sequence[Span],
+    *,
+    today: date,
+    consumed: Iterable[Tuple[int, int]] = (),
+) -> Tuple[Optional[date], Optional[DateRule], Optional[Span]]:
+    """
+    Срок по первому «до ...» (см. relative_dates.DEADLINE_PATTERN):
+    (дата, правило для reanchor, спан). Срока, которого нет в календаре
+    («до 31.02»), нет и в результате — фрагмент остаётся в заголовке,
+    а правило остаётся для reanchor: при другом today дата может найтись
+    («до 29.02»).
+    """
+    consumed = list(consumed)
+    span = first((s for s in spans if not overlaps(s, consumed)), DEADLINE)
+    if span is None:
+        return None, None, None
+
+    rule = deadline_rule(span.match)
+    deadline = resolve_rule(rule, today) if rule is not None else None
+    if deadline is None:
+        return None, rule, None
+    return deadline, rule, span
@@ -1,11 +1,20 @@
 from .types import Event, ScheduledEvent, TimeSlot
 from .constraints import WorkDay
+from .work_calendar import WorkCalendar
+from .occupancy import OccupancyMap
 from .scheduler import autoschedule
+from .conflicts import Conflict, find_conflicts
+from .state import ScheduleState
 
 __all__ = [
     "Event",
     "ScheduledEvent",
     "TimeSlot",
     "WorkDay",
+    "WorkCalendar",
+    "OccupancyMap",
     "autoschedule",
+    "Conflict",
+    "find_conflicts",
+    "ScheduleState",
 ]
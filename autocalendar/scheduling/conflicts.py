@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date
+from heapq import heappop, heappush
+from typing import Iterable, List, Optional, Union
+
+from .constraints import WorkDay
+from .slots import to_minutes
+from .types import Event, ScheduledEvent
+from .work_calendar import WorkCalendar, as_calendar
+
+# Виды конфликтов фиксированных событий:
+#   overlap      — пересекается с другим фиксированным событием того же дня
+#   before_start — начинается раньше рабочего дня
+#   after_end    — заканчивается позже рабочего дня
+CONFLICT_KINDS = ("overlap", "before_start", "after_end")
+
+
+@dataclass(frozen=True, slots=True)
+class Conflict:
+    kind: str
+    date: date
+    event: ScheduledEvent
+    other: Optional[ScheduledEvent]  # второе событие для overlap
+    minutes: int                     # длина пересечения или выхода за рабочий день
+
+
+def day_conflicts(
+    fixed: Iterable[ScheduledEvent],
+    day_start: int,
+    day_end: int,
+) -> List[Conflict]:
+    """
+    Конфликты фиксированных событий одного дня; границы рабочего дня —
+    в минутах от полуночи.
+
+    Заметающая прямая по началам: в куче — события, которые ещё идут.
+    Каждое новое пересекается со всеми, кто в куче после выброса
+    закончившихся, — O(n log n + число пересечений).
+    """
+    conflicts: List[Conflict] = []
+    active: list = []  # (конец, номер, событие)
+    reach = 0  # самый поздний конец среди active
+
+    intervals = sorted((to_minutes(event.time), i, event) for i, event in enumerate(fixed))
+    for start, i, event in intervals:
+        end = start + event.duration
+
+        if start < day_start:
+            conflicts.append(Conflict("before_start", event.date, event, None,
+                                      min(end, day_start) - start))
+        if end > day_end:
+            conflicts.append(Conflict("after_end", event.date, event, None,
+                                      end - max(start, day_end)))
+
+        # событие нулевой длительности ничего не занимает
+        if end <= start:
+            continue
+
+        if start >= reach:
+            # всё, что было раньше, уже закончилось — обычный случай
+            active.clear()
+        else:
+            while active[0][0] <= start:
+                heappop(active)
+            for other_end, _, other in active:
+                conflicts.append(Conflict("overlap", event.date, other, event,
+                                          min(end, other_end) - start))
+        heappush(active, (end, i, event))
+        reach = max(reach, end)
+
+    return conflicts
+
+
+def find_conflicts(
+    events: Iterable[Union[Event, ScheduledEvent]],
+    work_day: Union[WorkDay, WorkCalendar],
+) -> List[Conflict]:
+    """
+    Конфликты всех фиксированных событий (с заданным временем) по дням,
+    одним проходом — например, для проверки импортированного календаря.
+    С WorkCalendar границы дня — начало первого и конец последнего окна
+    этой даты; в нерабочий день проверяются только пересечения.
+    """
+    by_date = defaultdict(list)
+    for event in events:
+        if event.time is None:
+            continue
+        if not isinstance(event, ScheduledEvent):
+            event = ScheduledEvent(event.title, event.date, event.time, event.duration, event.priority,
+                                   event.deadline)
+        by_date[event.date].append(event)
+
+    calendar = as_calendar(work_day)
+    conflicts: List[Conflict] = []
+    for day in sorted(by_date):
+        conflicts.extend(day_conflicts(by_date[day], *calendar.bounds(day)))
+    return conflicts
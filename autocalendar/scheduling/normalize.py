@@ -2,6 +2,7 @@ from .types import Event
 
 
 DEFAULT_DURATION = 60  # минут
+DEFAULT_PRIORITY = 1
 
 
 def normalize_duration(event: Event) -> Event:
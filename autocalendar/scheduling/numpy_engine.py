@@ -0,0 +1,107 @@
+"""
+Движок планировщика на numpy (autoschedule(..., engine="numpy")).
+
+Свободные окна всех дней с фиксированными событиями строятся одним
+проходом без цикла по дням в Python: интервалы всех дней сдвигаются
+на номер дня × длину сетки, сортируются, а накопленный максимум концов
+(np.maximum.accumulate) склеивает пересекающиеся — окно начинается там,
+где следующий интервал начинается позже, чем закончились предыдущие.
+Результат тот же, что у free_gaps по каждому дню.
+
+Занятость по минутам (сетка «дни × минуты» + cumsum) проигрывает этому
+на обычных днях с несколькими событиями: её стоимость — дни × минуты,
+а не число событий. Раскладка по окнам — тот же SlotIndex, что у движка
+"python": вызов numpy на каждое событие дороже спуска по дереву.
+
+numpy — необязательная зависимость: модуль импортируется только при
+выборе этого движка.
+"""
+from __future__ import annotations
+
+from datetime import date
+from itertools import chain
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+from .slots import Gap, SlotIndex
+
+
+def occupancy_slots(
+    busy_by_date: Dict[date, List[Tuple[int, int]]],
+    day_start: int,
+    day_end: int,
+) -> Callable[[date], SlotIndex]:
+    """
+    Фабрика свободных окон по дате: для дней из busy_by_date они
+    посчитаны заранее, остальные дни свободны на всё рабочее окно.
+    """
+    if day_start >= day_end:
+        return lambda d: SlotIndex([])
+
+    gaps = dict(zip(busy_by_date, _free_gaps(list(busy_by_date.values()), day_start, day_end)))
+    whole_day = [(day_start, day_end)]
+
+    def day_slots(d: date) -> SlotIndex:
+        return SlotIndex(gaps.get(d, whole_day))
+
+    return day_slots
+
+
+def _free_gaps(
+    busy: List[List[Tuple[int, int]]],
+    day_start: int,
+    day_end: int,
+) -> List[List[Gap]]:
+    days = len(busy)
+    counts = [len(intervals) for intervals in busy]
+    rows = np.repeat(np.arange(days), counts)
+    flat = np.fromiter(chain.from_iterable(chain.from_iterable(busy)),
+                       dtype=np.int64, count=2 * sum(counts)).reshape(-1, 2)
+
+    # всё за пределами рабочего окна окнам не мешает;
+    # пустые и целиком внешние интервалы ничего не занимают
+    starts = np.clip(flat[:, 0], day_start, day_end)
+    ends = np.clip(flat[:, 1], day_start, day_end)
+    keep = starts < ends
+    rows, starts, ends = rows[keep], starts[keep], ends[keep]
+
+    # день d занимает на общей оси [d * span, d * span + day_end]:
+    # интервалы разных дней не пересекаются, а сортировка по началу
+    # сразу упорядочивает и дни
+    span = day_end + 1
+    base = rows * span
+    starts += base
+    ends += base
+    order = np.argsort(starts, kind="stable")
+    rows, base, starts, ends = rows[order], base[order], starts[order], ends[order]
+
+    # окно перед интервалом — от конца всего, что было раньше в этот день
+    reach = np.maximum.accumulate(ends)
+    before = np.maximum(np.concatenate(([-1], reach[:-1])), base + day_start)
+    inner = starts > before
+
+    # и окно после последнего интервала дня — до конца рабочего окна
+    last = np.ones(len(rows), dtype=bool)
+    last[:-1] = rows[1:] != rows[:-1]
+    tail_lo = np.maximum(reach[last], base[last] + day_start)
+    tail_hi = base[last] + day_end
+    tail = tail_lo < tail_hi
+
+    gap_rows = np.concatenate((rows[inner], rows[last][tail]))
+    gap_lo = np.concatenate((before[inner], tail_lo[tail]))
+    gap_hi = np.concatenate((starts[inner], tail_hi[tail]))
+    order = np.argsort(gap_lo, kind="stable")
+    gap_rows, gap_lo, gap_hi = gap_rows[order], gap_lo[order], gap_hi[order]
+
+    offset = gap_rows * span
+    flat_gaps = list(zip((gap_lo - offset).tolist(), (gap_hi - offset).tolist()))
+    bounds = np.cumsum(np.bincount(gap_rows, minlength=days)).tolist()
+    gaps = [flat_gaps[lo:hi] for lo, hi in zip([0] + bounds, bounds)]
+
+    # дни, где ни один интервал не задел рабочее окно, свободны целиком
+    touched = np.zeros(days, dtype=bool)
+    touched[rows] = True
+    for day in np.flatnonzero(~touched).tolist():
+        gaps[day] = [(day_start, day_end)]
+    return gaps
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+from .constraints import WorkDay
+from .slots import Gap, to_minutes
+from .types import ScheduledEvent
+from .work_calendar import MINUTES_PER_DAY, WorkCalendar, as_calendar
+
+
+class OccupancyMap:
+    """
+    Занятость по минутам: на каждый день — целое число, где бит m
+    означает «минута m от полуночи занята». Хранятся только дни,
+    в которых что-то занято.
+
+    Для тех, кто опрашивает готовое расписание тысячи раз (подсказки
+    в интерфейсе, «а что если»): свободен ли интервал, первое окно
+    нужной длины, сколько свободно — всё битовыми операциями над
+    1440-битным числом, без построения слотов.
+
+    Запросы ограничены рабочими окнами дня: work_day — WorkDay или
+    WorkCalendar (обед, выходные, особые дни). Биты не считают, сколько
+    событий заняли минуту: release() освобождает интервал целиком, даже
+    если его частично занимало и другое событие.
+    """
+
+    __slots__ = ("_days", "_calendar", "_masks")
+
+    def __init__(self, work_day: Union[WorkDay, WorkCalendar]):
+        self._days: Dict[date, int] = {}
+        self._calendar = as_calendar(work_day)
+        # маска окон по набору окон дня: разных наборов — единицы
+        self._masks: Dict[Tuple[Gap, ...], int] = {}
+
+    @classmethod
+    def from_schedule(
+        cls,
+        events: Iterable[ScheduledEvent],
+        work_day: Union[WorkDay, WorkCalendar],
+    ) -> OccupancyMap:
+        occupancy = cls(work_day)
+        for event in events:
+            occupancy.occupy(event.date, to_minutes(event.time), event.duration)
+        return occupancy
+
+    def occupy(self, day: date, start: int, duration: int) -> None:
+        bits = self._days.get(day, 0) | _mask(start, start + duration)
+        if bits:
+            self._days[day] = bits
+
+    def release(self, day: date, start: int, duration: int) -> None:
+        bits = self._days.get(day, 0) & ~_mask(start, start + duration)
+        if bits:
+            self._days[day] = bits
+        else:
+            self._days.pop(day, None)
+
+    def is_free(self, day: date, start: int, duration: int) -> bool:
+        """
+        Свободен ли [start, start + duration) целиком и внутри одного рабочего окна.
+        """
+        windows = self._calendar.windows(day)
+        if duration <= 0:
+            return any(w_start <= start <= w_end for w_start, w_end in windows)
+        if start < 0 or start + duration > MINUTES_PER_DAY:
+            return False
+        span = _mask(start, start + duration)
+        return not span & (self._days.get(day, 0) | ~self._window(windows))
+
+    def first_fit(self, day: date, duration: int, *, after: int = 0) -> Optional[int]:
+        """
+        Первая минута не раньше after, с которой свободно duration минут
+        подряд внутри одного рабочего окна; None — такой нет.
+        """
+        windows = self._calendar.windows(day)
+        if duration <= 0:
+            return next((max(after, w_start) for w_start, w_end in windows if w_end >= after), None)
+
+        free = ~self._days.get(day, 0) & self._window(windows) & ~_mask(0, after)
+
+        # бит m остаётся, если свободны минуты m .. m + length - 1:
+        # длина серии удваивается сдвигом, остаток добирается одним сдвигом
+        runs, length = free, 1
+        while 2 * length <= duration:
+            runs &= runs >> length
+            length *= 2
+        if length < duration:
+            runs &= runs >> (duration - length)
+
+        if not runs:
+            return None
+        return (runs & -runs).bit_length() - 1
+
+    def free_minutes(self, day: date) -> int:
+        """
+        Сколько минут рабочих окон дня свободно.
+        """
+        return (self._window(self._calendar.windows(day)) & ~self._days.get(day, 0)).bit_count()
+
+    def _window(self, windows: Tuple[Gap, ...]) -> int:
+        mask = self._masks.get(windows)
+        if mask is None:
+            mask = 0
+            for start, end in windows:
+                mask |= _mask(start, end)
+            self._masks[windows] = mask
+        return mask
+
+    def __contains__(self, day: date) -> bool:
+        return day in self._days
+
+    def __len__(self) -> int:
+        return len(self._days)
+
+
+def _mask(start: int, end: int) -> int:
+    # биты [start, end), обрезанные по суткам
+    start, end = max(start, 0), min(end, MINUTES_PER_DAY)
+    if start >= end:
+        return 0
+    return ((1 << (end - start)) - 1) << start
@@ -1,13 +1,146 @@
-from datetime import timedelta
+from dataclasses import replace
+from datetime import date, timedelta
+from heapq import heapify, heappop, heappush, heapreplace
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from .types import Event
+from .slots import SlotIndex
+from .packing import pack_day
+from .work_calendar import WorkCalendar
+from .sorter import flexible_sort_key, sort_flexible_events
 
+# элемент кучи пула: (flexible_sort_key, партия, номер в партии, событие);
+# партия и номер различают равные ключи, до сравнения Event не доходит
+_Entry = Tuple[Tuple[date, int, int], int, int, Event]
 
-def handle_overflow(event: Event) -> Event:
-    return Event(
-        title=event.title,
-        date=event.date + timedelta(days=1),
-        time=None,
-        duration=event.duration,
-        priority=event.priority,
-    )
+
+def handle_overflow(event: Event, calendar: Optional[WorkCalendar] = None) -> Event:
+    """
+    Переносит событие на следующий день, а с calendar — на ближайший
+    рабочий день, где есть окно на всё событие.
+    """
+    day = event.date + timedelta(days=1)
+    if calendar is not None:
+        day = calendar.next_working_day(day, event.duration)
+        if day is None:
+            raise ValueError(f"no working window of {event.duration} min after {event.date}")
+
+    return replace(event, date=day, time=None)
+
+
+class CarryPool:
+    """
+    Гибкие события, которые ещё ждут места: свои события текущего дня
+    и всё, что не поместилось в предыдущие дни.
+
+    Порядок пула — ключ (flexible_sort_key, партия, номер): сначала
+    ближайший срок, потом приоритет и длительность. Партия — вызов add:
+    при равном ключе свои события дня идут раньше перенесённых, а между
+    собой — в порядке sort_flexible_events, тот же порядок, что давал
+    sorted(события дня + перенос).
+
+    События лежат в heapq по длительностям. Событие, которое не влезло
+    в окна дня, не влезет и после него: окна за день только уменьшаются.
+    Поэтому день смотрит только на головы куч — длительность, которая
+    не влезла, выбывает до конца дня целиком, и длинный хвост пула не
+    перебирается заново каждый день. Добавление и размещение —
+    O(log n) на событие, плюс O(d log d) на день по d длительностям.
+    """
+
+    __slots__ = ("_by_duration", "_size", "_batch")
+
+    def __init__(self, carried: Iterable[Event] = ()):
+        # carried — перенос в порядке пула, как его отдаёт pending();
+        # упорядоченный список — уже куча
+        self._by_duration: Dict[int, List[_Entry]] = {}
+        self._size = 0
+        self._batch = 0
+        for i, event in enumerate(carried):
+            self._by_duration.setdefault(event.duration, []).append((flexible_sort_key(event), 0, i, event))
+            self._size += 1
+
+    def add(self, events: Iterable[Event]) -> None:
+        """
+        Добавляет свои гибкие события дня.
+        """
+        # каждая следующая партия при равном ключе идёт раньше прежних
+        self._batch -= 1
+        by_duration, batch = self._by_duration, self._batch
+        for i, event in enumerate(sort_flexible_events(events)):
+            heappush(by_duration.setdefault(event.duration, []), (flexible_sort_key(event), batch, i, event))
+            self._size += 1
+
+    def place(self, slots: SlotIndex) -> List[Tuple[int, Event]]:
+        """
+        Раскладывает пул first-fit по окнам дня в порядке пула;
+        возвращает (минута начала, событие) размещённых. Остальные
+        остаются в пуле на следующий день.
+        """
+        by_duration = self._by_duration
+        shortest = min(by_duration, default=0)
+
+        # головы куч: следующее событие в порядке пула — наименьшая голова
+        heads = [heap[0] for heap in by_duration.values()]
+        heapify(heads)
+
+        placed: List[Tuple[int, Event]] = []
+        while heads:
+            largest = slots.largest()
+            if largest < shortest:
+                break
+
+            event = heads[0][3]
+            duration = event.duration
+            if duration > largest:
+                # не влезло — не влезет и всё остальное этой длительности
+                heappop(heads)
+                continue
+
+            placed.append((slots.place(duration), event))
+            heap = by_duration[duration]
+            heappop(heap)
+            if heap:
+                heapreplace(heads, heap[0])
+            else:
+                heappop(heads)
+                del by_duration[duration]
+                shortest = min(by_duration, default=0)
+
+        self._size -= len(placed)
+        return placed
+
+    def pack(self, slots: SlotIndex, stop_at: float) -> List[Tuple[int, Event]]:
+        """
+        Как place, но раскладывает пул упаковщиком (см. packing.pack_day)
+        до момента stop_at по time.perf_counter(). Упаковщику нужен весь
+        пул по порядку, поэтому здесь пул сортируется целиком.
+        """
+        entries = self._entries()
+        placed = pack_day(slots.free_gaps(), [entry[3] for entry in entries], stop_at)
+
+        taken = {id(event) for _, event in placed}
+        # отсортированные списки — тоже кучи
+        self._by_duration = {}
+        for entry in entries:
+            if id(entry[3]) not in taken:
+                self._by_duration.setdefault(entry[3].duration, []).append(entry)
+        self._size -= len(placed)
+        return placed
+
+    def shortest(self) -> int:
+        """
+        Самая короткая длительность в пуле; 0 — пул пуст.
+        """
+        return min(self._by_duration, default=0)
+
+    def pending(self) -> Tuple[Event, ...]:
+        """
+        События, ждущие места, в порядке пула.
+        """
+        return tuple(entry[3] for entry in self._entries())
+
+    def _entries(self) -> List[_Entry]:
+        return sorted(entry for heap in self._by_duration.values() for entry in heap)
+
+    def __len__(self) -> int:
+        return self._size
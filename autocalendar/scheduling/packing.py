@@ -0,0 +1,335 @@
+"""
+Упаковка гибких событий в окна одного дня с ограничением по времени
+(autoschedule(..., pack_budget=...)).
+
+Жадный first-fit идёт по пулу в порядке приоритета и ставит событие
+в первое окно, куда оно влезает. Из-за этого длинное событие иногда
+уходит на завтра, хотя при другой раскладке окна вместили бы всё.
+Упаковщик начинает с того же first-fit и пробует варианты лучше:
+best-fit decreasing, рюкзак по каждому окну и локальный поиск.
+Из всех вариантов берётся лучший.
+
+Лучше — значит больше минут самой срочной задачи (ближайший срок,
+потом высший приоритет — как порядок пула), при равенстве — следующей
+по срочности и так далее. Поэтому упаковщик никогда не меняет минуты
+важной задачи на минуты менее важной. Когда истекает бюджет,
+возвращается лучший вариант из уже найденных. Хуже first-fit
+результат не бывает.
+"""
+from __future__ import annotations
+
+import time
+from bisect import bisect_left, insort
+from datetime import date
+from typing import Dict, List, Sequence, Tuple
+
+from .slots import Gap, SlotIndex
+from .types import Event
+
+# секунд на день по умолчанию
+PACK_BUDGET = 0.005
+
+# окно события в раскладке: номер окна или _UNPLACED
+_UNPLACED = -1
+
+# через сколько событий проверять бюджет в жадных проходах
+_CHECK_EVERY = 64
+
+# сколько рангов срочности различает рюкзак в одном окне
+_KNAPSACK_RANKS = 64
+
+
+def pack_day(
+    gaps: Sequence[Gap],
+    events: Sequence[Event],
+    stop_at: float,
+) -> List[Tuple[int, Event]]:
+    """
+    Раскладывает events (в порядке пула) по окнам gaps и возвращает
+    (минута начала, событие) размещённых, в порядке events. В каждом
+    окне события идут подряд с его начала.
+
+    stop_at — момент по time.perf_counter(). После него упаковщик
+    прекращает поиск; first-fit считается всегда.
+    """
+    if not gaps or not events:
+        return []
+
+    durations = [event.duration for event in events]
+    best = _first_fit(gaps, durations)
+
+    if _UNPLACED in best and time.perf_counter() < stop_at:
+        caps = [end - start for start, end in gaps]
+        ranks = _ranks(events)
+        # вес события — (ранг, длительность): так же сравнивались бы
+        # веса «минуты × base ** ранг», но без огромных чисел
+        weights = list(zip(ranks, durations))
+        best_value = _value(best, durations, ranks)
+
+        for search in (_best_fit_decreasing, _knapsack_by_gap):
+            if time.perf_counter() >= stop_at:
+                break
+            assign = search(caps, durations, weights, stop_at)
+            value = _value(assign, durations, ranks)
+            if value > best_value:
+                best, best_value = assign, value
+
+        if _UNPLACED in best and time.perf_counter() < stop_at:
+            best = _local_search(best, caps, durations, weights, stop_at)
+
+    cursor = [start for start, _ in gaps]
+    placed = []
+    for i, g in enumerate(best):
+        if g != _UNPLACED:
+            placed.append((cursor[g], events[i]))
+            cursor[g] += durations[i]
+    return placed
+
+
+def _ranks(events: Sequence[Event]) -> List[int]:
+    # ранг срочности: у самых срочных — наибольший. events в порядке
+    # пула (flexible_sort_key), равные срок и приоритет идут подряд —
+    # ранги за один проход
+    keys = [(event.deadline or date.max, event.priority) for event in events]
+    groups = [0]
+    group = 0
+    for key, previous in zip(keys[1:], keys):
+        if key != previous:
+            group += 1
+        groups.append(group)
+    return [group - g for g in groups]
+
+
+def _value(assign: List[int], durations: List[int], ranks: List[int]) -> Tuple[int, ...]:
+    # минуты по рангам, от самого срочного: сравнение кортежей —
+    # сравнение минут по срочности, начиная с высшей
+    minutes = [0] * (ranks[0] + 1)
+    top = ranks[0]
+    for g, duration, rank in zip(assign, durations, ranks):
+        if g != _UNPLACED:
+            minutes[top - rank] += duration
+    return tuple(minutes)
+
+
+def _first_fit(gaps: Sequence[Gap], durations: List[int]) -> List[int]:
+    # то же, что CarryPool.place: когда не влезает даже самое короткое,
+    # дальше не смотрим
+    slots = SlotIndex(gaps)
+    shortest = min(durations)
+    assign = []
+    for duration in durations:
+        if slots.largest() < shortest:
+            break
+        g = slots.first_fit(duration)
+        if g is not None:
+            slots.place(duration)
+        assign.append(_UNPLACED if g is None else g)
+    assign.extend([_UNPLACED] * (len(durations) - len(assign)))
+    return assign
+
+
+def _best_fit_decreasing(
+    caps: List[int],
+    durations: List[int],
+    weights: List[Tuple[int, int]],
+    stop_at: float,
+) -> List[int]:
+    # пул уже упорядочен по срочности и убыванию длительности;
+    # событие идёт в окно с наименьшим остатком, куда оно влезает
+    remaining = sorted((cap, g) for g, cap in enumerate(caps))
+    assign = [_UNPLACED] * len(durations)
+    for i, duration in enumerate(durations):
+        if not i % _CHECK_EVERY and time.perf_counter() >= stop_at:
+            break
+        k = bisect_left(remaining, (duration, -1))
+        if k == len(remaining):
+            continue
+        cap, g = remaining.pop(k)
+        if cap > duration:
+            insort(remaining, (cap - duration, g))
+        assign[i] = g
+    return assign
+
+
+def _knapsack_by_gap(
+    caps: List[int],
+    durations: List[int],
+    weights: List[Tuple[int, int]],
+    stop_at: float,
+) -> List[int]:
+    """
+    Окна от большего к меньшему; каждое заполняется точным рюкзаком
+    по ещё не размещённым событиям. События одной длительности и
+    срочности взаимозаменяемы: рюкзак идёт по классам с количеством
+    (двоичное разбиение), так что число строк не растёт с пулом.
+    Вес в рюкзаке — минуты × base ** ранг, где ранги сжаты до рангов
+    классов этого окна, а base больше окна. Менее срочные классы окна
+    остаются локальному поиску.
+    """
+    assign = [_UNPLACED] * len(durations)
+
+    for g in sorted(range(len(caps)), key=lambda g: -caps[g]):
+        if time.perf_counter() >= stop_at:
+            break
+
+        cap = caps[g]
+        # класс (длительность, ранг) -> неразмещённые события по порядку пула
+        classes: Dict[Tuple[int, int], List[int]] = {}
+        for i, duration in enumerate(durations):
+            if assign[i] == _UNPLACED and duration <= cap:
+                classes.setdefault((duration, weights[i][0]), []).append(i)
+        if not classes:
+            continue
+
+        # рюкзак — по _KNAPSACK_RANKS самым срочным рангам окна:
+        # так вес остаётся небольшим числом на любом пуле
+        base, weight = cap + 1, 1
+        scale = {}
+        for rank in sorted({rank for _, rank in classes})[-_KNAPSACK_RANKS:]:
+            scale[rank] = weight
+            weight *= base
+        classes = {key: members for key, members in classes.items() if key[1] in scale}
+
+        items = []  # (длительность, вес, класс, сколько событий)
+        for key, members in classes.items():
+            if time.perf_counter() >= stop_at:
+                return assign
+            weight = key[0] * scale[key[1]]
+            count, chunk = len(members), 1
+            while count:
+                take = min(chunk, count)
+                items.append((key[0] * take, weight * take, key, take))
+                count -= take
+                chunk *= 2
+
+        cap = min(cap, sum(item[0] for item in items))
+        rows = [[0] * (cap + 1)]
+        for duration, weight, _, _ in items:
+            if time.perf_counter() >= stop_at:
+                return assign
+            dp = rows[-1]
+            if duration > cap:
+                rows.append(dp)
+                continue
+            rows.append(dp[:duration] + [
+                max(skip, take + weight)
+                for skip, take in zip(dp[duration:], dp)
+            ])
+
+        taken: Dict[Tuple[int, int], int] = {}
+        for k in range(len(items), 0, -1):
+            if rows[k][cap] != rows[k - 1][cap]:
+                duration, _, key, count = items[k - 1]
+                taken[key] = taken.get(key, 0) + count
+                cap -= duration
+
+        for key, count in taken.items():
+            for i in classes[key][:count]:
+                assign[i] = g
+
+    return assign
+
+
+def _local_search(
+    assign: List[int],
+    caps: List[int],
+    durations: List[int],
+    weights: List[Tuple[int, int]],
+    stop_at: float,
+) -> List[int]:
+    """
+    Улучшает раскладку, пока есть ходы и время. Для неразмещённого
+    события u (по одному на класс, от тяжёлых к лёгким) в каком-нибудь
+    окне g:
+      - поставить u в свободный остаток g;
+      - переложить событие x из g в другое окно и поставить u на его место;
+      - заменить x на u, если u весит больше.
+    Каждый ход строго увеличивает вес раскладки, поэтому поиск конечен.
+    """
+    assign = list(assign)
+    rest = list(caps)
+    members: List[List[int]] = [[] for _ in caps]
+    for i, g in enumerate(assign):
+        if g != _UNPLACED:
+            rest[g] -= durations[i]
+            members[g].append(i)
+
+    improved = True
+    while improved:
+        improved = False
+
+        seen = set()
+        candidates = []
+        for i, g in enumerate(assign):
+            key = (durations[i], weights[i])
+            if g == _UNPLACED and key not in seen:
+                seen.add(key)
+                candidates.append(i)
+        candidates.sort(key=lambda i: weights[i], reverse=True)
+
+        for u in candidates:
+            if time.perf_counter() >= stop_at:
+                return assign
+            if _improve(u, assign, rest, members, durations, weights):
+                improved = True
+                break
+
+    return assign
+
+
+def _improve(
+    u: int,
+    assign: List[int],
+    rest: List[int],
+    members: List[List[int]],
+    durations: List[int],
+    weights: List[Tuple[int, int]],
+) -> bool:
+    duration = durations[u]
+
+    for g, free in enumerate(rest):
+        if free >= duration:
+            _move(u, g, assign, rest, members, durations)
+            return True
+
+    for g, free in enumerate(rest):
+        need = duration - free
+        # самое короткое событие окна, после которого u влезет
+        for x in sorted(members[g], key=lambda x: durations[x]):
+            if durations[x] < need:
+                continue
+            h = next((h for h, f in enumerate(rest) if h != g and f >= durations[x]), None)
+            if h is not None:
+                _move(x, h, assign, rest, members, durations)
+                _move(u, g, assign, rest, members, durations)
+                return True
+            break
+
+    for g, free in enumerate(rest):
+        need = duration - free
+        lighter = [x for x in members[g] if durations[x] >= need and weights[x] < weights[u]]
+        if lighter:
+            x = min(lighter, key=lambda x: weights[x])
+            _move(x, _UNPLACED, assign, rest, members, durations)
+            _move(u, g, assign, rest, members, durations)
+            return True
+
+    return False
+
+
+def _move(
+    i: int,
+    g: int,
+    assign: List[int],
+    rest: List[int],
+    members: List[List[int]],
+    durations: List[int],
+) -> None:
+    old = assign[i]
+    if old != _UNPLACED:
+        rest[old] += durations[i]
+        members[old].remove(i)
+    assign[i] = g
+    if g != _UNPLACED:
+        rest[g] -= durations[i]
+        members[g].append(i)
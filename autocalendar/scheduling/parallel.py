@@ -0,0 +1,209 @@
+"""
+Параллельное планирование по неделям (autoschedule(..., executor=...)).
+
+Дни зависят друг от друга только через перенос на следующий день.
+Поэтому каждая неделя (с понедельника) сначала планируется в пуле
+независимо, как будто переноса в неё нет. Затем последовательный
+проход сшивает недели. Неделя без входящего переноса берётся как есть.
+Неделю с переносом проход перепланирует с начала, пока перенос после
+очередного дня не совпадёт с независимым планом: дальше неделя та же.
+"""
+from __future__ import annotations
+
+from bisect import bisect_right
+from concurrent.futures import Executor
+from datetime import date, timedelta
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from autocalendar.executors import ExecutorSpec, make_pool
+
+from .constraints import WorkDay
+from .overflow import CarryPool
+from .scheduler import plan_days
+from .slots import from_minutes, to_minutes
+from .types import Event, ScheduledEvent
+from .work_calendar import WorkCalendar
+
+WEEK = timedelta(days=7)
+
+# (день, расписание дня, перенос после него)
+DayPlan = Tuple[date, List[ScheduledEvent], Tuple[Event, ...]]
+
+
+def schedule_by_weeks(
+    events_by_date: Dict[date, List[Event]],
+    work_day: Union[WorkDay, WorkCalendar],
+    *,
+    engine: str = "python",
+    executor: ExecutorSpec,
+    max_workers: Optional[int] = None,
+) -> List[ScheduledEvent]:
+    weeks: Dict[date, Dict[date, List[Event]]] = {}
+    for day, day_events in events_by_date.items():
+        weeks.setdefault(day - timedelta(days=day.weekday()), {})[day] = day_events
+    starts = sorted(weeks)
+
+    items = [(start, weeks[start]) for start in starts]
+    plan = partial(plan_week, work_day=work_day, engine=engine)
+    plans = _plan_weeks(items, plan, executor, max_workers)
+
+    result: List[ScheduledEvent] = []
+    carry = CarryPool()
+    last: date | None = None  # последний спланированный день
+
+    for (start, week), plan in zip(items, plans):
+        if carry:
+            # перенос идёт через дни без событий до начала недели
+            for day, day_result in plan_days({}, work_day, carry, engine=engine,
+                                             after=last, until=start):
+                result.extend(day_result)
+                last = day
+            if carry:
+                last = start - timedelta(days=1)
+
+        if not carry:
+            for _, day_result, _ in plan:
+                result.extend(day_result)
+            carry = CarryPool(plan[-1][2])
+            last = plan[-1][0]
+            continue
+
+        days = [day for day, _, _ in plan]
+        for day, day_result in plan_days(week, work_day, carry, engine=engine,
+                                         after=start - timedelta(days=1), until=start + WEEK):
+            result.extend(day_result)
+            last = day
+
+            # перенос, который был бы после day в независимом плане недели
+            k = bisect_right(days, day)
+            if carry.pending() == (plan[k - 1][2] if k else ()):
+                for _, day_result, _ in plan[k:]:
+                    result.extend(day_result)
+                carry = CarryPool(plan[-1][2])
+                last = max(day, plan[-1][0])
+                break
+        else:
+            if carry:
+                last = start + WEEK - timedelta(days=1)
+
+    if carry:
+        for _, day_result in plan_days({}, work_day, carry, engine=engine, after=last):
+            result.extend(day_result)
+
+    return result
+
+
+def plan_week(
+    item: Tuple[date, Dict[date, List[Event]]],
+    *,
+    work_day: Union[WorkDay, WorkCalendar],
+    engine: str,
+) -> List[DayPlan]:
+    """
+    Независимый план недели: без входящего переноса, до воскресенья.
+    """
+    start, week = item
+    carry = CarryPool()
+    return [
+        (day, day_result, carry.pending())
+        for day, day_result in plan_days(week, work_day, carry, engine=engine, until=start + WEEK)
+    ]
+
+
+def _plan_weeks(
+    items: List[Tuple[date, Dict[date, List[Event]]]],
+    plan: Callable[[Tuple[date, Dict[date, List[Event]]]], List[DayPlan]],
+    executor: ExecutorSpec,
+    max_workers: Optional[int],
+) -> List[List[DayPlan]]:
+    if isinstance(executor, Executor):
+        return _map_weeks(executor, items, plan)
+
+    with make_pool(executor, max_workers) as pool:
+        return _map_weeks(pool, items, plan)
+
+
+def _map_weeks(
+    pool: Executor,
+    items: List[Tuple[date, Dict[date, List[Event]]]],
+    plan: Callable[[Tuple[date, Dict[date, List[Event]]]], List[DayPlan]],
+) -> List[List[DayPlan]]:
+    from concurrent.futures import ProcessPoolExecutor
+
+    if not isinstance(pool, ProcessPoolExecutor):
+        return list(pool.map(plan, items))
+
+    # в процессы и обратно — кортежи из чисел и строк: pickle датаклассов
+    # со slots стоит ~10 мкс на объект и съедал весь выигрыш
+    packed = [_pack_week(start, week) for start, week in items]
+    plans = pool.map(partial(_plan_packed_week, plan=plan), packed)
+    return [_unpack_plan(day_plans, week) for (_, week), day_plans in zip(items, plans)]
+
+
+# Событие в упаковке: (title, date.toordinal(), минута начала или -1, duration, priority,
+# deadline.toordinal() или -1)
+PackedEvent = Tuple[str, int, int, int, int, int]
+# План дня в упаковке: (ordinal, [(title, минута, duration, priority, срок или -1)],
+# индексы переноса)
+PackedDayPlan = Tuple[int, List[Tuple[str, int, int, int, int]], Tuple[int, ...]]
+
+
+def _pack_week(start: date, week: Dict[date, List[Event]]) -> Tuple[int, List[PackedEvent]]:
+    return start.toordinal(), [
+        (e.title, e.date.toordinal(), -1 if e.time is None else to_minutes(e.time), e.duration, e.priority,
+         _pack_date(e.deadline))
+        for day_events in week.values()
+        for e in day_events
+    ]
+
+
+def _plan_packed_week(
+    packed: Tuple[int, List[PackedEvent]],
+    *,
+    plan: Callable[[Tuple[date, Dict[date, List[Event]]]], List[DayPlan]],
+) -> List[PackedDayPlan]:
+    start, rows = packed
+    events = [
+        Event(title, date.fromordinal(day), None if minute < 0 else from_minutes(minute), duration, priority,
+              _unpack_date(deadline))
+        for title, day, minute, duration, priority, deadline in rows
+    ]
+    index = {id(event): i for i, event in enumerate(events)}
+
+    week: Dict[date, List[Event]] = {}
+    for event in events:
+        week.setdefault(event.date, []).append(event)
+
+    return [
+        (
+            day.toordinal(),
+            [(e.title, to_minutes(e.time), e.duration, e.priority, _pack_date(e.deadline))
+             for e in day_result],
+            tuple(index[id(event)] for event in carry_out),
+        )
+        for day, day_result, carry_out in plan((date.fromordinal(start), week))
+    ]
+
+
+def _unpack_plan(plan: List[PackedDayPlan], week: Dict[date, List[Event]]) -> List[DayPlan]:
+    # индексы переноса — в том же порядке событий, что и при упаковке
+    events = [event for day_events in week.values() for event in day_events]
+    result = []
+    for ordinal, day_result, carry_out in plan:
+        day = date.fromordinal(ordinal)
+        result.append((
+            day,
+            [ScheduledEvent(title, day, from_minutes(minute), duration, priority, _unpack_date(deadline))
+             for title, minute, duration, priority, deadline in day_result],
+            tuple(events[i] for i in carry_out),
+        ))
+    return result
+
+
+def _pack_date(day: Optional[date]) -> int:
+    return -1 if day is None else day.toordinal()
+
+
+def _unpack_date(ordinal: int) -> Optional[date]:
+    return None if ordinal < 0 else date.fromordinal(ordinal)
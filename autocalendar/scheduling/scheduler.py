@@ -1,81 +1,254 @@
-from collections import defaultdict, deque
-from datetime import date, time as time_type
-from typing import List
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from heapq import heapify, heappop
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from autocalendar.executors import ExecutorSpec
 
 from .types import Event, ScheduledEvent
 from .constraints import WorkDay
-from .slots import build_free_slots, can_fit, consume
-from .sorter import sort_flexible_events
-from .overflow import handle_overflow
+from .slots import SlotIndex, busy_minutes, free_gaps, from_minutes
+from .overflow import CarryPool
+from .conflicts import Conflict, day_conflicts
+from .work_calendar import MINUTES_PER_DAY, WorkCalendar, as_calendar
 
 
 def autoschedule(
     events: List[Event],
-    work_day: WorkDay
+    work_day: Union[WorkDay, WorkCalendar],
+    *,
+    engine: str = "python",
+    conflicts: List[Conflict] | None = None,
+    executor: ExecutorSpec = None,
+    max_workers: Optional[int] = None,
+    pack_budget: Optional[float] = None,
+    missed_deadlines: List[ScheduledEvent] | None = None,
 ) -> List[ScheduledEvent]:
+    """
+    work_day — одни и те же рабочие часы на каждый день или WorkCalendar
+    с выходными, праздниками и окнами по датам. Перенос с календарём идёт
+    сразу на ближайший рабочий день, где есть окно на самое короткое
+    из ждущих событий (см. WorkCalendar.next_working_day).
+
+    engine — как искать свободные окна дня, на результат не влияет:
+        "python" — SlotIndex по окнам из free_gaps (по умолчанию)
+        "numpy"  — окна всех дней строятся векторно за один проход
+                   (нужен numpy); выгоден на плотных календарях с сотней
+                   и больше фиксированных событий в день
+
+    conflicts — если передан список, в него по дням дописываются
+    конфликты фиксированных событий (см. day_conflicts): пересечения
+    и выход за рабочий день. Расписание от этого не меняется.
+
+    Гибкие события ждут места в одном пуле на весь горизонт: сначала
+    ближайший срок (Event.deadline), потом приоритет и длительность.
+    missed_deadlines — если передан список, в него дописываются
+    размещённые позже своего срока (ScheduledEvent.is_late).
+
+    executor — планировать недели параллельно (см. parallel.schedule_by_weeks):
+        None       — последовательно (по умолчанию)
+        "thread"   — ThreadPoolExecutor(max_workers)
+        "process"  — ProcessPoolExecutor(max_workers)
+        Executor   — готовый пул, не закрывается
+    Результат тот же, что у последовательного планирования.
+
+    pack_budget — как раскладывать гибкие события по окнам дня:
+        None   — жадно, first-fit в порядке приоритета (по умолчанию)
+        число  — упаковщиком (см. packing.pack_day), не больше pack_budget
+                 секунд на день: меньше переносов на следующий день,
+                 но результат зависит от того, что успелось за бюджет.
+                 Поэтому вместе с executor нельзя: сшивка недель требует,
+                 чтобы день планировался одинаково при каждом проходе
+    """
+    if pack_budget is not None and executor is not None:
+        raise ValueError("pack_budget cannot be combined with executor")
 
     events_by_date: dict[date, list[Event]] = defaultdict(list)
     for event in events:
         events_by_date[event.date].append(event)
 
-    queue = deque(sorted(events_by_date.items(), key=lambda x: x[0]))
-    result: List[ScheduledEvent] = []
-
-    while queue:
-        current_date, day_events = queue.popleft()
-
-        fixed: List[ScheduledEvent] = []
-        flexible: List[Event] = []
-
-        for event in day_events:
-            if event.time is not None:
-                fixed.append(
-                    ScheduledEvent(
-                        title=event.title,
-                        date=event.date,
-                        time=event.time,
-                        duration=event.duration,
-                        priority=event.priority,
-                    )
-                )
-            else:
-                flexible.append(event)
-
-        free_slots = build_free_slots(fixed, work_day)
-        flexible = sort_flexible_events(flexible)
-
-        overflow_events: List[Event] = []
-
-        for event in flexible:
-            placed = False
-            for i, slot in enumerate(free_slots):
-                if can_fit(slot, event.duration):
-                    scheduled = ScheduledEvent(
-                        title=event.title,
-                        date=current_date,
-                        time=slot.start,
-                        duration=event.duration,
-                        priority=event.priority,
-                    )
-                    result.append(scheduled)
-
-                    new_slot = consume(slot, event.duration)
-                    if new_slot is None:
-                        free_slots.pop(i)
-                    else:
-                        free_slots[i] = new_slot
-
-                    placed = True
-                    break
-
-            if not placed:
-                overflow_events.append(handle_overflow(event))
-
-        result.extend(fixed)
-
-        if overflow_events:
-            next_date = overflow_events[0].date
-            events_by_date[next_date].extend(overflow_events)
-            queue.append((next_date, events_by_date[next_date]))
-
+    longest = max((e.duration for e in events if e.time is None), default=None)
+    if longest is not None:
+        check_fits_work_day(longest, work_day)
+
+    calendar = as_calendar(work_day)
+
+    if conflicts is not None:
+        fixed_by_date = _fixed_by_date(events_by_date)
+        for day in sorted(fixed_by_date):
+            conflicts.extend(day_conflicts(fixed_by_date[day], *calendar.bounds(day)))
+
+    if executor is not None:
+        from .parallel import schedule_by_weeks
+        result = schedule_by_weeks(events_by_date, calendar, engine=engine,
+                                   executor=executor, max_workers=max_workers)
+    else:
+        result = []
+        for _, day_result in plan_days(events_by_date, calendar, CarryPool(), engine=engine,
+                                       pack_budget=pack_budget):
+            result.extend(day_result)
+
+    if missed_deadlines is not None:
+        missed_deadlines.extend(event for event in result if event.is_late())
     return result
+
+
+def plan_days(
+    events_by_date: Dict[date, List[Event]],
+    work_day: Union[WorkDay, WorkCalendar],
+    carry: CarryPool,
+    *,
+    engine: str = "python",
+    after: date | None = None,
+    until: date | None = None,
+    pack_budget: Optional[float] = None,
+) -> Iterator[Tuple[date, List[ScheduledEvent]]]:
+    """
+    Планирует дни по возрастанию даты и отдаёт (день, расписание дня)
+    по одному: сначала размещённые гибкие, потом фиксированные.
+
+    carry — пул переноса на день после after; после каждого дня в нём
+    остаётся перенос на следующий. Дни с until и позже не планируются,
+    перенос на них остаётся в пуле.
+
+    pack_budget — см. autoschedule.
+    """
+    calendar = as_calendar(work_day)
+    fixed_by_date = _fixed_by_date(events_by_date)
+    day_slots = _slot_factory(
+        engine,
+        {day: busy_minutes(fixed) for day, fixed in fixed_by_date.items()},
+        calendar,
+    )
+
+    # каждый день обрабатывается ровно один раз, по возрастанию даты:
+    # пока в пуле есть перенос, следующий день — ближайший рабочий, где
+    # влезет хотя бы самое короткое событие пула (в пропущенных днях
+    # ничего бы не разместилось), иначе — ближайшая дата с событиями
+    pending = [
+        day for day in events_by_date
+        if (after is None or day > after) and (until is None or day < until)
+    ]
+    heapify(pending)
+    current_date = after
+
+    while pending or carry:
+        if carry:
+            current_date = calendar.next_working_day(current_date + timedelta(days=1), carry.shortest())
+            if pending and pending[0] < current_date:
+                current_date = pending[0]
+            if until is not None and current_date >= until:
+                return
+            if pending and pending[0] == current_date:
+                heappop(pending)
+        else:
+            current_date = heappop(pending)
+
+        # первый подходящий слот ищется по индексу за O(log слотов),
+        # а не проходом по списку с начала для каждого события;
+        # внутри — целые минуты, time создаётся только для результата
+        free_slots = day_slots(current_date)
+        carry.add(e for e in events_by_date.get(current_date, ()) if e.time is None)
+
+        day_result = place_day(current_date, free_slots, carry, pack_budget)
+        day_result.extend(fixed_by_date.get(current_date, ()))
+        yield current_date, day_result
+
+
+def place_day(
+    day: date,
+    free_slots: SlotIndex,
+    carry: CarryPool,
+    pack_budget: Optional[float] = None,
+) -> List[ScheduledEvent]:
+    """
+    Раскладывает пул по свободным окнам дня day; что не влезло,
+    остаётся в пуле. С pack_budget — упаковщиком, бюджет отсчитывается
+    от начала дня.
+    """
+    if pack_budget is None:
+        placed = carry.place(free_slots)
+    else:
+        placed = carry.pack(free_slots, time.perf_counter() + pack_budget)
+
+    return [
+        ScheduledEvent(
+            title=event.title,
+            date=day,
+            time=from_minutes(start),
+            duration=event.duration,
+            priority=event.priority,
+            deadline=event.deadline,
+        )
+        for start, event in placed
+    ]
+
+
+def check_fits_work_day(duration: int, work_day: Union[WorkDay, WorkCalendar]) -> None:
+    # событие, которое не влезает даже в пустой рабочий день,
+    # переносилось бы бесконечно
+    if isinstance(work_day, WorkCalendar):
+        if duration > work_day.longest_regular_window():
+            raise ValueError(
+                f"flexible event of {duration} min does not fit into any regular "
+                f"working window of the calendar"
+            )
+        return
+
+    if duration > work_day.duration_minutes() or not work_day.is_valid():
+        raise ValueError(
+            f"flexible event of {duration} min does not fit into the work day "
+            f"{work_day.start:%H:%M}-{work_day.end:%H:%M}"
+        )
+
+
+def _fixed_by_date(events_by_date: Dict[date, List[Event]]) -> Dict[date, List[ScheduledEvent]]:
+    fixed_by_date: Dict[date, List[ScheduledEvent]] = {}
+    for day, day_events in events_by_date.items():
+        fixed = [
+            ScheduledEvent(
+                title=event.title,
+                date=event.date,
+                time=event.time,
+                duration=event.duration,
+                priority=event.priority,
+                deadline=event.deadline,
+            )
+            for event in day_events
+            if event.time is not None
+        ]
+        if fixed:
+            fixed_by_date[day] = fixed
+    return fixed_by_date
+
+
+def _slot_factory(
+    engine: str,
+    busy_by_date: Dict[date, List[Tuple[int, int]]],
+    calendar: WorkCalendar,
+) -> Callable[[date], SlotIndex]:
+    window = calendar.uniform_window()
+
+    if engine == "python":
+        if window is not None:
+            day_start, day_end = window
+            return lambda day: SlotIndex(free_gaps(busy_by_date.get(day, ()), day_start, day_end))
+        return lambda day: SlotIndex(calendar.free_gaps(day, busy_by_date.get(day, ())))
+
+    if engine == "numpy":
+        # numpy — необязательная зависимость: импортируем, только когда выбран
+        from .numpy_engine import occupancy_slots
+        if window is not None:
+            return occupancy_slots(busy_by_date, *window)
+
+        # окна по датам: нерабочее время дня — ещё одни занятые интервалы
+        # на всех сутках; дни без фиксированных событий — просто окна календаря
+        day_slots = occupancy_slots(
+            {day: busy + calendar.closed(day) for day, busy in busy_by_date.items()},
+            0,
+            MINUTES_PER_DAY,
+        )
+        return lambda day: day_slots(day) if day in busy_by_date else SlotIndex(calendar.windows(day))
+
+    raise ValueError(f"Unknown engine: {engine!r}")
@@ -1,16 +1,59 @@
 from datetime import time
-from typing import List
+from typing import Iterable, List, Optional, Tuple
 
 from .types import TimeSlot, ScheduledEvent
 from .constraints import WorkDay
 
 
-def _to_minutes(t: time) -> int:
+# Внутри планировщик считает в целых минутах от полуночи; time появляется
+# только на границе API. Все 24 * 60 значений готовы заранее — перевод
+# минут во время ничего не создаёт.
+_TIMES = tuple(time(m // 60, m % 60) for m in range(24 * 60))
+
+Gap = Tuple[int, int]  # свободное окно [start, end) в минутах от полуночи
+
+
+def to_minutes(t: time) -> int:
     return t.hour * 60 + t.minute
 
 
-def _from_minutes(m: int) -> time:
-    return time(m // 60, m % 60)
+def from_minutes(m: int) -> time:
+    return _TIMES[m]
+
+
+def free_gaps(
+    busy: Iterable[Tuple[int, int]],
+    day_start: int,
+    day_end: int,
+) -> List[Gap]:
+    """
+    Свободные окна рабочего дня [day_start, day_end) между занятыми
+    интервалами busy — (начало, конец) в минутах, в любом порядке.
+    Окна не выходят за рабочий день, пустые интервалы ничего не занимают.
+    """
+    gaps: List[Gap] = []
+    cursor = day_start
+
+    for start, end in sorted(busy, key=lambda interval: interval[0]):
+        if end <= start:
+            continue
+        stop = min(start, day_end)
+        if cursor < stop:
+            gaps.append((cursor, stop))
+        cursor = max(cursor, end)
+
+    if cursor < day_end:
+        gaps.append((cursor, day_end))
+
+    return gaps
+
+
+def busy_minutes(fixed_events: Iterable[ScheduledEvent]) -> List[Tuple[int, int]]:
+    result = []
+    for event in fixed_events:
+        start = to_minutes(event.time)
+        result.append((start, start + event.duration))
+    return result
 
 
 def build_free_slots(
@@ -20,34 +63,12 @@ def build_free_slots(
     if not fixed_events:
         return [TimeSlot(work_day.start, work_day.end)]
 
-    fixed_events = sorted(fixed_events, key=lambda e: _to_minutes(e.time))
-    slots: List[TimeSlot] = []
-
-    cursor = _to_minutes(work_day.start)
-
-    for event in fixed_events:
-        start = _to_minutes(event.time)
-        end = start + event.duration
-
-        if cursor < start:
-            slots.append(
-                TimeSlot(
-                    start=_from_minutes(cursor),
-                    end=_from_minutes(start)
-                )
-            )
-        cursor = max(cursor, end)
-
-    work_end = _to_minutes(work_day.end)
-    if cursor < work_end:
-        slots.append(
-            TimeSlot(
-                start=_from_minutes(cursor),
-                end=_from_minutes(work_end)
-            )
-        )
-
-    return slots
+    gaps = free_gaps(
+        busy_minutes(fixed_events),
+        to_minutes(work_day.start),
+        to_minutes(work_day.end),
+    )
+    return [TimeSlot(start=from_minutes(start), end=from_minutes(end)) for start, end in gaps]
 
 
 def can_fit(slot: TimeSlot, duration: int) -> bool:
@@ -55,13 +76,115 @@ def can_fit(slot: TimeSlot, duration: int) -> bool:
 
 
 def consume(slot: TimeSlot, duration: int) -> TimeSlot | None:
-    new_start = _to_minutes(slot.start) + duration
-    end = _to_minutes(slot.end)
+    new_start = to_minutes(slot.start) + duration
+    end = to_minutes(slot.end)
 
     if new_start >= end:
         return None
 
     return TimeSlot(
-        start=_from_minutes(new_start),
+        start=from_minutes(new_start),
         end=slot.end
     )
+
+
+# Ёмкость окна, которое уже занято целиком: меньше любой длительности,
+# такое окно first_fit не находит
+_REMOVED = -1
+
+
+class SlotIndex:
+    """
+    Свободные окна дня с поиском первого подходящего за O(log n).
+
+    Дерево отрезков по ёмкостям окон (в минутах) в порядке их начала:
+    в узле — максимум ёмкостей поддерева. «Первое окно, куда влезает d» —
+    спуск от корня всегда в самое левое поддерево с максимумом >= d.
+    Результат тот же, что у прохода по списку слотов с can_fit/consume:
+    окна не делятся и не переставляются, размещение только сдвигает начало.
+
+    Всё в целых минутах от полуночи (см. free_gaps), без объектов time.
+    """
+
+    __slots__ = ("_starts", "_size", "_tree")
+
+    def __init__(self, gaps: Iterable[Gap]):
+        gaps = list(gaps)
+        self._starts = [start for start, _ in gaps]
+
+        size = 1
+        while size < len(gaps):
+            size *= 2
+        self._size = size
+
+        tree = [_REMOVED] * (2 * size)
+        for i, (start, end) in enumerate(gaps):
+            tree[size + i] = end - start
+        for node in range(size - 1, 0, -1):
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+        self._tree = tree
+
+    @classmethod
+    def from_slots(cls, slots: Iterable[TimeSlot]) -> "SlotIndex":
+        return cls((to_minutes(s.start), to_minutes(s.end)) for s in slots)
+
+    def first_fit(self, duration: int) -> Optional[int]:
+        """
+        Индекс первого окна, куда влезает duration; None — такого нет.
+        """
+        tree = self._tree
+        if tree[1] < duration:
+            return None
+
+        node = 1
+        while node < self._size:
+            node *= 2
+            if tree[node] < duration:
+                node += 1
+        return node - self._size
+
+    def largest(self) -> int:
+        """
+        Ёмкость самого большого свободного окна; -1, если окон не осталось.
+        """
+        return self._tree[1]
+
+    def place(self, duration: int) -> Optional[int]:
+        """
+        Занимает начало первого подходящего окна; возвращает минуту начала
+        события или None, если события в этот день не поместить.
+        """
+        i = self.first_fit(duration)
+        if i is None:
+            return None
+
+        start = self._starts[i]
+        self._starts[i] = start + duration
+
+        capacity = self._tree[self._size + i] - duration
+        # как consume: окно, от которого ничего не осталось, убирается
+        self._update(i, capacity if capacity > 0 else _REMOVED)
+        return start
+
+    def free_gaps(self) -> List[Gap]:
+        """
+        Оставшиеся свободные окна в порядке начала.
+        """
+        tree, size = self._tree, self._size
+        return [
+            (start, start + tree[size + i])
+            for i, start in enumerate(self._starts)
+            if tree[size + i] != _REMOVED
+        ]
+
+    def _update(self, i: int, capacity: int) -> None:
+        tree = self._tree
+        node = self._size + i
+        tree[node] = capacity
+        node //= 2
+        while node:
+            best = max(tree[2 * node], tree[2 * node + 1])
+            if tree[node] == best:
+                break
+            tree[node] = best
+            node //= 2
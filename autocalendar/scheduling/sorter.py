@@ -1,10 +1,14 @@
-from typing import List
+from datetime import date
+from typing import List, Tuple
 
 from .types import Event
 
 
+def flexible_sort_key(event: Event) -> Tuple[date, int, int]:
+    # сначала ближайший срок, без срока — после всех со сроком;
+    # дальше приоритет и длительность, как раньше
+    return (event.deadline or date.max, -event.priority, -event.duration)
+
+
 def sort_flexible_events(events: List[Event]) -> List[Event]:
-    return sorted(
-        events,
-        key=lambda e: (-e.priority, -e.duration)
-    )
+    return sorted(events, key=flexible_sort_key)
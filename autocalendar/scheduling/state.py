@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from bisect import insort
+from dataclasses import dataclass, field, replace
+from datetime import date, time, timedelta
+from typing import Dict, List, Optional, Tuple, Union
+
+from .constraints import WorkDay
+from .overflow import CarryPool
+from .scheduler import check_fits_work_day, place_day
+from .slots import Gap, SlotIndex, busy_minutes
+from .types import Event, ScheduledEvent
+from .work_calendar import WorkCalendar, as_calendar
+
+
+@dataclass(slots=True)
+class _Day:
+    gaps: List[Gap]                                     # окна между фиксированными
+    ids: List[int] = field(default_factory=list)        # свои события, по возрастанию id
+    placed: List[ScheduledEvent] = field(default_factory=list)
+    carry_out: Tuple[Event, ...] = ()                   # перенос на следующий день
+
+
+class ScheduleState:
+    """
+    Расписание, которое правится по одному событию: add, remove и move
+    пересчитывают только изменённый день и цепочку переноса за ним,
+    пока перенос на следующий день не совпадёт с прежним.
+
+    Результат всегда тот же, что autoschedule(state.events(), work_day):
+    события идут в порядке id, перемещённое событие id сохраняет.
+    """
+
+    def __init__(self, work_day: Union[WorkDay, WorkCalendar]):
+        self.work_day = work_day
+        self._calendar = as_calendar(work_day)
+        self._events: Dict[int, Event] = {}
+        self._days: Dict[date, _Day] = {}
+        self._next_id = 0
+
+    def add(self, event: Event) -> int:
+        """
+        Добавляет событие и возвращает его id.
+        """
+        if event.time is None:
+            check_fits_work_day(event.duration, self.work_day)
+
+        event_id = self._next_id
+        self._next_id += 1
+        self._events[event_id] = event
+        self._attach(event_id, event)
+        self._replan(event.date)
+        return event_id
+
+    def remove(self, event_id: int) -> Event:
+        event = self._events.pop(event_id)
+        self._detach(event_id, event)
+        self._replan(event.date)
+        return event
+
+    def move(self, event_id: int, day: date, at: Optional[time]) -> Event:
+        """
+        Переносит событие на day: на время at или, если at = None,
+        делает его гибким.
+        """
+        old = self._events[event_id]
+        new = replace(old, date=day, time=at)
+        if new.time is None:
+            check_fits_work_day(new.duration, self.work_day)
+
+        self._detach(event_id, old)
+        self._events[event_id] = new
+        self._attach(event_id, new)
+        for changed in sorted({old.date, new.date}):
+            self._replan(changed)
+        return new
+
+    def events(self) -> List[Event]:
+        return list(self._events.values())
+
+    def schedule(self) -> List[ScheduledEvent]:
+        """
+        Расписание в том же порядке, что у autoschedule.
+        """
+        result: List[ScheduledEvent] = []
+        for day in sorted(self._days):
+            record = self._days[day]
+            result.extend(record.placed)
+            result.extend(self._fixed(day, record))
+        return result
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def _attach(self, event_id: int, event: Event) -> None:
+        record = self._days.get(event.date)
+        if record is None:
+            record = self._days[event.date] = self._new_day(event.date)
+        insort(record.ids, event_id)
+        if event.time is not None:
+            self._refresh_gaps(event.date, record)
+
+    def _detach(self, event_id: int, event: Event) -> None:
+        record = self._days[event.date]
+        record.ids.remove(event_id)
+        if event.time is not None:
+            self._refresh_gaps(event.date, record)
+
+    def _new_day(self, day: date) -> _Day:
+        return _Day(gaps=list(self._calendar.windows(day)))
+
+    def _refresh_gaps(self, day: date, record: _Day) -> None:
+        record.gaps = self._calendar.free_gaps(day, busy_minutes(self._fixed(day, record)))
+
+    def _fixed(self, day: date, record: _Day) -> List[ScheduledEvent]:
+        fixed = []
+        for event_id in record.ids:
+            event = self._events[event_id]
+            if event.time is not None:
+                fixed.append(ScheduledEvent(event.title, day, event.time, event.duration, event.priority,
+                                            event.deadline))
+        return fixed
+
+    def _replan(self, day: date) -> None:
+        # как в autoschedule: день получает перенос только от вчерашнего;
+        # один пул идёт по всей цепочке, как в autoschedule
+        previous = self._days.get(day - timedelta(days=1))
+        carry = CarryPool(previous.carry_out if previous is not None else ())
+
+        while True:
+            record = self._days.get(day)
+            if record is None:
+                if not carry:
+                    return
+                record = self._days[day] = self._new_day(day)
+
+            if not record.ids and not carry:
+                # день держался только на переносе, которого больше нет
+                del self._days[day]
+                if not record.carry_out:
+                    return
+                day += timedelta(days=1)
+                continue
+
+            carry.add(self._events[i] for i in record.ids if self._events[i].time is None)
+            record.placed = place_day(day, SlotIndex(record.gaps), carry)
+
+            carry_out = carry.pending()
+            # дальше всё посчитано с тем же переносом — пересчитывать нечего
+            unchanged = carry_out == record.carry_out
+            record.carry_out = carry_out
+            if unchanged:
+                return
+            day += timedelta(days=1)
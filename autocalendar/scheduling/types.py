@@ -4,22 +4,26 @@ from dataclasses import dataclass
 from datetime import date, time
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Event:
     """
     Входное событие.
 
     time = None  → событие гибкое, требует автопланирования
     time != None → событие жёсткое, фиксировано пользователем
+
+    deadline — последний день, когда гибкое событие ещё не опоздало;
+    None — срока нет.
     """
     title: str
     date: date
     time: time | None
     duration: int          # длительность в минутах
     priority: int          # чем больше — тем важнее
+    deadline: date | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScheduledEvent:
     """
     Результат автопланирования.
@@ -30,9 +34,13 @@ class ScheduledEvent:
     time: time
     duration: int
     priority: int
+    deadline: date | None = None
+
+    def is_late(self) -> bool:
+        return self.deadline is not None and self.date > self.deadline
 
 
-@dataclass
+@dataclass(slots=True)
 class TimeSlot:
     """
     Свободный временной интервал внутри рабочего дня.
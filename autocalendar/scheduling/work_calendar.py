@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from datetime import date, time, timedelta
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from .constraints import WorkDay
+from .slots import Gap, free_gaps, to_minutes
+
+MINUTES_PER_DAY = 24 * 60
+ONE_DAY = timedelta(days=1)
+
+# Рабочие часы: WorkDay или окна (начало, конец) — например,
+# [(time(9, 0), time(13, 0)), (time(14, 0), time(18, 0))] с обедом
+Hours = Union[WorkDay, Iterable[Union[WorkDay, Tuple[time, time]]]]
+
+
+class WorkCalendar:
+    """
+    Рабочее время по датам: окна обычного рабочего дня, выходные дни
+    недели (0 — понедельник), праздники и особые даты со своими окнами.
+    Окна хранятся в минутах от полуночи, по возрастанию, без пересечений.
+
+    next_working_day(day, duration) не перебирает дни по одному:
+    обычные дни повторяются по неделе, а по особым датам (праздники
+    и dates) заранее построено дерево максимумов самого длинного окна
+    в порядке дат — первая подходящая дата находится за O(log n).
+    """
+
+    __slots__ = ("_week", "_largest", "_dates", "_special", "_size", "_tree")
+
+    def __init__(
+        self,
+        hours: Hours,
+        *,
+        weekends: Iterable[int] = (5, 6),
+        holidays: Iterable[date] = (),
+        dates: Optional[Mapping[date, Hours]] = None,
+    ):
+        """
+        dates — особые часы на конкретные даты; пустые окна — выходной.
+        Дата из dates важнее праздника: так задаётся рабочая суббота.
+        """
+        windows = _windows(hours)
+        off = set(weekends)
+        self._week: Tuple[Tuple[Gap, ...], ...] = tuple(
+            () if weekday in off else windows for weekday in range(7)
+        )
+        self._largest = tuple(_largest(day_windows) for day_windows in self._week)
+
+        self._dates: Dict[date, Tuple[Gap, ...]] = {day: () for day in holidays}
+        for day, day_hours in (dates or {}).items():
+            self._dates[day] = _windows(day_hours)
+
+        self._special: List[date] = sorted(self._dates)
+        size = 1
+        while size < len(self._special):
+            size *= 2
+        self._size = size
+
+        tree = [-1] * (2 * size)
+        for i, day in enumerate(self._special):
+            tree[size + i] = _largest(self._dates[day])
+        for node in range(size - 1, 0, -1):
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+        self._tree = tree
+
+    @classmethod
+    def from_work_day(cls, work_day: WorkDay) -> WorkCalendar:
+        """
+        Календарь без выходных: каждый день — work_day, как у autoschedule.
+        """
+        return cls(work_day, weekends=())
+
+    def windows(self, day: date) -> Tuple[Gap, ...]:
+        special = self._dates.get(day)
+        return special if special is not None else self._week[day.weekday()]
+
+    def is_working_day(self, day: date) -> bool:
+        return bool(self.windows(day))
+
+    def bounds(self, day: date) -> Gap:
+        """
+        Начало первого и конец последнего окна дня; в нерабочий день —
+        все сутки.
+        """
+        windows = self.windows(day)
+        if not windows:
+            return 0, MINUTES_PER_DAY
+        return windows[0][0], windows[-1][1]
+
+    def free_gaps(self, day: date, busy: Iterable[Tuple[int, int]]) -> List[Gap]:
+        """
+        Свободные окна дня между занятыми интервалами busy (см. slots.free_gaps).
+        """
+        windows = self.windows(day)
+        if len(windows) == 1:
+            return free_gaps(busy, *windows[0])
+
+        busy = list(busy)
+        gaps: List[Gap] = []
+        for start, end in windows:
+            gaps.extend(free_gaps(busy, start, end))
+        return gaps
+
+    def closed(self, day: date) -> List[Gap]:
+        """
+        Нерабочие интервалы суток: всё, что вне окон дня.
+        """
+        result, cursor = [], 0
+        for start, end in self.windows(day):
+            if cursor < start:
+                result.append((cursor, start))
+            cursor = end
+        if cursor < MINUTES_PER_DAY:
+            result.append((cursor, MINUTES_PER_DAY))
+        return result
+
+    def uniform_window(self) -> Optional[Gap]:
+        """
+        Единственное окно, если оно одно и то же каждый день (как у WorkDay);
+        иначе None.
+        """
+        first = self._week[0]
+        if self._dates or len(first) != 1 or any(windows != first for windows in self._week):
+            return None
+        return first[0]
+
+    def longest_regular_window(self) -> int:
+        """
+        Самое длинное окно среди обычных дней недели: событие длиннее
+        рано или поздно не найдёт места ни в какой день.
+        """
+        return max(self._largest)
+
+    def next_working_day(self, day: date, duration: int = 1) -> Optional[date]:
+        """
+        Первый день не раньше day, где есть окно хотя бы на duration минут;
+        None — такого дня нет и не будет.
+        """
+        special = self._first_special(bisect_left(self._special, day), duration)
+
+        regular = self._next_regular(day, duration)
+        # обычный день, который оказался особой датой, не в счёт
+        while regular is not None and regular in self._dates and (special is None or regular < special):
+            regular = self._next_regular(regular + ONE_DAY, duration)
+
+        if special is None:
+            return regular
+        if regular is None:
+            return special
+        return min(regular, special)
+
+    def _next_regular(self, day: date, duration: int) -> Optional[date]:
+        weekday = day.weekday()
+        for offset in range(7):
+            if self._largest[(weekday + offset) % 7] >= duration:
+                return day + timedelta(days=offset)
+        return None
+
+    def _first_special(self, lo: int, duration: int) -> Optional[date]:
+        # первая особая дата с номером >= lo и окном >= duration
+        if lo >= len(self._special):
+            return None
+
+        tree, size = self._tree, self._size
+        node = size + lo
+        while tree[node] < duration:
+            # правый сын — поднимаемся, пока не станем левым,
+            # и переходим к соседнему поддереву справа
+            while node & 1:
+                node >>= 1
+            if not node:
+                return None
+            node += 1
+
+        while node < size:
+            node *= 2
+            if tree[node] < duration:
+                node += 1
+        return self._special[node - size]
+
+
+def as_calendar(work_day: Union[WorkDay, WorkCalendar]) -> WorkCalendar:
+    if isinstance(work_day, WorkCalendar):
+        return work_day
+    return WorkCalendar.from_work_day(work_day)
+
+
+def _windows(hours: Hours) -> Tuple[Gap, ...]:
+    if isinstance(hours, WorkDay):
+        hours = [hours]
+
+    intervals = []
+    for window in hours:
+        start, end = (window.start, window.end) if isinstance(window, WorkDay) else window
+        start, end = to_minutes(start), to_minutes(end)
+        # пустое окно (как у WorkDay, где start >= end) ничего не добавляет
+        if start < end:
+            intervals.append((start, end))
+
+    # пересекающиеся и смежные окна склеиваются
+    merged: List[Gap] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return tuple(merged)
+
+
+def _largest(windows: Tuple[Gap, ...]) -> int:
+    return max((end - start for start, end in windows), default=0)
@@ -0,0 +1,68 @@
+import random
+from datetime import date, time
+
+from autocalendar.scheduling import Conflict, Event, ScheduledEvent, WorkDay, autoschedule, find_conflicts
+from autocalendar.scheduling.slots import from_minutes, to_minutes
+
+
+WORK_DAY = WorkDay(start=time(9, 0), end=time(18, 0))
+DAY = date(2025, 1, 1)
+
+
+def test_overlap_and_work_day_bounds():
+    a = ScheduledEvent("A", DAY, time(8, 30), 60, 1)
+    b = ScheduledEvent("B", DAY, time(9, 0), 30, 1)
+    c = ScheduledEvent("C", DAY, time(17, 30), 60, 1)
+
+    assert find_conflicts([c, b, a], WORK_DAY) == [
+        Conflict("before_start", DAY, a, None, 30),
+        Conflict("overlap", DAY, a, b, 30),
+        Conflict("after_end", DAY, c, None, 30),
+    ]
+
+
+def test_touching_events_do_not_conflict():
+    events = [
+        Event("A", DAY, time(10, 0), 60, 1),
+        Event("B", DAY, time(11, 0), 60, 1),
+        Event("Flex", DAY, None, 60, 1),
+    ]
+
+    assert find_conflicts(events, WORK_DAY) == []
+
+
+def test_autoschedule_collects_conflicts():
+    events = [
+        Event("A", DAY, time(10, 0), 60, 1),
+        Event("B", DAY, time(10, 30), 60, 1),
+        Event("Flex", DAY, None, 60, 1),
+    ]
+    conflicts = []
+
+    result = autoschedule(events, WORK_DAY, conflicts=conflicts)
+
+    assert [(c.kind, c.event.title, c.other.title, c.minutes) for c in conflicts] == [
+        ("overlap", "A", "B", 30),
+    ]
+    assert result == autoschedule(events, WORK_DAY)
+
+
+def test_overlaps_match_pairwise_check():
+    rnd = random.Random(9)
+    for _ in range(100):
+        events = []
+        for i in range(rnd.randint(0, 25)):
+            start = rnd.randrange(8 * 60, 19 * 60, 5)
+            events.append(ScheduledEvent(f"e{i}", DAY, from_minutes(start), rnd.randint(0, 120), 1))
+
+        pairs = {
+            frozenset((a.title, b.title))
+            for i, a in enumerate(events)
+            for b in events[i + 1:]
+            if max(to_minutes(a.time), to_minutes(b.time))
+            < min(to_minutes(a.time) + a.duration, to_minutes(b.time) + b.duration)
+        }
+
+        found = [c for c in find_conflicts(events, WORK_DAY) if c.kind == "overlap"]
+        assert {frozenset((c.event.title, c.other.title)) for c in found} == pairs
+        assert len(found) == len(pairs)
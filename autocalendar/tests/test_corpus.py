@@ -0,0 +1,54 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from autocalendar.benchmarks import corpus
+from autocalendar.parsing import ParseProfiler, parse_event_title
+
+
+TZ = ZoneInfo("Europe/Moscow")
+NOW = datetime(2025, 12, 10, 12, 0, tzinfo=TZ)
+
+# класс строки корпуса -> ветка datetime_from_spans, которую он обязан задеть
+EXPECTED_BRANCH = {
+    "fallback": "dateparser",
+    "relative": "relative",
+    "ddmm": "ddmm",
+    "range": "range",
+    "time": "time",
+}
+
+
+def test_generate_is_reproducible():
+    assert corpus.generate(200, seed=7) == corpus.generate(200, seed=7)
+    assert corpus.generate(200, seed=7) != corpus.generate(200, seed=8)
+
+
+def test_mix_controls_classes():
+    lines = corpus.generate(300, mix={"relative": 0, "ddmm": 0, "fallback": 0,
+                                      "time": 0, "range": 0, "duration": 0, "money": 1})
+
+    assert {line.kind for line in lines} == {"money"}
+
+
+@pytest.mark.parametrize("mix", [{"relative": 0.7, "ddmm": 0.5}, {"money": 2}, {"weather": 0.1}])
+def test_invalid_mix_is_rejected(mix):
+    with pytest.raises(ValueError):
+        corpus.generate(10, mix=mix)
+
+
+def test_combinations_cover_every_class():
+    lines = corpus.combinations()
+
+    assert {line.kind for line in lines} == set(corpus.CLASSES)
+
+
+def test_classes_match_parser_branches():
+    for line in corpus.combinations():
+        if line.kind not in EXPECTED_BRANCH:
+            continue
+        profiler = ParseProfiler()
+        parse_event_title(line.text, now=NOW, tz=TZ, profiler=profiler)
+
+        assert profiler.stats().branches[EXPECTED_BRANCH[line.kind]].calls == 1, line
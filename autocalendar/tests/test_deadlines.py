@@ -0,0 +1,89 @@
+import random
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+from autocalendar.app.service import build_schedule
+from autocalendar.inbox import Inbox
+from autocalendar.scheduling import Event, ScheduleState, WorkDay, autoschedule
+from autocalendar.scheduling.overflow import handle_overflow
+
+
+TZ = ZoneInfo("Europe/Moscow")
+WORK_DAY = WorkDay(start=time(9, 0), end=time(18, 0))
+DAY = date(2025, 12, 10)
+
+
+def test_earlier_deadline_goes_first():
+    events = [
+        Event("важная", DAY, None, 300, 3),
+        Event("срочная", DAY, None, 300, 1, deadline=DAY),
+        Event("к пятнице", DAY, None, 300, 1, deadline=DAY + timedelta(days=2)),
+    ]
+
+    schedule = autoschedule(events, WORK_DAY)
+
+    assert [(e.title, e.date) for e in schedule] == [
+        ("срочная", DAY),
+        ("к пятнице", DAY + timedelta(days=1)),
+        ("важная", DAY + timedelta(days=2)),
+    ]
+
+
+def test_missed_deadlines_are_reported():
+    events = [Event(f"e{i}", DAY, None, 240, 1, deadline=DAY) for i in range(3)]
+    missed = []
+
+    schedule = autoschedule(events, WORK_DAY, missed_deadlines=missed)
+
+    assert [e.title for e in missed] == ["e2"]
+    assert missed == [e for e in schedule if e.is_late()]
+
+
+def test_fixed_and_moved_events_keep_deadline():
+    fixed = Event("созвон", DAY + timedelta(days=1), time(10, 0), 60, 1, deadline=DAY)
+    missed = []
+
+    autoschedule([fixed], WORK_DAY, missed_deadlines=missed)
+
+    assert [e.title for e in missed] == ["созвон"]
+    assert handle_overflow(Event("e", DAY, None, 60, 1, deadline=DAY)).deadline == DAY
+
+    state = ScheduleState(WORK_DAY)
+    state.add(fixed)
+    assert [e.is_late() for e in state.schedule()] == [True]
+
+
+def test_deadlines_match_across_executors_and_state():
+    rnd = random.Random(25)
+    events = []
+    for i in range(300):
+        day = DAY + timedelta(days=rnd.randint(0, 30))
+        deadline = day + timedelta(days=rnd.randint(0, 5)) if rnd.random() < 0.5 else None
+        events.append(Event(f"e{i}", day, None, rnd.randint(15, 240), rnd.randint(1, 4), deadline=deadline))
+
+    missed, missed_thread = [], []
+    expected = autoschedule(events, WORK_DAY, missed_deadlines=missed)
+    assert autoschedule(events, WORK_DAY, executor="thread", missed_deadlines=missed_thread) == expected
+    assert missed_thread == missed
+
+    state = ScheduleState(WORK_DAY)
+    for event in events:
+        state.add(event)
+    assert state.schedule() == expected
+
+
+def test_build_schedule_plans_deadline_only_tasks():
+    inbox = Inbox()
+    now = datetime(2025, 12, 10, 8, 0, tzinfo=TZ)
+
+    schedule = build_schedule(
+        ["Купить хлеб", "Сдать отчёт до пятницы !! 2 часа", "Созвон 11.12 в 10:00"],
+        now=now,
+        tz=TZ,
+        inbox=inbox,
+        work_day=WORK_DAY,
+    )
+
+    assert [item.title for item in inbox.list()] == ["Купить хлеб"]
+    report = next(e for e in schedule if e.title == "Сдать отчёт")
+    assert (report.date, report.priority, report.deadline) == (DAY, 3, date(2025, 12, 12))
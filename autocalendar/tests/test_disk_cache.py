@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from autocalendar.benchmarks import corpus
+from autocalendar.parsing import DiskParseCache, parse_event_title, parse_many
+
+
+TZ = ZoneInfo("Europe/Moscow")
+NOW = datetime(2025, 12, 12, 12, 0, tzinfo=TZ)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_results_survive_reopen(tmp_path):
+    lines = corpus.texts(corpus.combinations())[::7]
+    expected = [parse_event_title(raw, now=NOW, tz=TZ) for raw in lines]
+
+    with DiskParseCache(tmp_path / "cache.sqlite3") as cache:
+        parse_many(lines, now=NOW, tz=TZ, cache=cache)
+
+    with DiskParseCache(tmp_path / "cache.sqlite3") as cache:
+        cached = parse_many(lines, now=NOW, tz=TZ, cache=cache)
+        stats = cache.stats()
+
+    assert cached == expected
+    assert stats.misses == 0
+    assert stats.hits == len(set(lines))
+
+
+def test_new_anchor_date_is_a_miss(tmp_path):
+    with DiskParseCache(tmp_path / "cache.sqlite3") as cache:
+        today = parse_event_title("Спортзал завтра", now=NOW, tz=TZ, cache=cache)
+        tomorrow = parse_event_title("Спортзал завтра", now=NOW + timedelta(days=1), tz=TZ, cache=cache)
+
+        assert cache.stats().misses == 2
+
+    assert tomorrow.d == today.d + timedelta(days=1)
+
+
+def test_time_of_day_lines_are_keyed_by_minute(tmp_path):
+    with DiskParseCache(tmp_path / "cache.sqlite3") as cache:
+        before = parse_event_title("Кофе 12:30", now=NOW, tz=TZ, cache=cache)
+        after = parse_event_title("Кофе 12:30", now=NOW.replace(minute=45), tz=TZ, cache=cache)
+
+    assert before.d == NOW.date()
+    assert after.d == NOW.date() + timedelta(days=1)
+
+
+def test_size_cap_evicts_least_recently_used(tmp_path):
+    clock = FakeClock()
+    cache = DiskParseCache(tmp_path / "cache.sqlite3", maxsize=2, clock=clock)
+
+    for raw in ("Задача 1", "Задача 2"):
+        parse_event_title(raw, now=NOW, tz=TZ, cache=cache)
+        cache.flush()
+        clock.now += 1
+
+    # «Задача 1» свежее «Задача 2», вытеснить должно вторую
+    parse_event_title("Задача 1", now=NOW, tz=TZ, cache=cache)
+    cache.flush()
+    clock.now += 1
+    parse_event_title("Задача 3", now=NOW, tz=TZ, cache=cache)
+
+    stats = cache.stats()
+    assert (stats.size, stats.evictions) == (2, 1)
+    assert cache.get(cache.key("Задача 1", now=NOW, tz=TZ, language="ru")) is not None
+    assert cache.get(cache.key("Задача 2", now=NOW, tz=TZ, language="ru")) is None
+    cache.close()
+
+
+def test_entries_expire_by_age(tmp_path):
+    clock = FakeClock()
+    with DiskParseCache(tmp_path / "cache.sqlite3", max_age_days=1, clock=clock) as cache:
+        parse_event_title("Задача", now=NOW, tz=TZ, cache=cache)
+        cache.flush()
+
+    clock.now += 2 * 86400
+    with DiskParseCache(tmp_path / "cache.sqlite3", max_age_days=1, clock=clock) as cache:
+        assert len(cache) == 0
+        assert cache.stats().evictions == 1
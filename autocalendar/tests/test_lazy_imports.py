@@ -0,0 +1,32 @@
+import subprocess
+import sys
+
+from autocalendar.benchmarks.bench_import_time import parse_importtime
+
+
+def test_service_import_does_not_load_dateparser():
+    code = (
+        "import sys, autocalendar.app.service; "
+        "print('dateparser' in sys.modules)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+
+    assert out == "False"
+
+
+def test_parse_importtime_output():
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   re\n"
+        "import time:       561 |      54245 | autocalendar.app.service\n"
+    )
+
+    assert parse_importtime(stderr) == {
+        "re": 120,
+        "autocalendar.app.service": 54245,
+    }
@@ -0,0 +1,140 @@
+from datetime import date, datetime, time
+from zoneinfo import ZoneInfo
+
+from autocalendar.benchmarks import corpus
+from autocalendar.parsing import parse_event_title
+from autocalendar.parsing.lexer import (
+    ALL_FEATURES,
+    DATE,
+    DATE_HINT,
+    DURATION_HOURS,
+    DURATION_MINUTES,
+    HAS_COLON,
+    HAS_DIGIT,
+    HAS_RELATIVE_WORD,
+    MONEY,
+    RELATIVE,
+    TIME,
+    TIME_RANGE,
+    features,
+    remove_regions,
+    tokenize,
+)
+
+
+TZ = ZoneInfo("Europe/Moscow")
+NOW = datetime(2025, 12, 10, 12, 0, tzinfo=TZ)
+
+
+def kinds(text):
+    return [span.kind for span in tokenize(text)]
+
+
+# --------------------------------------------------
+# tokenize
+# --------------------------------------------------
+
+def test_all_kinds_in_one_pass():
+    text = "Кино завтра 13.12 13/12 20:00 10:00-11:30 2 ч 30 мин 1200р"
+
+    assert kinds(text) == [
+        RELATIVE, DATE, DATE_HINT, TIME, TIME_RANGE,
+        DURATION_HOURS, DURATION_MINUTES, MONEY,
+    ]
+
+
+def test_spans_point_into_text():
+    text = "Врач в понедельник 18:30"
+    spans = tokenize(text)
+
+    assert [text[s.start:s.end] for s in spans] == ["в понедельник", "18:30"]
+
+
+def test_range_is_not_two_times():
+    assert kinds("Задача 10:00 - 11:30") == [TIME_RANGE]
+
+
+def test_fractional_hours_are_not_a_date():
+    assert kinds("Лекция 1.5 часа") == [DURATION_HOURS]
+
+
+def test_date_wins_over_money():
+    assert kinds("Оплата 13.12 $") == [DATE]
+
+
+def test_plain_line_has_no_spans():
+    assert tokenize("Купить хлеб и молоко") == []
+
+
+def test_remove_regions_merges_and_collapses_spaces():
+    assert remove_regions("a bb c dd e", [(2, 4), (3, 6), (7, 9)]) == "a e"
+
+
+def test_uppercase_line():
+    assert kinds("СОЗВОН ЗАВТРА 10:00 1200 РУБ") == [RELATIVE, TIME, MONEY]
+
+
+def test_spans_stay_in_place_when_lower_changes_length():
+    # «İ».lower() — два символа: позиции считаются по исходной строке
+    text = "İİ Созвон завтра 10:00"
+    spans = tokenize(text)
+
+    assert [text[s.start:s.end] for s in spans] == ["завтра", "10:00"]
+
+
+# --------------------------------------------------
+# префильтр
+# --------------------------------------------------
+
+def test_features():
+    assert features("Купить хлеб и молоко") == 0
+    assert features("Спортзал Завтра") == HAS_RELATIVE_WORD
+    assert features("Лекция 1.5 часа") == HAS_DIGIT
+    assert features("Кофе 15:45") == HAS_DIGIT | HAS_COLON
+    assert features("Врач в ПОНЕДЕЛЬНИК 18:30") == HAS_DIGIT | HAS_COLON | HAS_RELATIVE_WORD
+    assert features("Отчёт до пятницы !! в 18:30 завтра") == ALL_FEATURES
+    # «:» без цифр ничего не даёт
+    assert features("Итог: ничего") == 0
+
+
+def test_prefilter_does_not_change_spans():
+    def spans(text, mask):
+        return [(s.kind, s.start, s.end) for s in tokenize(text, mask=mask)]
+
+    for text in corpus.texts(corpus.combinations()):
+        assert spans(text, None) == spans(text, ALL_FEATURES)
+
+
+# --------------------------------------------------
+# parse_event_title поверх спанов
+# --------------------------------------------------
+
+def test_range_keeps_title_and_money():
+    p = parse_event_title("Кино 10:00-11:30 1200р", now=NOW, tz=TZ)
+
+    assert p.title == "Кино"
+    assert p.t == time(10, 0)
+    assert p.duration == 90
+    assert p.price is not None and p.price.currency == "RUB"
+
+
+def test_duration_and_money_do_not_reach_dateparser():
+    p = parse_event_title("Встреча 13/12 1.5 часа 15€", now=NOW, tz=TZ)
+
+    assert p.d == date(2025, 12, 13)
+    assert p.duration == 90
+    assert p.price is not None and p.price.currency == "EUR"
+    assert p.title == "Встреча"
+
+
+def test_invalid_date_and_time_do_not_crash():
+    assert parse_event_title("Созвон 31.02", now=NOW, tz=TZ).title
+    assert parse_event_title("Созвон 25:00-26:00", now=NOW, tz=TZ).title
+
+
+def test_invalid_date_does_not_reach_dateparser():
+    now = datetime(2026, 10, 14, 12, 30, tzinfo=TZ)
+    for raw in ("Сдать 31.11 10:00", "Отчёт 29.02 10:00"):
+        p = parse_event_title(raw, now=now, tz=TZ)
+        assert p.dt is None, raw
+        assert p.title == raw
@@ -0,0 +1,91 @@
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from autocalendar.benchmarks import corpus
+from autocalendar.parsing import ParseCache, datetime_extractor, parse_event_title
+from autocalendar.parsing.lexer import DATE, DURATION_MINUTES, MONEY, TIME, scan_window, tokenize
+
+
+TZ = ZoneInfo("Europe/Moscow")
+NOW = datetime(2025, 12, 10, 12, 0, tzinfo=TZ)
+
+FILLER = "Обсудить план работ на квартал " * 200
+
+
+# --------------------------------------------------
+# ограниченный режим
+# --------------------------------------------------
+
+def test_bounded_mode_matches_full_parse_on_short_lines():
+    for raw in corpus.texts(corpus.combinations()):
+        assert parse_event_title(raw, now=NOW, tz=TZ, max_scan=4096) == \
+            parse_event_title(raw, now=NOW, tz=TZ)
+
+
+def test_entities_past_the_window_are_ignored_but_stay_in_title():
+    raw = "Созвон " + FILLER + "завтра 10:00"
+
+    full = parse_event_title(raw, now=NOW, tz=TZ)
+    bounded = parse_event_title(raw, now=NOW, tz=TZ, max_scan=100)
+
+    assert full.d == date(2025, 12, 11)
+    assert bounded.dt is None
+    assert bounded.title.endswith("завтра 10:00")
+
+
+def test_window_does_not_cut_a_word():
+    text = "Созвон 30 минут"
+
+    end = scan_window(text, len("Созвон 30 м"))
+
+    assert text[:end] == "Созвон 30"
+    assert tokenize(text, max_scan=len("Созвон 30 м")) == []
+
+
+def test_tokenize_stops_once_every_slot_is_filled():
+    text = "Кино 13.12 20:00 30 мин 500р завтра 1 ч 100$"
+
+    spans = tokenize(text, max_scan=len(text))
+
+    assert [s.kind for s in spans] == [DATE, TIME, DURATION_MINUTES, MONEY]
+
+
+def test_relative_date_does_not_fill_the_date_slot():
+    # DD.MM дальше по строке всё равно победит — читаем до него
+    text = "Кино завтра 20:00 30 мин 500р 13.12"
+
+    assert tokenize(text, max_scan=len(text))[-1].kind == DATE
+
+
+def test_max_scan_must_be_positive():
+    with pytest.raises(ValueError):
+        parse_event_title("Созвон", now=NOW, tz=TZ, max_scan=0)
+
+
+def test_cache_keeps_bounded_and_full_results_apart():
+    raw = "Созвон " + FILLER + "завтра"
+    cache = ParseCache()
+
+    bounded = parse_event_title(raw, now=NOW, tz=TZ, cache=cache, max_scan=100)
+    full = parse_event_title(raw, now=NOW, tz=TZ, cache=cache)
+
+    assert bounded.dt is None
+    assert full.d == date(2025, 12, 11)
+
+
+def test_dateparser_sees_only_the_window(monkeypatch):
+    raw = "Встреча 13/12 " + FILLER * 5
+    seen = []
+    search = datetime_extractor._DateparserContext.search
+
+    def spy(self, text):
+        seen.append(text)
+        return search(self, text)
+
+    monkeypatch.setattr(datetime_extractor._DateparserContext, "search", spy)
+    p = parse_event_title(raw, now=NOW, tz=TZ, max_scan=200)
+
+    assert p.d == date(2025, 12, 13)
+    assert seen and all(len(text) <= 200 for text in seen)
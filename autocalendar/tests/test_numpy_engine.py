@@ -0,0 +1,62 @@
+import random
+from datetime import date, time, timedelta
+
+import pytest
+
+from autocalendar.scheduling import Event, WorkDay, autoschedule
+
+pytest.importorskip("numpy")
+
+from autocalendar.scheduling.numpy_engine import occupancy_slots  # noqa: E402
+from autocalendar.scheduling.slots import free_gaps  # noqa: E402
+
+
+WORK_DAY = WorkDay(start=time(9, 0), end=time(18, 0))
+DAY = date(2025, 1, 1)
+
+
+def test_occupancy_gaps_match_free_gaps():
+    rnd = random.Random(3)
+    busy_by_date = {}
+    for i in range(50):
+        busy = []
+        for _ in range(rnd.randint(0, 12)):
+            start = rnd.randint(0, 24 * 60 - 1)
+            busy.append((start, start + rnd.randint(0, 180)))
+        busy_by_date[DAY + timedelta(days=i)] = busy
+
+    day_slots = occupancy_slots(busy_by_date, 540, 1080)
+
+    for day, busy in busy_by_date.items():
+        assert day_slots(day).free_gaps() == free_gaps(busy, 540, 1080)
+
+
+def test_day_without_fixed_events_is_free():
+    day_slots = occupancy_slots({DAY: [(600, 660)]}, 540, 1080)
+
+    assert day_slots(DAY + timedelta(days=1)).place(540) == 540
+    # каждый вызов — свой экземпляр
+    assert day_slots(DAY + timedelta(days=1)).largest() == 540
+
+
+def test_empty_work_window_has_no_gaps():
+    day_slots = occupancy_slots({DAY: [(600, 660)]}, 600, 600)
+
+    assert day_slots(DAY).free_gaps() == []
+
+
+def test_numpy_engine_matches_python_engine():
+    rnd = random.Random(11)
+    for _ in range(100):
+        events = []
+        for i in range(rnd.randint(1, 60)):
+            day = DAY + timedelta(days=rnd.randint(0, 9))
+            if rnd.random() < 0.4:
+                # в том числе до и после рабочего окна
+                events.append(Event(f"f{i}", day, time(rnd.randint(6, 21), rnd.choice((0, 15, 30))),
+                                    rnd.randint(10, 150), 1))
+            else:
+                events.append(Event(f"e{i}", day, None, rnd.randint(5, 240), rnd.randint(1, 3)))
+
+        assert autoschedule(events, WORK_DAY, engine="numpy") == autoschedule(events, WORK_DAY)
+
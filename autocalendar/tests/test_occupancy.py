@@ -0,0 +1,103 @@
+import random
+from datetime import date, time
+
+from autocalendar.scheduling import OccupancyMap, ScheduledEvent, WorkCalendar, WorkDay
+from autocalendar.scheduling.slots import free_gaps
+
+
+WORK_DAY = WorkDay(start=time(9, 0), end=time(18, 0))
+DAY = date(2025, 1, 1)
+
+
+def test_is_free_and_free_minutes():
+    occupancy = OccupancyMap(WORK_DAY)
+    occupancy.occupy(DAY, 600, 60)
+
+    assert occupancy.is_free(DAY, 540, 60)
+    assert not occupancy.is_free(DAY, 570, 31)
+    assert occupancy.is_free(DAY, 660, 30)
+    # за пределами рабочего окна — не свободно
+    assert not occupancy.is_free(DAY, 1050, 60)
+    assert occupancy.free_minutes(DAY) == 540 - 60
+    assert occupancy.free_minutes(date(2025, 1, 2)) == 540
+
+
+def test_first_fit_after():
+    occupancy = OccupancyMap(WORK_DAY)
+    occupancy.occupy(DAY, 570, 30)
+
+    assert occupancy.first_fit(DAY, 30) == 540
+    assert occupancy.first_fit(DAY, 31) == 600
+    assert occupancy.first_fit(DAY, 30, after=550) == 600
+    assert occupancy.first_fit(DAY, 480) == 600
+    assert occupancy.first_fit(DAY, 481) is None
+
+
+def test_work_calendar_windows():
+    calendar = WorkCalendar(
+        [(time(9, 0), time(13, 0)), (time(14, 0), time(18, 0))],
+        holidays=[DAY],
+    )
+    occupancy = OccupancyMap(calendar)
+    friday, saturday = date(2025, 1, 3), date(2025, 1, 4)
+    occupancy.occupy(friday, 540, 60)
+
+    # обед не свободен, и интервал через обед — тоже
+    assert occupancy.is_free(friday, 720, 60)
+    assert not occupancy.is_free(friday, 750, 60)
+    assert not occupancy.is_free(friday, 790, 20)
+    assert occupancy.first_fit(friday, 200) == 840
+    assert occupancy.first_fit(friday, 30, after=770) == 840
+    assert occupancy.first_fit(friday, 241) is None
+    assert occupancy.free_minutes(friday) == 480 - 60
+
+    # праздник и выходной — рабочих окон нет
+    for day in (DAY, saturday):
+        assert occupancy.first_fit(day, 30) is None
+        assert occupancy.free_minutes(day) == 0
+        assert not occupancy.is_free(day, 600, 30)
+
+
+def test_release_keeps_map_sparse():
+    occupancy = OccupancyMap(WORK_DAY)
+    occupancy.occupy(DAY, 600, 60)
+    occupancy.release(DAY, 600, 60)
+
+    assert DAY not in occupancy
+    assert len(occupancy) == 0
+
+
+def test_from_schedule():
+    events = [
+        ScheduledEvent("A", DAY, time(9, 0), 30, 1),
+        ScheduledEvent("B", DAY, time(23, 30), 60, 1),  # за полночь — до конца суток
+    ]
+
+    occupancy = OccupancyMap.from_schedule(events, WORK_DAY)
+
+    assert occupancy.first_fit(DAY, 60) == 570
+    assert occupancy.free_minutes(DAY) == 510
+
+
+def test_matches_free_gaps():
+    rnd = random.Random(5)
+    for _ in range(200):
+        occupancy = OccupancyMap(WORK_DAY)
+        busy = []
+        for _ in range(rnd.randint(0, 15)):
+            start, duration = rnd.randint(0, 1439), rnd.randint(1, 120)
+            busy.append((start, start + duration))
+            occupancy.occupy(DAY, start, duration)
+
+        gaps = free_gaps(busy, 540, 1080)
+        assert occupancy.free_minutes(DAY) == sum(end - start for start, end in gaps)
+
+        for _ in range(20):
+            duration, after = rnd.randint(1, 300), rnd.randint(500, 1100)
+            expected = next(
+                (max(start, after) for start, end in gaps if end - max(start, after) >= duration),
+                None,
+            )
+            assert occupancy.first_fit(DAY, duration, after=after) == expected
+            if expected is not None:
+                assert occupancy.is_free(DAY, expected, duration)
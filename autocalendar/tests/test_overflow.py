@@ -0,0 +1,110 @@
+import random
+from collections import Counter
+from datetime import date, time, timedelta
+
+import pytest
+
+from autocalendar.scheduling import Event, ScheduledEvent, WorkDay, autoschedule
+from autocalendar.scheduling.slots import build_free_slots, can_fit, consume
+from autocalendar.scheduling.sorter import sort_flexible_events
+
+
+WORK_DAY = WorkDay(start=time(9, 0), end=time(18, 0))
+DAY = date(2025, 1, 1)
+
+
+def reference(events, work_day):
+    # эталон: дни подряд, каждый один раз; в день — свои события и перенос,
+    # отсортированные вместе, first-fit проходом по списку слотов
+    by_date = {}
+    for e in events:
+        by_date.setdefault(e.date, []).append(e)
+
+    result, carry = [], []
+    current = min(by_date)
+    while by_date or carry:
+        if not carry:
+            current = min(by_date)
+        day = by_date.pop(current, [])
+        fixed = [ScheduledEvent(e.title, e.date, e.time, e.duration, e.priority)
+                 for e in day if e.time is not None]
+        slots = build_free_slots(fixed, work_day)
+
+        left = []
+        for e in sort_flexible_events([e for e in day if e.time is None] + carry):
+            for i, s in enumerate(slots):
+                if can_fit(s, e.duration):
+                    result.append(ScheduledEvent(e.title, current, s.start, e.duration, e.priority))
+                    new_slot = consume(s, e.duration)
+                    if new_slot is None:
+                        slots.pop(i)
+                    else:
+                        slots[i] = new_slot
+                    break
+            else:
+                left.append(e)
+
+        result.extend(fixed)
+        carry = left
+        current += timedelta(days=1)
+    return result
+
+
+def test_overflow_into_busy_day_processes_it_once():
+    # перенос с 1-го числа попадает на 2-е, где уже есть свои события:
+    # 2-е число не должно обрабатываться второй раз
+    events = [
+        Event("A", DAY, None, 540, 2),
+        Event("B", DAY, None, 60, 1),
+        Event("Meeting", DAY + timedelta(days=1), time(12, 0), 60, 1),
+        Event("C", DAY + timedelta(days=1), None, 60, 1),
+    ]
+
+    result = autoschedule(events, WORK_DAY)
+
+    assert Counter(e.title for e in result) == {"A": 1, "B": 1, "Meeting": 1, "C": 1}
+    by_title = {e.title: (e.date, e.time) for e in result}
+    assert by_title["B"] == (DAY + timedelta(days=1), time(10, 0))
+    assert by_title["C"] == (DAY + timedelta(days=1), time(9, 0))
+
+
+def test_carry_pool_matches_reference():
+    rnd = random.Random(7)
+    for _ in range(200):
+        events = []
+        for i in range(rnd.randint(1, 40)):
+            day = DAY + timedelta(days=rnd.randint(0, 6))
+            if rnd.random() < 0.3:
+                events.append(Event(f"f{i}", day, time(rnd.randint(9, 17), rnd.choice((0, 30))),
+                                    rnd.randint(15, 120), 1))
+            else:
+                events.append(Event(f"e{i}", day, None, rnd.randint(5, 240), rnd.randint(1, 3)))
+
+        assert autoschedule(events, WORK_DAY) == reference(events, WORK_DAY)
+
+
+def test_large_spillover_runs_in_one_pass():
+    # 10 000 задач на один день: по 9 в день, без повторов и пропусков
+    events = [Event(f"t{i}", DAY, None, 60, 1) for i in range(10_000)]
+
+    result = autoschedule(events, WORK_DAY)
+
+    assert len(result) == 10_000
+    assert len({e.title for e in result}) == 10_000
+    per_day = Counter(e.date for e in result)
+    assert set(per_day.values()) == {9, 10_000 % 9}
+    assert max(per_day) == DAY + timedelta(days=10_000 // 9)
+
+
+def test_long_spillover_with_mixed_durations_matches_reference():
+    # длительность, не влезшая в окна дня, выбывает до конца дня целиком —
+    # на длинном переносе раскладка та же, что у прохода по всему пулу
+    rnd = random.Random(25)
+    events = [Event(f"t{i}", DAY, None, rnd.randint(5, 240), rnd.randint(1, 3)) for i in range(2_000)]
+
+    assert autoschedule(events, WORK_DAY) == reference(events, WORK_DAY)
+
+
+def test_event_longer_than_work_day_is_rejected():
+    with pytest.raises(ValueError):
+        autoschedule([Event("Long", DAY, None, 10 * 60, 1)], WORK_DAY)
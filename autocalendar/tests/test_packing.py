@@ -0,0 +1,131 @@
+import itertools
+import random
+import time as clock
+from datetime import date, time, timedelta
+
+import pytest
+
+from autocalendar.scheduling import Event, WorkDay, autoschedule
+from autocalendar.scheduling.overflow import CarryPool
+from autocalendar.scheduling.packing import pack_day
+from autocalendar.scheduling.slots import SlotIndex
+from autocalendar.scheduling.sorter import sort_flexible_events
+
+
+WORK_DAY = WorkDay(start=time(9, 0), end=time(18, 0))
+DAY = date(2025, 1, 1)
+BUDGET = 10.0  # секунд: в тестах бюджет не кончается
+
+
+def _flexible(*durations, priority=1):
+    return [Event(f"e{i}", DAY, None, d, priority) for i, d in enumerate(durations)]
+
+
+def _minutes_by_priority(placed):
+    # от высшего приоритета к низшему — как сравнивает упаковщик
+    return [sum(e.duration for _, e in placed if e.priority == p) for p in (3, 2, 1)]
+
+
+def test_fits_what_first_fit_pushes_to_next_day():
+    gaps = [(540, 600), (600, 640)]
+    events = _flexible(40, 30, 30)
+
+    greedy = CarryPool()
+    greedy.add(events)
+    assert len(greedy.place(SlotIndex(gaps))) == 2
+
+    placed = pack_day(gaps, events, clock.perf_counter() + BUDGET)
+    # 30 + 30 в первое окно, 40 — во второе; в каждом окне по порядку пула
+    assert placed == [(600, events[0]), (540, events[1]), (570, events[2])]
+
+
+def test_never_trades_priority_for_minutes():
+    gaps = [(540, 600)]
+    important = Event("важное", DAY, None, 40, 3)
+    events = sort_flexible_events([important, *_flexible(30, 30)])
+
+    placed = pack_day(gaps, events, clock.perf_counter() + BUDGET)
+    # 30 + 30 заняли бы больше минут, но важное событие остаётся в дне
+    assert [event for _, event in placed] == [important]
+
+
+def test_expired_budget_is_first_fit():
+    rnd = random.Random(3)
+    for _ in range(50):
+        gaps = [(540 + 60 * i, 540 + 60 * i + rnd.randint(10, 60)) for i in range(rnd.randint(1, 5))]
+        events = sort_flexible_events(_flexible(*(rnd.randint(5, 50) for _ in range(rnd.randint(1, 12)))))
+
+        greedy = CarryPool()
+        greedy.add(events)
+        expected = greedy.place(SlotIndex(gaps))
+
+        assert sorted(pack_day(gaps, events, 0.0), key=lambda p: p[0]) == sorted(expected, key=lambda p: p[0])
+
+
+def test_valid_and_not_worse_than_first_fit():
+    rnd = random.Random(7)
+    for _ in range(200):
+        gaps, cursor = [], 540
+        for _ in range(rnd.randint(1, 4)):
+            cursor += rnd.randint(0, 30)
+            length = rnd.randint(10, 90)
+            gaps.append((cursor, cursor + length))
+            cursor += length
+        events = sort_flexible_events([
+            Event(f"e{i}", DAY, None, rnd.randint(5, 60), rnd.randint(1, 3))
+            for i in range(rnd.randint(1, 7))
+        ])
+
+        placed = pack_day(gaps, events, clock.perf_counter() + BUDGET)
+
+        intervals = sorted((start, start + event.duration) for start, event in placed)
+        assert all(end <= start for (_, end), (start, _) in zip(intervals, intervals[1:]))
+        assert all(any(gs <= s and e <= ge for gs, ge in gaps) for s, e in intervals)
+        assert len({id(event) for _, event in placed}) == len(placed)
+
+        greedy = CarryPool()
+        greedy.add(events)
+        assert _minutes_by_priority(placed) >= _minutes_by_priority(greedy.place(SlotIndex(gaps)))
+
+        if len(gaps) == 1:
+            # одно окно — точный рюкзак: не хуже перебора
+            best = max(
+                (_minutes_by_priority([(0, e) for e in subset])
+                 for k in range(len(events) + 1)
+                 for subset in itertools.combinations(events, k)
+                 if sum(e.duration for e in subset) <= gaps[0][1] - gaps[0][0]),
+            )
+            assert _minutes_by_priority(placed) == best
+
+
+def test_large_pool_stays_near_budget():
+    # у каждой задачи свой срок — тысячи рангов срочности в одном окне
+    rnd = random.Random(23)
+    events = sort_flexible_events([
+        Event(f"e{i}", DAY, None, rnd.randint(5, 240), 1, deadline=DAY + timedelta(days=i))
+        for i in range(6000)
+    ])
+
+    started = clock.perf_counter()
+    placed = pack_day([(540, 1080)], events, started + 0.005)
+
+    assert placed
+    assert clock.perf_counter() - started < 0.1
+
+
+def test_autoschedule_with_pack_budget():
+    events = [
+        Event("встреча", DAY, time(10, 0), 7 * 60 + 20, 1),
+        *_flexible(40, 30, 30),
+    ]
+
+    greedy = autoschedule(events, WORK_DAY)
+    packed = autoschedule(events, WORK_DAY, pack_budget=BUDGET)
+
+    assert sorted(e.title for e in packed) == sorted(e.title for e in greedy)
+    # жадно одна задача на 30 минут уходит на завтра, упаковка вмещает всё
+    assert [e.title for e in greedy if e.date != DAY] == ["e2"]
+    assert all(e.date == DAY for e in packed)
+
+    with pytest.raises(ValueError):
+        autoschedule(events, WORK_DAY, pack_budget=BUDGET, executor="thread")
@@ -0,0 +1,51 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, time, timedelta
+
+import pytest
+
+from autocalendar.scheduling import Event, WorkDay, autoschedule
+
+
+WORK_DAY = WorkDay(start=time(9, 0), end=time(18, 0))
+DAY = date(2025, 1, 1)
+
+
+def random_horizon(rnd, n, days):
+    events = []
+    for i in range(n):
+        day = DAY + timedelta(days=rnd.randrange(days))
+        if rnd.random() < 0.3:
+            events.append(Event(f"f{i}", day, time(rnd.randint(8, 17), rnd.choice((0, 30))),
+                                rnd.randint(15, 120), 1))
+        else:
+            events.append(Event(f"e{i}", day, None, rnd.randint(15, 300), rnd.randint(1, 3)))
+    return events
+
+
+def test_weeks_match_sequential():
+    rnd = random.Random(22)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        for _ in range(100):
+            # от свободных недель до перегруженных, с пустыми неделями между
+            events = random_horizon(rnd, rnd.randint(1, 80), rnd.choice((7, 30, 90)))
+
+            assert autoschedule(events, WORK_DAY, executor=pool) == autoschedule(events, WORK_DAY)
+
+
+def test_overflow_crosses_empty_weeks():
+    events = [Event(f"t{i}", DAY, None, 540, 1) for i in range(20)]
+    events.append(Event("Later", DAY + timedelta(days=60), None, 60, 5))
+
+    assert autoschedule(events, WORK_DAY, executor="thread") == autoschedule(events, WORK_DAY)
+
+
+def test_process_pool():
+    events = random_horizon(random.Random(1), 200, 60)
+
+    assert autoschedule(events, WORK_DAY, executor="process", max_workers=2) == autoschedule(events, WORK_DAY)
+
+
+def test_unknown_executor():
+    with pytest.raises(ValueError):
+        autoschedule([Event("A", DAY, None, 60, 1)], WORK_DAY, executor="gpu")
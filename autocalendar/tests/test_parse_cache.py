@@ -0,0 +1,78 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from autocalendar.parsing import ParseCache, parse_event_title
+
+
+TZ = ZoneInfo("Europe/Moscow")
+NOW = datetime(2025, 12, 12, 12, 0, tzinfo=TZ)
+
+
+def test_repeated_line_is_a_hit():
+    cache = ParseCache(maxsize=8)
+
+    first = parse_event_title("Созвон 30 мин", now=NOW, tz=TZ, cache=cache)
+    second = parse_event_title("Созвон  30 мин ", now=NOW, tz=TZ, cache=cache)
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+    assert second.title == first.title == "Созвон"
+    assert second.duration == 30
+    # raw всегда исходный, даже если ключ совпал после нормализации
+    assert second.raw == "Созвон  30 мин "
+
+
+def test_cached_result_matches_uncached():
+    cache = ParseCache()
+
+    for raw in ("Спортзал завтра", "Кино 1200р завтра 20:00", "Задача 10:00-11:30"):
+        parse_event_title(raw, now=NOW, tz=TZ, cache=cache)
+        assert parse_event_title(raw, now=NOW, tz=TZ, cache=cache) == parse_event_title(raw, now=NOW, tz=TZ)
+
+    assert cache.stats().hits == 3
+
+
+def test_date_only_lines_are_keyed_by_day():
+    cache = ParseCache()
+
+    parse_event_title("Спортзал завтра", now=NOW, tz=TZ, cache=cache)
+    parse_event_title("Спортзал завтра", now=NOW.replace(hour=18), tz=TZ, cache=cache)
+    parsed = parse_event_title("Спортзал завтра", now=NOW.replace(day=13), tz=TZ, cache=cache)
+
+    assert cache.stats().hits == 1
+    assert parsed.d.day == 14
+
+
+def test_time_only_lines_are_keyed_by_minute():
+    cache = ParseCache()
+
+    before = parse_event_title("Кофе 15:00", now=NOW, tz=TZ, cache=cache)
+    after = parse_event_title("Кофе 15:00", now=NOW.replace(hour=16), tz=TZ, cache=cache)
+
+    assert cache.stats().hits == 0
+    assert before.d.day == 12
+    assert after.d.day == 13
+
+
+def test_lru_eviction():
+    cache = ParseCache(maxsize=2)
+
+    for raw in ("A", "B", "A", "C"):
+        parse_event_title(raw, now=NOW, tz=TZ, cache=cache)
+
+    stats = cache.stats()
+    assert stats.evictions == 1
+    assert stats.size == 2
+
+    # "B" был наименее недавно использованным
+    parse_event_title("B", now=NOW, tz=TZ, cache=cache)
+    assert cache.stats().misses == 4
+
+
+def test_mutating_result_does_not_poison_cache():
+    cache = ParseCache()
+
+    parsed = parse_event_title("Спортзал завтра", now=NOW, tz=TZ, cache=cache)
+    parsed.title = "changed"
+
+    assert parse_event_title("Спортзал завтра", now=NOW, tz=TZ, cache=cache).title == "Спортзал"
@@ -0,0 +1,56 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from autocalendar.parsing import ParseCache, parse_event_title, parse_many
+
+
+TZ = ZoneInfo("Europe/Moscow")
+NOW = datetime(2025, 12, 12, 12, 0, tzinfo=TZ)
+
+LINES = [
+    "Спортзал завтра",
+    "Созвон 30 мин",
+    "Задача 10:00-11:30",
+    "Кино 1200р завтра 20:00",
+    "Врач в понедельник 18:30",
+    "Купить хлеб и молоко",
+] * 5
+
+
+def _expected():
+    return [parse_event_title(raw, now=NOW, tz=TZ) for raw in LINES]
+
+
+@pytest.mark.parametrize("executor", [None, "thread", "process"])
+def test_parse_many_keeps_order(executor):
+    parsed = parse_many(LINES, now=NOW, tz=TZ, executor=executor, max_workers=2, chunk_size=4)
+
+    assert parsed == _expected()
+
+
+def test_parse_many_with_caller_owned_executor():
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        parsed = parse_many(iter(LINES), now=NOW, tz=TZ, executor=pool, chunk_size=7)
+
+    assert parsed == _expected()
+
+
+def test_parse_many_parses_duplicates_once_with_cache():
+    cache = ParseCache()
+
+    parsed = parse_many(LINES, now=NOW, tz=TZ, cache=cache)
+
+    assert parsed == _expected()
+    assert cache.stats().misses == 6
+    assert cache.stats().size == 6
+
+    parse_many(LINES[:6], now=NOW, tz=TZ, executor="thread", cache=cache)
+    assert cache.stats().hits == 6
+
+
+def test_parse_many_rejects_unknown_executor():
+    with pytest.raises(ValueError):
+        parse_many(LINES, now=NOW, tz=TZ, executor="gpu")
@@ -0,0 +1,83 @@
+from datetime import datetime, time
+from itertools import count, islice
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from autocalendar.app.service import build_schedule
+from autocalendar.inbox import Inbox
+from autocalendar.parsing import parse_event_title, parse_stream
+from autocalendar.scheduling import WorkDay
+
+
+TZ = ZoneInfo("Europe/Moscow")
+NOW = datetime(2025, 12, 12, 12, 0, tzinfo=TZ)
+
+LINES = [
+    "Спортзал завтра",
+    "Созвон 30 мин",
+    "Задача 10:00-11:30",
+    "Кино 1200р завтра 20:00",
+    "Купить хлеб и молоко",
+] * 4
+
+
+@pytest.mark.parametrize("executor", [None, "thread"])
+def test_parse_stream_matches_parse_event_title(executor):
+    parsed = list(parse_stream(iter(LINES), now=NOW, tz=TZ, executor=executor,
+                               max_workers=2, chunk_size=3))
+
+    assert parsed == [parse_event_title(raw, now=NOW, tz=TZ) for raw in LINES]
+
+
+def test_parse_stream_is_lazy():
+    # бесконечный источник: читается ровно столько, сколько забрали
+    read = []
+
+    def source():
+        for i in count():
+            read.append(i)
+            yield f"Задача {i}"
+
+    head = list(islice(parse_stream(source(), now=NOW, tz=TZ), 3))
+
+    assert [p.title for p in head] == ["Задача 0", "Задача 1", "Задача 2"]
+    assert read == [0, 1, 2]
+
+
+def test_parse_stream_with_executor_reads_one_window_at_a_time():
+    read = []
+
+    def source():
+        for i in count():
+            read.append(i)
+            yield f"Задача {i}"
+
+    stream = parse_stream(source(), now=NOW, tz=TZ, executor="thread",
+                          max_workers=2, chunk_size=4)
+    next(stream)
+    stream.close()
+
+    assert len(read) == 2 * 4
+
+
+def test_build_schedule_sends_inbox_items_as_they_arrive():
+    inbox = Inbox()
+    seen_in_inbox = []
+
+    def source():
+        yield "Купить хлеб"
+        # предыдущая строка уже разобрана и лежит в inbox
+        seen_in_inbox.append([item.title for item in inbox.list()])
+        yield "Созвон завтра 10:00"
+
+    scheduled = build_schedule(
+        source(),
+        now=NOW,
+        tz=TZ,
+        inbox=inbox,
+        work_day=WorkDay(start=time(9, 0), end=time(18, 0)),
+    )
+
+    assert seen_in_inbox == [["Купить хлеб"]]
+    assert [e.title for e in scheduled] == ["Созвон"]
@@ -0,0 +1,79 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from autocalendar.parsing import ParseProfiler, parse_event_title, parse_many
+from autocalendar.parsing.profiling import DATETIME_BRANCHES, STAGES
+
+
+TZ = ZoneInfo("Europe/Moscow")
+NOW = datetime(2025, 12, 10, 12, 0, tzinfo=TZ)
+
+BRANCH_LINES = {
+    "range": "Задача 10:00-11:30",
+    "time": "Кофе 15:45",
+    "ddmm": "созвон 13.12 09:00",
+    "relative": "Врач в понедельник 18:30",
+    "dateparser": "Встреча 13/12",
+    "none": "Купить хлеб и молоко",
+}
+
+
+@pytest.mark.parametrize("branch", DATETIME_BRANCHES)
+def test_records_datetime_branch(branch):
+    profiler = ParseProfiler()
+
+    parse_event_title(BRANCH_LINES[branch], now=NOW, tz=TZ, profiler=profiler)
+
+    branches = profiler.stats().branches
+    assert branches[branch].calls == 1
+    assert sum(s.calls for s in branches.values()) == 1
+
+
+def test_counts_calls_and_time_per_stage():
+    profiler = ParseProfiler()
+
+    for raw in BRANCH_LINES.values():
+        parse_event_title(raw, now=NOW, tz=TZ, profiler=profiler)
+
+    stages = profiler.stats().stages
+    assert list(stages) == list(STAGES)
+    assert stages["normalize"].calls == len(BRANCH_LINES)
+    assert stages["prefilter"].calls == len(BRANCH_LINES)
+    # строку без цифр и слов-дат лексер не читает, дальше она не идёт
+    assert stages["tokenize"].calls == len(BRANCH_LINES) - 1
+    assert stages["datetime"].calls == len(BRANCH_LINES)
+    assert stages["duration"].calls == len(BRANCH_LINES) - 1
+    assert all(s.seconds >= 0 for s in stages.values())
+
+
+def test_profiled_result_is_the_same():
+    for raw in BRANCH_LINES.values():
+        assert (
+            parse_event_title(raw, now=NOW, tz=TZ, profiler=ParseProfiler())
+            == parse_event_title(raw, now=NOW, tz=TZ)
+        )
+
+
+@pytest.mark.parametrize("executor", [None, "thread", "process"])
+def test_parse_many_merges_worker_profiles(executor):
+    profiler = ParseProfiler()
+    lines = list(BRANCH_LINES.values()) * 3
+
+    parse_many(lines, now=NOW, tz=TZ, executor=executor, max_workers=2,
+               chunk_size=4, profiler=profiler)
+
+    stats = profiler.stats()
+    assert stats.stages["prefilter"].calls == len(lines)
+    assert {b: s.calls for b, s in stats.branches.items()} == dict.fromkeys(DATETIME_BRANCHES, 3)
+
+
+def test_reset_and_report():
+    profiler = ParseProfiler()
+    parse_event_title("Встреча 13/12", now=NOW, tz=TZ, profiler=profiler)
+
+    assert "datetime:dateparser" in profiler.stats().report()
+
+    profiler.reset()
+    assert all(s.calls == 0 for s in profiler.stats().stages.values())
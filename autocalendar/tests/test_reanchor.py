@@ -0,0 +1,68 @@
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from autocalendar.benchmarks import corpus
+from autocalendar.parsing import parse_event_title, reanchor
+
+
+TZ = ZoneInfo("Europe/Moscow")
+NOW = datetime(2025, 12, 10, 12, 0, tzinfo=TZ)  # среда
+
+LATER = [
+    NOW + timedelta(minutes=20),                      # «12:15» уже прошло
+    NOW.replace(hour=23, minute=59) + timedelta(minutes=2),  # через полночь
+    NOW + timedelta(days=3),                          # другой день недели
+    datetime(2026, 1, 2, 9, 0, tzinfo=TZ),            # через Новый год
+    datetime(2028, 2, 28, 8, 0, tzinfo=TZ),           # високосный год
+]
+
+NATIVE = [line.text for line in corpus.combinations() if line.kind != "fallback"]
+
+
+@pytest.mark.parametrize("later", LATER, ids=str)
+def test_reanchor_matches_fresh_parse(later):
+    for raw in NATIVE:
+        parsed = parse_event_title(raw, now=NOW, tz=TZ)
+
+        assert reanchor(parsed, later) == parse_event_title(raw, now=later, tz=TZ), raw
+
+
+def test_clock_rolls_over_when_time_has_passed():
+    parsed = parse_event_title("Кофе 12:15", now=NOW, tz=TZ)
+
+    assert parsed.d == NOW.date()
+    assert reanchor(parsed, NOW + timedelta(minutes=20)).d == NOW.date() + timedelta(days=1)
+
+
+def test_february_29_falls_back_to_reparse():
+    parsed = parse_event_title("Отчёт 29.02", now=datetime(2027, 3, 1, tzinfo=TZ), tz=TZ)
+    assert parsed.d.year == 2028
+
+    moved = reanchor(parsed, datetime(2028, 3, 1, tzinfo=TZ))
+    assert moved == parse_event_title("Отчёт 29.02", now=datetime(2028, 3, 1, tzinfo=TZ), tz=TZ)
+
+
+def test_date_missing_at_old_anchor_is_reparsed():
+    parsed = parse_event_title("Отчёт 29.02", now=datetime(2026, 10, 14, tzinfo=TZ), tz=TZ)
+    assert parsed.dt is None
+
+    later = datetime(2027, 3, 1, tzinfo=TZ)
+    moved = reanchor(parsed, later)
+    assert moved == parse_event_title("Отчёт 29.02", now=later, tz=TZ)
+    assert moved.d == datetime(2028, 2, 29).date()
+
+
+def test_dateparser_result_is_reparsed():
+    parsed = parse_event_title("Встреча 13/12", now=NOW, tz=TZ)
+    assert parsed.date_rule is None
+
+    later = datetime(2025, 12, 20, 12, 0, tzinfo=TZ)
+    assert reanchor(parsed, later) == parse_event_title("Встреча 13/12", now=later, tz=TZ)
+
+
+def test_undated_event_is_returned_as_is():
+    parsed = parse_event_title("Купить хлеб", now=NOW, tz=TZ)
+
+    assert reanchor(parsed, NOW + timedelta(days=1)) is parsed
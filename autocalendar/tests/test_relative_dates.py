@@ -0,0 +1,115 @@
+from datetime import date, datetime, time
+from zoneinfo import ZoneInfo
+
+from autocalendar.parsing import datetime_extractor
+from autocalendar.parsing.datetime_extractor import extract_datetime
+from autocalendar.parsing.relative_dates import resolve_relative_date
+
+
+TZ = ZoneInfo("Europe/Moscow")
+NOW = datetime(2025, 12, 10, 12, 0, tzinfo=TZ)  # среда
+TODAY = NOW.date()
+
+
+# --------------------------------------------------
+# resolve_relative_date
+# --------------------------------------------------
+
+def test_relative_words():
+    assert resolve_relative_date("сегодня", today=TODAY)[0] == date(2025, 12, 10)
+    assert resolve_relative_date("Завтра", today=TODAY)[0] == date(2025, 12, 11)
+    assert resolve_relative_date("послезавтра", today=TODAY)[0] == date(2025, 12, 12)
+
+
+def test_weekday_is_always_in_future():
+    assert resolve_relative_date("в пятницу", today=TODAY)[0] == date(2025, 12, 12)
+    assert resolve_relative_date("во вторник", today=TODAY)[0] == date(2025, 12, 16)
+    # тот же день недели — через неделю, а не сегодня
+    assert resolve_relative_date("в среду", today=TODAY)[0] == date(2025, 12, 17)
+
+
+def test_next_weekday_and_next_week():
+    assert resolve_relative_date("в следующую пятницу", today=TODAY)[0] == date(2025, 12, 19)
+    assert resolve_relative_date("на следующей неделе", today=TODAY)[0] == date(2025, 12, 15)
+
+
+def test_in_n_days_and_weeks():
+    assert resolve_relative_date("через день", today=TODAY)[0] == date(2025, 12, 11)
+    assert resolve_relative_date("через 3 дня", today=TODAY)[0] == date(2025, 12, 13)
+    assert resolve_relative_date("через 2 недели", today=TODAY)[0] == date(2025, 12, 24)
+
+
+def test_day_and_month_name_rolls_to_next_year():
+    assert resolve_relative_date("15 декабря", today=TODAY)[0] == date(2025, 12, 15)
+    assert resolve_relative_date("1 декабря", today=TODAY)[0] == date(2026, 12, 1)
+    assert resolve_relative_date("31 ноября", today=TODAY) is None
+
+
+def test_bare_weekday_noun_is_not_a_date():
+    for text in ("Подготовить среду для тестов", "Настроить рабочую среду",
+                 "Среда разработки", "Прочитать про четверг", "Среда"):
+        assert resolve_relative_date(text, today=TODAY) is None, text
+        assert extract_datetime(text, now=NOW, tz=TZ) == (None, text, False)
+
+
+def test_returns_match_span():
+    text = "Врач в понедельник 18:30"
+    _, start, end = resolve_relative_date(text, today=TODAY)
+
+    assert text[start:end] == "в понедельник"
+
+
+# --------------------------------------------------
+# extract_datetime: native path vs dateparser fallback
+# --------------------------------------------------
+
+def test_native_path_does_not_call_dateparser():
+    datetime_extractor.reset_resolver_stats()
+
+    dt, text, explicit = extract_datetime("Врач в пятницу 18:30", now=NOW, tz=TZ)
+
+    assert dt == datetime(2025, 12, 12, 18, 30, tzinfo=TZ)
+    assert explicit is True
+    assert text == "Врач"
+    assert datetime_extractor.resolver_stats() == {"native": 1, "dateparser": 0}
+
+
+def test_native_path_with_time_range():
+    dt, text, explicit = extract_datetime("Созвон завтра 10:00-11:30", now=NOW, tz=TZ)
+
+    assert dt.time() == time(10, 0)
+    assert explicit is True
+    assert text == "Созвон"
+
+
+def test_unknown_expression_falls_back_to_dateparser():
+    datetime_extractor.reset_resolver_stats()
+
+    dt, text, explicit = extract_datetime("Встреча 13/12", now=NOW, tz=TZ)
+
+    assert dt is not None
+    assert dt.date() == date(2025, 12, 13)
+    assert datetime_extractor.resolver_stats() == {"native": 0, "dateparser": 1}
+
+
+def test_dateparser_context_is_shared_per_anchor_minute():
+    ctx = datetime_extractor.dateparser_context("ru", TZ, NOW)
+
+    assert datetime_extractor.dateparser_context("ru", TZ, NOW.replace(second=42)) is ctx
+    assert datetime_extractor.dateparser_context("ru", TZ, NOW.replace(minute=1)) is not ctx
+    assert datetime_extractor.dateparser_context("ru", ZoneInfo("UTC"), NOW) is not ctx
+
+
+def test_dateparser_fallback_returns_zoneinfo_aware_time():
+    dt, text, explicit = extract_datetime("Встреча 13/12 10:30", now=NOW, tz=TZ)
+
+    assert dt == datetime(2025, 12, 13, 10, 30, tzinfo=TZ)
+    assert dt.tzinfo is TZ
+    assert explicit is True
+
+
+def test_preposition_before_time_is_removed():
+    assert extract_datetime("Завтра в 10:00 встреча", now=NOW, tz=TZ)[1] == "встреча"
+    assert extract_datetime("Позвонить маме послезавтра в 19:00", now=NOW, tz=TZ)[1] == "Позвонить маме"
+    assert extract_datetime("Сегодня в 15:00 созвон", now=NOW, tz=TZ)[1] == "созвон"
+    assert extract_datetime("Врач в пятницу в 18:30", now=NOW, tz=TZ)[1] == "Врач"
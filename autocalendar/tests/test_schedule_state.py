@@ -0,0 +1,69 @@
+import random
+from datetime import date, time, timedelta
+
+import pytest
+
+from autocalendar.scheduling import Event, ScheduleState, WorkDay, autoschedule
+
+
+WORK_DAY = WorkDay(start=time(9, 0), end=time(18, 0))
+DAY = date(2025, 1, 1)
+
+
+def random_event(rnd, i):
+    day = DAY + timedelta(days=rnd.randint(0, 9))
+    if rnd.random() < 0.3:
+        return Event(f"f{i}", day, time(rnd.randint(8, 18), rnd.choice((0, 30))), rnd.randint(15, 120), 1)
+    return Event(f"e{i}", day, None, rnd.randint(15, 300), rnd.randint(1, 3))
+
+
+def test_add_remove_move_match_autoschedule():
+    rnd = random.Random(21)
+    for _ in range(30):
+        state = ScheduleState(WORK_DAY)
+        ids = []
+        for i in range(150):
+            action = rnd.random()
+            if action < 0.6 or not ids:
+                ids.append(state.add(random_event(rnd, i)))
+            elif action < 0.8:
+                state.remove(ids.pop(rnd.randrange(len(ids))))
+            else:
+                target = random_event(rnd, i)
+                state.move(rnd.choice(ids), target.date, target.time)
+
+            assert state.schedule() == autoschedule(state.events(), WORK_DAY)
+
+
+def test_remove_drops_overflow_chain():
+    state = ScheduleState(WORK_DAY)
+    first = state.add(Event("Big", DAY, None, 540, 2))
+    state.add(Event("A", DAY, None, 300, 1))
+    state.add(Event("B", DAY, None, 300, 1))
+
+    assert {e.date for e in state.schedule()} == {DAY, DAY + timedelta(days=1), DAY + timedelta(days=2)}
+
+    state.remove(first)
+
+    assert {e.date for e in state.schedule()} == {DAY, DAY + timedelta(days=1)}
+    assert state.schedule() == autoschedule(state.events(), WORK_DAY)
+
+
+def test_move_keeps_id_and_order():
+    state = ScheduleState(WORK_DAY)
+    a = state.add(Event("A", DAY, None, 60, 1))
+    state.add(Event("B", DAY + timedelta(days=1), None, 60, 1))
+
+    moved = state.move(a, DAY + timedelta(days=1), None)
+
+    assert moved.date == DAY + timedelta(days=1)
+    assert [e.title for e in state.events()] == ["A", "B"]
+    assert [(e.title, e.time) for e in state.schedule()] == [("A", time(9, 0)), ("B", time(10, 0))]
+
+
+def test_add_rejects_event_longer_than_work_day():
+    state = ScheduleState(WORK_DAY)
+
+    with pytest.raises(ValueError):
+        state.add(Event("Long", DAY, None, 600, 1))
+    assert len(state) == 0
@@ -0,0 +1,127 @@
+import random
+from datetime import date, time
+
+import pytest
+
+from autocalendar.scheduling import Event, ScheduledEvent, TimeSlot, WorkDay, autoschedule
+from autocalendar.scheduling.slots import (
+    SlotIndex,
+    build_free_slots,
+    can_fit,
+    consume,
+    free_gaps,
+    from_minutes,
+    to_minutes,
+)
+
+
+def first_fit(slots, duration):
+    # эталон: проход по списку TimeSlot, как было в autoschedule
+    for i, s in enumerate(slots):
+        if can_fit(s, duration):
+            new_slot = consume(s, duration)
+            if new_slot is None:
+                slots.pop(i)
+            else:
+                slots[i] = new_slot
+            return to_minutes(s.start)
+    return None
+
+
+def test_minutes_round_trip():
+    for m in (0, 59, 60, 9 * 60 + 30, 24 * 60 - 1):
+        assert to_minutes(from_minutes(m)) == m
+
+
+def test_free_gaps_between_busy_intervals():
+    # пересекающиеся и неотсортированные интервалы
+    busy = [(720, 780), (540, 600), (570, 630)]
+
+    assert free_gaps(busy, 540, 1080) == [(630, 720), (780, 1080)]
+
+
+def test_free_gaps_stay_inside_work_day():
+    # событие после конца дня не растягивает последнее окно,
+    # событие нулевой длительности не делит окно надвое
+    busy = [(1140, 1200), (600, 600)]
+
+    assert free_gaps(busy, 540, 1080) == [(540, 1080)]
+
+
+def test_free_gaps_match_build_free_slots():
+    work_day = WorkDay(start=time(9, 0), end=time(18, 0))
+    fixed = [
+        ScheduledEvent("A", date(2025, 1, 1), time(12, 0), 60, 1),
+        ScheduledEvent("B", date(2025, 1, 1), time(9, 30), 15, 1),
+    ]
+
+    slots = build_free_slots(fixed, work_day)
+    gaps = free_gaps([(to_minutes(e.time), to_minutes(e.time) + e.duration) for e in fixed], 540, 1080)
+
+    assert [(to_minutes(s.start), to_minutes(s.end)) for s in slots] == gaps
+
+
+def test_first_fit_skips_small_gaps():
+    index = SlotIndex([(540, 555), (600, 660), (720, 840)])
+
+    assert index.first_fit(30) == 1
+    assert index.first_fit(90) == 2
+    assert index.first_fit(121) is None
+
+
+def test_place_consumes_gap_start():
+    index = SlotIndex([(540, 600), (660, 720)])
+
+    assert index.place(45) == 585 - 45
+    assert index.place(15) == 585
+    # первое окно занято целиком и больше не находится
+    assert index.place(15) == 660
+    assert index.free_gaps() == [(675, 720)]
+
+
+def test_empty_index():
+    index = SlotIndex([])
+
+    assert index.place(1) is None
+    assert index.free_gaps() == []
+
+
+def test_matches_linear_first_fit():
+    rnd = random.Random(0)
+
+    for _ in range(200):
+        slots, minute = [], rnd.randint(0, 30)
+        for _ in range(rnd.randint(1, 40)):
+            length = rnd.randint(1, 45)
+            if minute + length >= 24 * 60:
+                break
+            slots.append(TimeSlot(from_minutes(minute), from_minutes(minute + length)))
+            minute += length + rnd.randint(1, 20)
+
+        index, reference = SlotIndex.from_slots(slots), list(slots)
+        for _ in range(60):
+            duration = rnd.randint(1, 50)
+            assert index.place(duration) == first_fit(reference, duration)
+        assert index.free_gaps() == [(to_minutes(s.start), to_minutes(s.end)) for s in reference]
+
+
+def test_autoschedule_fills_gaps_first_fit():
+    work_day = WorkDay(start=time(9, 0), end=time(12, 0))
+    day = date(2025, 1, 1)
+
+    events = [
+        Event("Fixed", day, time(9, 30), 60, 1),
+        Event("Long", day, None, 60, 2),
+        Event("Short", day, None, 30, 1),
+    ]
+
+    placed = {e.title: e.time for e in autoschedule(events, work_day)}
+
+    # длинное в окно 9:00–9:30 не влезает — идёт после фиксированного,
+    # короткое занимает окно в начале дня
+    assert placed == {"Fixed": time(9, 30), "Long": time(10, 30), "Short": time(9, 0)}
+
+
+def test_autoschedule_rejects_unknown_engine():
+    with pytest.raises(ValueError):
+        autoschedule([], WorkDay(start=time(9, 0), end=time(18, 0)), engine="fortran")
@@ -0,0 +1,42 @@
+import pickle
+from datetime import date, datetime, time
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from autocalendar.inbox import InboxItem
+from autocalendar.parsing import ParsedEvent, parse_event_title
+from autocalendar.scheduling import Event, ScheduledEvent, TimeSlot
+
+
+TZ = ZoneInfo("Europe/Moscow")
+NOW = datetime(2025, 12, 10, 12, 0, tzinfo=TZ)
+
+
+def test_d_and_t_are_derived_from_dt():
+    timed = parse_event_title("Врач завтра 18:30", now=NOW, tz=TZ)
+    dated = parse_event_title("Врач завтра", now=NOW, tz=TZ)
+    undated = parse_event_title("Врач", now=NOW, tz=TZ)
+
+    assert (timed.d, timed.t) == (date(2025, 12, 11), time(18, 30))
+    assert (dated.d, dated.t) == (date(2025, 12, 11), None)
+    assert (undated.d, undated.t) == (None, None)
+
+
+def test_title_and_leftovers_share_one_string():
+    p = parse_event_title("Созвон 30 мин", now=NOW, tz=TZ)
+
+    assert p.leftovers is p.title
+
+
+@pytest.mark.parametrize("obj", [
+    ParsedEvent(raw="x", title="x", dt=None, price=None, duration=None,
+                explicit_duration=False, leftovers="x"),
+    Event(title="x", date=date(2025, 12, 10), time=None, duration=30, priority=1),
+    ScheduledEvent(title="x", date=date(2025, 12, 10), time=time(9, 0), duration=30, priority=1),
+    TimeSlot(start=time(9, 0), end=time(10, 0)),
+    InboxItem(title="x", created_at=NOW),
+])
+def test_types_are_slotted_and_picklable(obj):
+    assert not hasattr(obj, "__dict__")
+    assert pickle.loads(pickle.dumps(obj)) == obj
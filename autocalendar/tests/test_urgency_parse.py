@@ -0,0 +1,90 @@
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from autocalendar.parsing import DiskParseCache, parse_event_title, parse_many, reanchor
+from autocalendar.parsing.urgency_extractor import extract_urgency
+
+
+TZ = ZoneInfo("Europe/Moscow")
+NOW = datetime(2025, 12, 10, 12, 0, tzinfo=TZ)  # среда
+
+LINES = [
+    "Сдать отчёт до пятницы !!",
+    "!!! Починить прод до завтра",
+    "Купить подарок до 15 декабря 2 часа",
+    "Созвон завтра 10:00 !",
+    "Подать заявление до 13.01",
+    "Разобрать почту до конца недели",
+]
+
+
+@pytest.mark.parametrize(
+    "raw, title, priority, deadline",
+    [
+        ("Сдать отчёт до пятницы !!", "Сдать отчёт", 3, date(2025, 12, 12)),
+        ("!!! Починить прод до завтра", "Починить прод", 4, date(2025, 12, 11)),
+        ("Купить подарок до 15 декабря 2 часа", "Купить подарок", None, date(2025, 12, 15)),
+        ("Подать заявление до 13.01", "Подать заявление", None, date(2026, 1, 13)),
+        ("Разобрать почту до конца недели", "Разобрать почту", None, date(2025, 12, 14)),
+        ("Созвон завтра 10:00 !", "Созвон", 2, None),
+    ],
+)
+def test_priority_and_deadline(raw, title, priority, deadline):
+    parsed = parse_event_title(raw, now=NOW, tz=TZ)
+
+    assert parsed.title == title
+    assert parsed.priority == priority
+    assert parsed.deadline == deadline
+
+
+def test_not_a_priority_or_deadline():
+    for raw in ("Позвонить маме!", "Дойти до магазина", "Работа до 18:00", "Отчёт до 31.02"):
+        parsed = parse_event_title(raw, now=NOW, tz=TZ)
+        assert parsed.priority is None and parsed.deadline is None, raw
+
+
+def test_deadline_does_not_set_event_date():
+    parsed = parse_event_title("Сдать отчёт до 15 декабря", now=NOW, tz=TZ)
+
+    assert parsed.d is None
+    assert parse_event_title("Сдать отчёт 12.12 до 15 декабря", now=NOW, tz=TZ).d == date(2025, 12, 12)
+
+
+def test_extract_urgency():
+    assert extract_urgency("Отчёт до пятницы !", today=NOW.date()) == (2, date(2025, 12, 12), "Отчёт")
+
+
+@pytest.mark.parametrize("later", [NOW + timedelta(days=3), datetime(2026, 1, 20, 9, 0, tzinfo=TZ)], ids=str)
+def test_reanchor_moves_deadline(later):
+    for raw in LINES:
+        parsed = parse_event_title(raw, now=NOW, tz=TZ)
+        assert reanchor(parsed, later) == parse_event_title(raw, now=later, tz=TZ), raw
+
+
+def test_deadline_missing_at_old_anchor_is_reparsed():
+    parsed = parse_event_title("Сдать до 29.02", now=NOW, tz=TZ)
+    assert parsed.deadline is None
+
+    for later in (datetime(2027, 12, 31, tzinfo=TZ), datetime(2028, 2, 29, tzinfo=TZ)):
+        moved = reanchor(parsed, later)
+        assert moved == parse_event_title("Сдать до 29.02", now=later, tz=TZ)
+        assert (moved.title, moved.deadline) == ("Сдать", date(2028, 2, 29))
+
+
+def test_disk_cache_keeps_priority_and_deadline(tmp_path):
+    expected = [parse_event_title(raw, now=NOW, tz=TZ) for raw in LINES]
+
+    with DiskParseCache(tmp_path / "cache.sqlite3") as cache:
+        parse_many(LINES, now=NOW, tz=TZ, cache=cache)
+
+    with DiskParseCache(tmp_path / "cache.sqlite3") as cache:
+        assert parse_many(LINES, now=NOW, tz=TZ, cache=cache) == expected
+
+
+def test_fractional_hours_after_do_are_a_duration():
+    parsed = parse_event_title("Поездка до 3.5 часов", now=NOW, tz=TZ)
+
+    assert parsed.deadline is None
+    assert parsed.duration == 210
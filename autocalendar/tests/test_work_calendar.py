@@ -0,0 +1,163 @@
+import random
+from datetime import date, time, timedelta
+
+import pytest
+
+from autocalendar.scheduling import Event, ScheduledEvent, ScheduleState, WorkCalendar, WorkDay, autoschedule
+from autocalendar.scheduling.overflow import CarryPool, handle_overflow
+from autocalendar.scheduling.scheduler import place_day
+from autocalendar.scheduling.slots import SlotIndex, busy_minutes, to_minutes
+
+
+WORK_DAY = WorkDay(start=time(9, 0), end=time(18, 0))
+LUNCH = [(time(9, 0), time(13, 0)), (time(14, 0), time(18, 0))]
+FRIDAY = date(2025, 1, 3)
+MONDAY = date(2025, 1, 6)
+
+
+def random_calendar(rnd):
+    start = FRIDAY - timedelta(days=10)
+    holidays = {start + timedelta(days=rnd.randrange(60)) for _ in range(rnd.randint(0, 10))}
+    dates = {}
+    for _ in range(rnd.randint(0, 10)):
+        h = rnd.randint(6, 16)
+        dates[start + timedelta(days=rnd.randrange(60))] = [(time(h, 0), time(h + rnd.randint(1, 7), 0))]
+    return WorkCalendar(
+        rnd.choice((WORK_DAY, LUNCH)),
+        weekends=rnd.sample(range(7), rnd.randint(0, 3)),
+        holidays=holidays,
+        dates=dates,
+    )
+
+
+def random_events(rnd, n):
+    events = []
+    for i in range(n):
+        day = FRIDAY + timedelta(days=rnd.randint(-5, 20))
+        if rnd.random() < 0.3:
+            events.append(Event(f"f{i}", day, time(rnd.randint(8, 18), rnd.choice((0, 30))),
+                                rnd.randint(15, 120), 1))
+        else:
+            events.append(Event(f"e{i}", day, None, rnd.randint(15, 240), rnd.randint(1, 3)))
+    return events
+
+
+def walk_day_by_day(events, calendar):
+    # эталон: все дни подряд, без пропусков по календарю
+    by_date = {}
+    for e in events:
+        by_date.setdefault(e.date, []).append(e)
+
+    result, carry = [], CarryPool()
+    day = min(by_date)
+    while day <= max(by_date) or carry:
+        own = by_date.get(day, [])
+        fixed = [ScheduledEvent(e.title, e.date, e.time, e.duration, e.priority) for e in own if e.time is not None]
+        carry.add(e for e in own if e.time is None)
+        result.extend(place_day(day, SlotIndex(calendar.free_gaps(day, busy_minutes(fixed))), carry))
+        result.extend(fixed)
+        day += timedelta(days=1)
+    return result
+
+
+def test_windows_weekends_holidays_dates():
+    calendar = WorkCalendar(
+        LUNCH,
+        holidays=[date(2025, 1, 1)],
+        dates={date(2025, 1, 4): WORK_DAY, date(2025, 1, 1): [(time(10, 0), time(12, 0))]},
+    )
+
+    assert calendar.windows(FRIDAY) == ((540, 780), (840, 1080))
+    assert calendar.windows(date(2025, 1, 5)) == ()              # воскресенье
+    assert calendar.windows(date(2025, 1, 4)) == ((540, 1080),)  # рабочая суббота
+    assert calendar.windows(date(2025, 1, 1)) == ((600, 720),)   # dates важнее праздника
+    assert calendar.free_gaps(FRIDAY, [(600, 900)]) == [(540, 600), (900, 1080)]
+    assert calendar.closed(FRIDAY) == [(0, 540), (780, 840), (1080, 1440)]
+    assert not calendar.is_working_day(date(2025, 1, 5))
+
+
+def test_adjacent_windows_merge():
+    calendar = WorkCalendar([(time(13, 0), time(18, 0)), (time(9, 0), time(13, 0)), (time(20, 0), time(19, 0))])
+
+    assert calendar.windows(MONDAY) == ((540, 1080),)
+    assert calendar.uniform_window() is None  # выходные по умолчанию
+    assert WorkCalendar.from_work_day(WORK_DAY).uniform_window() == (540, 1080)
+
+
+def test_next_working_day_matches_walk():
+    rnd = random.Random(24)
+    for _ in range(100):
+        calendar = random_calendar(rnd)
+        for _ in range(30):
+            day = FRIDAY + timedelta(days=rnd.randint(-15, 70))
+            duration = rnd.randint(0, 540)
+
+            expected = None
+            for offset in range(400):
+                candidate = day + timedelta(days=offset)
+                if max((end - start for start, end in calendar.windows(candidate)), default=0) >= duration:
+                    expected = candidate
+                    break
+
+            assert calendar.next_working_day(day, duration) == expected
+
+
+def test_overflow_skips_weekend():
+    calendar = WorkCalendar(WORK_DAY)
+    events = [Event("A", FRIDAY, None, 540, 2), Event("B", FRIDAY, None, 60, 1)]
+
+    schedule = autoschedule(events, calendar)
+
+    assert [(e.title, e.date) for e in schedule] == [("A", FRIDAY), ("B", MONDAY)]
+    assert handle_overflow(events[1], calendar).date == MONDAY
+    assert handle_overflow(events[1]).date == FRIDAY + timedelta(days=1)
+
+
+def test_lunch_break_is_not_scheduled():
+    calendar = WorkCalendar(LUNCH)
+    schedule = autoschedule([Event(f"e{i}", MONDAY, None, 150, 1) for i in range(3)], calendar)
+
+    assert [(e.date, to_minutes(e.time)) for e in schedule] == [
+        (MONDAY, 540), (MONDAY, 840), (MONDAY + timedelta(days=1), 540),
+    ]
+
+
+def test_matches_day_by_day_walk():
+    rnd = random.Random(7)
+    for _ in range(100):
+        calendar = random_calendar(rnd)
+        if calendar.longest_regular_window() < 240:
+            continue
+        events = random_events(rnd, rnd.randint(1, 40))
+
+        expected = walk_day_by_day(events, calendar)
+        assert autoschedule(events, calendar) == expected
+        assert autoschedule(events, calendar, executor="thread") == expected
+
+        state = ScheduleState(calendar)
+        for event in events:
+            state.add(event)
+        assert state.schedule() == expected
+
+
+def test_numpy_engine_with_calendar():
+    pytest.importorskip("numpy")
+    rnd = random.Random(11)
+    for _ in range(50):
+        calendar = random_calendar(rnd)
+        if calendar.longest_regular_window() < 240:
+            continue
+        events = random_events(rnd, 60)
+        assert autoschedule(events, calendar, engine="numpy") == autoschedule(events, calendar)
+
+
+def test_work_day_is_a_calendar_without_weekends():
+    rnd = random.Random(3)
+    events = random_events(rnd, 200)
+    assert autoschedule(events, WorkCalendar.from_work_day(WORK_DAY)) == autoschedule(events, WORK_DAY)
+
+
+def test_event_longer_than_any_regular_window():
+    calendar = WorkCalendar(LUNCH, dates={MONDAY: WORK_DAY})
+    with pytest.raises(ValueError):
+        autoschedule([Event("A", MONDAY, None, 300, 1)], calendar)
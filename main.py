@@ -1,25 +1,76 @@
+import argparse
+import sys
 from datetime import datetime, time
 from zoneinfo import ZoneInfo
 
 from autocalendar.app.service import build_schedule
+from autocalendar.config import PARSE_MAX_SCAN_CHARS
 from autocalendar.inbox import Inbox
+from autocalendar.parsing import DiskParseCache, ParseProfiler
+from autocalendar.parsing.disk_cache import default_cache_path
 from autocalendar.scheduling import WorkDay
 
 
-def main():
+def read_inputs():
+    """
+    Строки пользователя до "q" или конца ввода — лениво, по одной.
+    """
+    while True:
+        try:
+            user_input = input()
+        except EOFError:
+            return
+        if user_input == "q":
+            return
+        yield user_input
+
+
+def non_negative_int(value):
+    """
+    Тип аргумента --max-scan: целое >= 0, иначе понятная ошибка argparse.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"ожидалось целое число, получено {value!r}")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"должно быть >= 0, получено {number}")
+    return number
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Autocalendar")
+    ap.add_argument(
+        "--profile",
+        action="store_true",
+        help="после расписания вывести в stderr время парсера по стадиям",
+    )
+    ap.add_argument(
+        "--cache",
+        nargs="?",
+        const=str(default_cache_path()),
+        metavar="PATH",
+        help="дисковый кэш разбора между запусками (по умолчанию %(const)s)",
+    )
+    ap.add_argument(
+        "--max-scan",
+        type=non_negative_int,
+        default=PARSE_MAX_SCAN_CHARS,
+        metavar="CHARS",
+        help="искать дату, время, длительность и деньги только в первых CHARS "
+             "символах строки (по умолчанию %(default)s, 0 — во всей строке)",
+    )
+    args = ap.parse_args(argv)
+
     tz = ZoneInfo("Europe/Moscow")
     inbox = Inbox()
+    profiler = ParseProfiler() if args.profile else None
+    cache = DiskParseCache(args.cache) if args.cache else None
 
     print("=" * 5 ,"Autocalendar v1.1", "=" * 5)
     print('Введите названия событий, когда закончите введите "q"')
 
-    raw_inputs = []
-    while True:
-        user_input = input()
-        if user_input == "q":
-            break
-        raw_inputs.append(user_input)
-
+    # now фиксируем до ввода: строки разбираются сразу по мере поступления
     now = datetime.now(tz)
 
     work_day = WorkDay(
@@ -27,13 +78,20 @@ def main():
         end=time(18, 0),
     )
 
-    scheduled = build_schedule(
-        raw_inputs,
-        now=now,
-        tz=tz,
-        inbox=inbox,
-        work_day=work_day,
-    )
+    try:
+        scheduled = build_schedule(
+            read_inputs(),
+            now=now,
+            tz=tz,
+            inbox=inbox,
+            work_day=work_day,
+            cache=cache,
+            profiler=profiler,
+            max_scan=args.max_scan or None,
+        )
+    finally:
+        if cache is not None:
+            cache.close()
 
     def sort_key(event):
         return (
@@ -51,6 +109,10 @@ def main():
         for item in sorted(inbox.list(), key=lambda x: x.created_at):
             print(f"- {item.title}")
 
+    if profiler is not None:
+        print("\n⏱ Parser profile:", file=sys.stderr)
+        print(profiler.stats().report(), file=sys.stderr)
+
 
 if __name__ == "__main__":
     main()